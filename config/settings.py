@@ -3,20 +3,39 @@
 환경변수를 로드하고 관리합니다.
 """
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Optional, Dict, List
 
 
 class Settings(BaseSettings):
     """애플리케이션 설정"""
 
+    # 저장소 ('auto'면 Supabase URL/키가 있을 때 Supabase, 없으면 로컬 SQLite)
+    storage_backend: str = "auto"
+    sqlite_path: str = "data/daily_news.db"
+
     # Supabase
-    supabase_url: str
-    supabase_key: str
+    supabase_url: Optional[str] = None
+    supabase_key: Optional[str] = None
 
     # AI/LLM
     openai_api_key: Optional[str] = None
     anthropic_api_key: Optional[str] = None
     google_api_key: Optional[str] = None
+    # LLM 동시 호출 수 / 제공자별 한도 재정의
+    # (예: {"anthropic": {"requests_per_minute": 1000, "tokens_per_minute": 400000}})
+    llm_concurrency: int = 5
+    llm_rate_limits: Dict[str, Dict[str, float]] = {}
+    # 뉴스 요약 시 한 요청에 묶을 기사 수 (1이면 기사마다 개별 요청)
+    news_summary_batch_size: int = 10
+    # LLM 응답 캐시 (같은 요청은 API 재호출 없이 재사용)
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = ".cache/llm_responses.db"
+    llm_cache_ttl_seconds: float = 7 * 24 * 3600
+    llm_cache_max_bytes: int = 20 * 1024 * 1024
+    # 제공자 프롬프트 캐시 (Anthropic cache_control, OpenAI prompt_cache_key, Gemini cached_content)
+    llm_prompt_caching: bool = True
+    # 스트리밍 트렌드 분석 응답 토큰 상한 (넘으면 생성 중단)
+    llm_stream_token_budget: int = 1500
 
     # 알림 채널
     slack_webhook_url: Optional[str] = None
@@ -27,6 +46,62 @@ class Settings(BaseSettings):
     email_from: Optional[str] = None
     email_to: Optional[str] = None
 
+    # HTTP 클라이언트
+    http_timeout: int = 30
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http2_enabled: bool = False
+    http_cache_enabled: bool = True
+    http_cache_dir: str = ".cache/http"
+    http_cache_max_bytes: int = 50 * 1024 * 1024
+    # 호스트별 동시 요청 수 / 초당 요청 수(0이면 무제한) / 버스트 크기
+    http_host_concurrency: int = 10
+    http_host_rate_per_second: float = 0.0
+    http_host_burst: int = 10
+    # 호스트별 재정의 (예: {"hacker-news.firebaseio.com": {"concurrency": 20, "rate_per_second": 50}})
+    http_host_limits: Dict[str, Dict[str, float]] = {
+        "hacker-news.firebaseio.com": {"concurrency": 20, "rate_per_second": 50, "burst": 20},
+    }
+
+    # HTTP 재시도 (지수 백오프 + full jitter, 요청별 데드라인)
+    http_retry_max_attempts: int = 3
+    http_retry_base_delay: float = 0.5
+    http_retry_max_delay: float = 30.0
+    http_retry_deadline: float = 60.0
+
+    # Hacker News 증분 수집 (updates.json 기반, 잦은 실행 주기용)
+    hn_incremental: bool = False
+    hn_store_path: str = ".cache/hn_items.db"
+
+    # 뉴스 소스 (src/scrapers/registry.py에 등록된 이름) / 소스별 제한 시간(초)
+    news_sources: List[str] = ["hacker_news", "geeknews", "yozm_it"]
+    news_source_timeout: float = 60.0
+
+    # 유사 중복 기사 제거 (MinHash LSH, 여러 날에 걸쳐 인덱스 유지)
+    dedup_enabled: bool = True
+    dedup_index_path: str = ".cache/dedup_index.db"
+    dedup_threshold: float = 0.8
+    dedup_cross_host_threshold: float = 0.9  # 다른 호스트(소스 간) 중복은 더 엄격하게
+    dedup_retention_days: int = 7
+
+    # 기사 랭킹 (소스별 후보 수, 다이제스트에 넣을(요약/저장/출력) 상위 기사 수, 시간 감쇠 반감기)
+    # 소스별 보정: {"Hacker News": {"reference_score": 200, "weight": 1.0}, ...}
+    news_candidates_per_source: int = 30
+    news_top_k: int = 10
+    rank_half_life_hours: float = 24.0
+    rank_source_calibration: Dict[str, Dict[str, float]] = {}
+
+    # 수집 이력 (이전 날짜에 수집한 기사 제외, 블룸 필터 + SQLite)
+    seen_index_enabled: bool = True
+    seen_index_path: str = ".cache/seen_articles.db"
+    seen_index_capacity: int = 100_000
+    seen_index_retention_days: int = 30
+
+    # 컬럼형 스냅샷 (Parquet, 날짜/소스/언어 파티션, pyarrow 필요)
+    snapshot_export_enabled: bool = False
+    snapshot_dir: str = "data/snapshots"
+
     # 일반 설정
     environment: str = "development"
     log_level: str = "INFO"
@@ -9,14 +9,22 @@ from typing import Optional
 
 from src.scrapers.github_trending import GitHubTrendingScraper
 from src.scrapers.news_aggregator import NewsAggregator
-from src.scrapers.models import DailyDigest
+from src.scrapers.hn_store import HNStoryStore
+from src.scrapers.dedup import ArticleDeduplicator, NearDuplicateIndex
+from src.scrapers.seen_index import SeenArticleIndex
+from src.scrapers.ranking import ArticleRanker
+from src.scrapers.models import DailyDigest, to_articles, to_repositories
 from src.analyzers.tech_analyzer import TechAnalyzer
-from src.database.supabase_client import SupabaseClient
+from src.analyzers.llm_cache import LLMResponseCache
+from src.database.storage import create_storage
+from src.database.snapshot_exporter import SnapshotExporter
 from src.formatters.console_formatter import ConsoleFormatter
 from src.formatters.markdown_formatter import MarkdownFormatter
 from src.notifiers.slack_notifier import SlackNotifier
 from src.notifiers.discord_notifier import DiscordNotifier
 from src.notifiers.email_notifier import EmailNotifier
+from src.utils.http_client import HTTPClient
+from src.utils.serialization import to_rows
 from config.settings import settings
 
 # 로깅 설정
@@ -31,17 +39,48 @@ class DailyDigestPipeline:
     """일일 다이제스트 파이프라인"""
 
     def __init__(self):
-        self.github_scraper = GitHubTrendingScraper()
-        self.news_aggregator = NewsAggregator()
+        # 모든 스크래퍼가 공유하는 HTTP 연결 풀
+        self.http_client = HTTPClient.from_settings()
+        self.github_scraper = GitHubTrendingScraper(self.http_client)
+        hn_store = HNStoryStore(settings.hn_store_path) if settings.hn_incremental else None
+        deduplicator = None
+        if settings.dedup_enabled:
+            deduplicator = ArticleDeduplicator(
+                NearDuplicateIndex(
+                    settings.dedup_index_path,
+                    threshold=settings.dedup_threshold,
+                    cross_host_threshold=settings.dedup_cross_host_threshold,
+                    retention_days=settings.dedup_retention_days,
+                )
+            )
+        seen_index = None
+        if settings.seen_index_enabled:
+            seen_index = SeenArticleIndex(
+                settings.seen_index_path,
+                capacity=settings.seen_index_capacity,
+                retention_days=settings.seen_index_retention_days,
+            )
+        self.news_aggregator = NewsAggregator(
+            self.http_client,
+            hn_store=hn_store,
+            sources=settings.news_sources,
+            source_timeout=settings.news_source_timeout,
+            deduplicator=deduplicator,
+            seen_index=seen_index,
+        )
+        self.ranker = ArticleRanker.from_settings()
         # AI 분석기는 API 키가 있을 때만 초기화
         self.tech_analyzer = None
         if settings.openai_api_key or settings.anthropic_api_key or settings.google_api_key:
             try:
                 provider = "google" if settings.google_api_key else ("openai" if settings.openai_api_key else "anthropic")
-                self.tech_analyzer = TechAnalyzer(provider=provider)
+                response_cache = (
+                    LLMResponseCache.from_settings() if settings.llm_cache_enabled else None
+                )
+                self.tech_analyzer = TechAnalyzer(provider=provider, response_cache=response_cache)
             except Exception as e:
                 logger.warning(f"AI 분석기 초기화 실패: {e}. AI 분석 없이 계속합니다.")
-        self.db = SupabaseClient()
+        self.db = create_storage()
 
     async def run(self) -> Optional[DailyDigest]:
         """전체 파이프라인 실행"""
@@ -50,12 +89,17 @@ class DailyDigestPipeline:
 
             # 1. 데이터 수집
             logger.info("1️⃣ 데이터 수집 시작...")
-            trending_repos = await asyncio.to_thread(
-                self.github_scraper.scrape, limit=25
-            )
-            news_articles = await self.news_aggregator.collect_all(
-                hn_limit=10, gn_limit=10, yozm_limit=10
-            )
+            async with self.http_client:
+                trending_repos, news_articles = await asyncio.gather(
+                    self.github_scraper.scrape(limit=25),
+                    self.news_aggregator.collect_all(
+                        hn_limit=settings.news_candidates_per_source,
+                        gn_limit=settings.news_candidates_per_source,
+                        yozm_limit=settings.news_candidates_per_source,
+                    ),
+                )
+            logger.debug(f"호스트별 연결 통계: {self.http_client.get_connection_stats()}")
+            logger.debug(f"호스트별 대기열 통계: {self.http_client.get_queue_stats()}")
 
             logger.info(
                 f"✅ 수집 완료: 저장소 {len(trending_repos)}개, 뉴스 {len(news_articles)}개"
@@ -65,32 +109,39 @@ class DailyDigestPipeline:
                 logger.warning("수집된 데이터가 없습니다.")
                 return None
 
+            # 소스 통합 랭킹: 넓은 후보 중 상위 news_top_k개만 요약/저장/출력
+            top_k = settings.news_top_k
+            news_articles = self.ranker.rank(news_articles, top_k=top_k)
+
             # 2. AI 분석 (상위 5개만)
             logger.info("2️⃣ AI 분석 시작...")
+            analyses_by_repo = {}
             if self.tech_analyzer:
                 try:
-                    # 트렌드 분석
-                    trend_analysis = self.tech_analyzer.analyze_daily_trends(
-                        trending_repos[:10], news_articles[:10]
-                    )
-
-                    # 상위 5개 저장소 상세 분석
-                    for repo in trending_repos[:5]:
-                        try:
-                            analysis = self.tech_analyzer.analyze_repository(repo)
-                            repo.ai_summary = analysis.get("ai_summary")
-                            repo.ai_use_cases = analysis.get("ai_use_cases")
-                            repo.ai_difficulty = analysis.get("ai_difficulty")
-                            repo.ai_related_tech = analysis.get("ai_related_tech")
-                        except Exception as e:
-                            logger.warning(f"저장소 분석 실패: {repo.name} - {e}")
-
-                    # 뉴스 기사 요약 (상위 10개)
-                    news_articles = self.tech_analyzer.summarize_articles(
-                        news_articles, max_articles=10
+                    # 트렌드 분석, 상위 5개 저장소 상세 분석, 뉴스 요약(랭킹 상위 top_k개)을
+                    # 동시에 실행 (LLM 제공자별 동시성/속도 한도는 LLMClient가 관리)
+                    repos_to_analyze = trending_repos[:5]
+                    trend_analysis, analyses, news_articles = await asyncio.gather(
+                        self.tech_analyzer.analyze_daily_trends_stream(
+                            trending_repos[:10],
+                            news_articles,
+                            on_field=lambda name, _: logger.info(f"  📝 트렌드 분석 {name} 수신"),
+                            token_budget=settings.llm_stream_token_budget,
+                        ),
+                        self.tech_analyzer.analyze_repositories(repos_to_analyze),
+                        self.tech_analyzer.summarize_articles_async(
+                            news_articles,
+                            max_articles=top_k,
+                            batch_size=settings.news_summary_batch_size,
+                        ),
                     )
+                    # 레코드에는 AI 필드가 없으므로 검증 후 모델에 반영
+                    analyses_by_repo = {
+                        repo.name: analysis for repo, analysis in zip(repos_to_analyze, analyses)
+                    }
 
                     logger.info("✅ AI 분석 완료")
+                    logger.debug(f"LLM 사용량: {self.tech_analyzer.llm.get_usage_summary()}")
                 except Exception as e:
                     logger.warning(f"AI 분석 실패: {e}. 분석 없이 계속합니다.")
                     trend_analysis = {}
@@ -100,6 +151,16 @@ class DailyDigestPipeline:
 
             # 3. 다이제스트 생성
             logger.info("3️⃣ 다이제스트 생성...")
+            # 저장/출력 직전에 행 단위로 검증 (잘못된 행만 제외하고 소스 전체는 유지)
+            trending_repos = to_repositories(trending_repos)
+            news_articles = to_articles(news_articles)
+            for repo in trending_repos:
+                analysis = analyses_by_repo.get(repo.name)
+                if analysis:
+                    repo.ai_summary = analysis.get("ai_summary")
+                    repo.ai_use_cases = analysis.get("ai_use_cases")
+                    repo.ai_difficulty = analysis.get("ai_difficulty")
+                    repo.ai_related_tech = analysis.get("ai_related_tech")
             digest = DailyDigest(
                 date=datetime.now(),
                 trending_repos=trending_repos,
@@ -114,25 +175,19 @@ class DailyDigestPipeline:
             # 4. 데이터베이스 저장
             logger.info("4️⃣ 데이터베이스 저장...")
             try:
-                # 저장소 저장 (datetime을 ISO 문자열로 변환)
-                repos_data = []
-                for repo in trending_repos:
-                    repo_dict = repo.model_dump()
-                    if repo_dict.get('collected_at'):
-                        repo_dict['collected_at'] = repo_dict['collected_at'].isoformat()
-                    repos_data.append(repo_dict)
-                self.db.insert_trending_repos(repos_data)
-
-                # 뉴스 저장 (datetime을 ISO 문자열로 변환)
-                articles_data = []
-                for article in news_articles:
-                    article_dict = article.model_dump()
-                    if article_dict.get('published_at'):
-                        article_dict['published_at'] = article_dict['published_at'].isoformat()
-                    if article_dict.get('collected_at'):
-                        article_dict['collected_at'] = article_dict['collected_at'].isoformat()
-                    articles_data.append(article_dict)
-                self.db.insert_news_articles(articles_data)
+                # 저장소/뉴스 저장 (자연 키 기준 upsert, 같은 날 재실행해도 행이 늘지 않음)
+                repo_counts = self.db.upsert_trending_repos(to_rows(trending_repos))
+                article_counts = self.db.upsert_news_articles(to_rows(news_articles))
+                logger.debug(f"저장 결과: 저장소 {repo_counts}, 뉴스 {article_counts}")
+                # 다이제스트에 들어간 기사만 수집 이력에 기록 (다음 날부터 제외).
+                # upsert는 예외 대신 실패 수를 반환하고 어떤 행이 실패했는지는
+                # 알 수 없으므로, 하나라도 실패하면 기록하지 않고 다음 실행에 다시 수집
+                if article_counts["failed"]:
+                    logger.warning(
+                        f"뉴스 {article_counts['failed']}개 저장 실패 - 수집 이력 기록 건너뜀"
+                    )
+                else:
+                    self.news_aggregator.mark_seen(news_articles[: settings.news_top_k])
 
                 # 다이제스트 저장 (date를 ISO 문자열로 변환)
                 digest_data = {
@@ -148,6 +203,13 @@ class DailyDigestPipeline:
             except Exception as e:
                 logger.error(f"데이터베이스 저장 실패: {e}")
 
+            # 오프라인 분석용 컬럼형 스냅샷
+            if settings.snapshot_export_enabled:
+                try:
+                    SnapshotExporter.from_settings().export(digest)
+                except Exception as e:
+                    logger.error(f"스냅샷 저장 실패: {e}")
+
             # 5. 콘솔 출력
             logger.info("5️⃣ 콘솔 출력...")
             ConsoleFormatter.print_daily_digest(digest)
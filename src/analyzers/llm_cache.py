@@ -0,0 +1,164 @@
+"""
+LLM 응답 캐시
+(제공자, 모델, 시스템 프롬프트, 프롬프트, 생성 파라미터)의 해시를 키로
+응답 텍스트를 SQLite에 저장합니다. 같은 저장소 설명이나 다음 날 다시 보인
+기사 제목처럼 동일한 요청은 API를 다시 호출하지 않습니다.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    SQLite 기반 LLM 응답 캐시
+
+    ttl_seconds가 지난 항목은 조회 시 무시하고 삭제하며, 저장된 응답의
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다(LRU).
+
+    Args:
+        path: SQLite 파일 경로 (':memory:'면 메모리 전용)
+        ttl_seconds: 항목 유효 시간 (초)
+        max_bytes: 응답 텍스트 전체 최대 크기 (바이트)
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/llm_responses.db",
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_bytes: int = 20 * 1024 * 1024,
+    ):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # 비동기 생성과 스레드에서 실행되는 동기 생성이 함께 사용
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed
+                ON llm_responses (accessed_at);
+            """
+        )
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @classmethod
+    def from_settings(cls) -> "LLMResponseCache":
+        """환경 설정 값으로 캐시 생성"""
+        from config.settings import settings
+
+        return cls(
+            path=settings.llm_cache_path,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_bytes=settings.llm_cache_max_bytes,
+        )
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        params: Dict[str, Any],
+    ) -> str:
+        """요청 내용 기반 캐시 키 (파라미터 순서와 무관)"""
+        raw = json.dumps(
+            [provider, model, system_prompt or "", prompt, params],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 조회 (조회 시 LRU 순서 갱신, 만료 항목은 삭제)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] >= self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.stats["misses"] += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+        self.stats["hits"] += 1
+        return row[0]
+
+    def set(self, key: str, provider: str, model: str, response: str) -> None:
+        """응답 저장 (빈 응답은 저장하지 않음)"""
+        if not response:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_responses
+                        (key, provider, model, response, size, created_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, provider, model, response, len(response.encode("utf-8")), now, now),
+                )
+                self._evict()
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 응답 캐시 저장 실패: {e}")
+            return
+        self.stats["stores"] += 1
+
+    def _evict(self) -> None:
+        """만료 항목 삭제 후 크기 제한을 넘으면 LRU 순으로 제거 (락 안에서 호출)"""
+        self._conn.execute(
+            "DELETE FROM llm_responses WHERE created_at <= ?",
+            (time.time() - self.ttl_seconds,),
+        )
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM llm_responses ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+            total -= size
+            self.stats["evictions"] += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
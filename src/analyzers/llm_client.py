@@ -2,14 +2,33 @@
 LLM 클라이언트
 다양한 LLM API를 통합하여 관리합니다.
 """
-from typing import Optional, Dict, Any
+import asyncio
+import hashlib
+import time
+from contextlib import aclosing
+from typing import Optional, Dict, Any, AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 from config.settings import settings
+from .llm_cache import LLMResponseCache
+from .llm_limiter import ProviderLimiter, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# 제공자별 기본 모델
+DEFAULT_MODELS = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-haiku-20240307",
+    "google": "gemini-2.5-flash",
+}
+
+# 제공자 프롬프트 캐시가 적용되는 최소 접두사 길이 (토큰)
+# 이보다 짧은 시스템 프롬프트에는 캐시 표시를 보내도 효과가 없음
+MIN_CACHEABLE_TOKENS = {"openai": 1024, "anthropic": 1024}
+# Claude Haiku 모델은 최소 길이가 더 김
+MIN_CACHEABLE_TOKENS_HAIKU = 2048
+
 
 @dataclass
 class TokenUsage:
@@ -21,6 +40,26 @@ class TokenUsage:
     timestamp: datetime = field(default_factory=datetime.now)
     model: str = ""
     provider: str = ""
+    latency_seconds: float = 0.0
+    # 제공자 프롬프트 캐시 (prompt_tokens에 포함된 수)
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
+    cache_savings: float = 0.0
+
+
+@dataclass
+class BatchStats:
+    """배치 요청 절감 효과 (개별 요청 대비 추정치)"""
+    batches: int = 0
+    items: int = 0
+    fallback_items: int = 0
+    prompt_tokens_saved: int = 0
+    latency_seconds: float = 0.0
+
+    @property
+    def requests_saved(self) -> int:
+        # 배치 하나당 1회 + 실패 항목 개별 재요청을 빼고 절약한 요청 수
+        return self.items - self.batches - self.fallback_items
 
 
 class TokenMonitor:
@@ -34,27 +73,56 @@ class TokenMonitor:
         "claude-3-sonnet-20240229": {"input": 0.003, "output": 0.015},
         "gemini-2.5-flash": {"input": 0.0, "output": 0.0},  # 무료 티어
     }
+
+    # 제공자별 프롬프트 캐시 가격 (입력 가격 대비 배수)
+    CACHE_PRICING = {
+        "openai": {"read": 0.5, "write": 1.0},
+        "anthropic": {"read": 0.1, "write": 1.25},
+        "google": {"read": 0.25, "write": 1.0},
+    }
     
     def __init__(self):
         self.usage_history: list[TokenUsage] = []
         self.total_prompt_tokens = 0
         self.total_completion_tokens = 0
         self.total_cost = 0.0
+        self.total_latency_seconds = 0.0
+        self.total_cached_tokens = 0
+        self.total_cache_savings = 0.0
+        self.batch_stats = BatchStats()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def record_usage(
         self,
         prompt_tokens: int,
         completion_tokens: int,
         model: str,
-        provider: str
+        provider: str,
+        latency_seconds: float = 0.0,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> TokenUsage:
-        """토큰 사용량 기록"""
+        """
+        토큰 사용량 기록
+
+        cached_tokens(캐시에서 읽은 입력)와 cache_write_tokens(캐시에 새로 쓴 입력)는
+        prompt_tokens에 포함된 수이며, 제공자별 캐시 가격으로 비용을 계산합니다.
+        """
         total = prompt_tokens + completion_tokens
         
         # 비용 계산
         pricing = self.PRICING.get(model, {"input": 0, "output": 0})
-        cost = (prompt_tokens / 1000 * pricing["input"]) + \
-               (completion_tokens / 1000 * pricing["output"])
+        cache_pricing = self.CACHE_PRICING.get(provider, {"read": 1.0, "write": 1.0})
+        uncached_tokens = prompt_tokens - cached_tokens - cache_write_tokens
+        input_cost = (
+            uncached_tokens
+            + cached_tokens * cache_pricing["read"]
+            + cache_write_tokens * cache_pricing["write"]
+        ) / 1000 * pricing["input"]
+        cost = input_cost + (completion_tokens / 1000 * pricing["output"])
+        # 캐시가 없었을 때의 입력 비용 대비 절감액 (캐시 쓰기 할증은 음수로 반영)
+        cache_savings = prompt_tokens / 1000 * pricing["input"] - input_cost
         
         usage = TokenUsage(
             prompt_tokens=prompt_tokens,
@@ -62,13 +130,20 @@ class TokenMonitor:
             total_tokens=total,
             estimated_cost=cost,
             model=model,
-            provider=provider
+            provider=provider,
+            latency_seconds=latency_seconds,
+            cached_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens,
+            cache_savings=cache_savings,
         )
         
         self.usage_history.append(usage)
         self.total_prompt_tokens += prompt_tokens
         self.total_completion_tokens += completion_tokens
         self.total_cost += cost
+        self.total_latency_seconds += latency_seconds
+        self.total_cached_tokens += cached_tokens
+        self.total_cache_savings += cache_savings
         
         logger.info(
             f"📊 토큰 사용: {prompt_tokens}+{completion_tokens}={total} "
@@ -77,16 +152,71 @@ class TokenMonitor:
         )
         
         return usage
-    
+
+    def record_batch(
+        self,
+        items: int,
+        fallback_items: int,
+        prompt_tokens_saved: int,
+        latency_seconds: float,
+    ) -> None:
+        """
+        배치 요청 결과 기록
+
+        Args:
+            items: 배치에 포함된 항목 수
+            fallback_items: 파싱 실패로 개별 요청한 항목 수
+            prompt_tokens_saved: 개별 요청 대비 절약한 프롬프트 토큰 수 (추정)
+            latency_seconds: 배치 요청 소요 시간
+        """
+        stats = self.batch_stats
+        stats.batches += 1
+        stats.items += items
+        stats.fallback_items += fallback_items
+        stats.prompt_tokens_saved += prompt_tokens_saved
+        stats.latency_seconds += latency_seconds
+
+    def record_cache_lookup(self, hit: bool) -> None:
+        """응답 캐시 조회 결과 기록"""
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
     def get_summary(self) -> Dict[str, Any]:
         """사용량 요약"""
-        return {
-            "total_requests": len(self.usage_history),
+        requests = len(self.usage_history)
+        avg_latency = self.total_latency_seconds / requests if requests else 0.0
+        summary = {
+            "total_requests": requests,
             "total_prompt_tokens": self.total_prompt_tokens,
             "total_completion_tokens": self.total_completion_tokens,
             "total_tokens": self.total_prompt_tokens + self.total_completion_tokens,
             "total_cost_usd": round(self.total_cost, 6),
+            "avg_latency_seconds": round(avg_latency, 3),
+            "total_cached_tokens": self.total_cached_tokens,
+            "cache_savings_usd": round(self.total_cache_savings, 6),
         }
+        lookups = self.cache_hits + self.cache_misses
+        if lookups:
+            summary["cache"] = {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "hit_rate": round(self.cache_hits / lookups, 3),
+            }
+        stats = self.batch_stats
+        if stats.batches:
+            summary["batching"] = {
+                "batches": stats.batches,
+                "items": stats.items,
+                "fallback_items": stats.fallback_items,
+                "requests_saved": stats.requests_saved,
+                "prompt_tokens_saved": stats.prompt_tokens_saved,
+                "avg_batch_latency_seconds": round(stats.latency_seconds / stats.batches, 3),
+                # 절약한 요청마다 평균 요청 지연 한 번씩을 아꼈다고 보는 추정치
+                "latency_saved_seconds": round(max(stats.requests_saved, 0) * avg_latency, 3),
+            }
+        return summary
 
 
 class LLMClient:
@@ -94,16 +224,32 @@ class LLMClient:
     
     # 전역 토큰 모니터
     token_monitor = TokenMonitor()
+    # 전역 제공자별 동시성/속도 제한기 (첫 비동기 호출 시 설정값으로 생성)
+    limiter: Optional[ProviderLimiter] = None
 
-    def __init__(self, provider: str = "openai"):
+    def __init__(
+        self,
+        provider: str = "openai",
+        response_cache: Optional[LLMResponseCache] = None,
+        prompt_caching: Optional[bool] = None,
+    ):
         """
         LLM 클라이언트 초기화
 
         Args:
             provider: 'openai', 'anthropic', 'google' 중 선택
+            response_cache: 동일 요청 응답 재사용 캐시 (None이면 사용 안 함)
+            prompt_caching: 제공자 프롬프트 캐시 사용 여부 (기본: 설정값)
         """
         self.provider = provider
+        self.response_cache = response_cache
+        self.prompt_caching = (
+            settings.llm_prompt_caching if prompt_caching is None else prompt_caching
+        )
         self._client = None
+        # 비동기 SDK 클라이언트는 이벤트 루프에 묶이므로 루프별로 생성
+        self._async_client = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
         self._initialize_client()
 
     def _initialize_client(self):
@@ -164,22 +310,73 @@ class LLMClient:
     def generate(
         self, prompt: str, system_prompt: Optional[str] = None, **kwargs
     ) -> str:
-        """텍스트 생성"""
+        """텍스트 생성 (응답 캐시에 같은 요청이 있으면 API를 호출하지 않음)"""
+        key = self._cache_key(prompt, system_prompt, kwargs)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
         try:
             if self.provider == "openai":
-                return self._generate_openai(prompt, system_prompt, **kwargs)
+                text = self._generate_openai(prompt, system_prompt, **kwargs)
             elif self.provider == "anthropic":
-                return self._generate_anthropic(prompt, system_prompt, **kwargs)
+                text = self._generate_anthropic(prompt, system_prompt, **kwargs)
             elif self.provider == "google":
-                return self._generate_google(prompt, system_prompt, **kwargs)
+                text = self._generate_google(prompt, system_prompt, **kwargs)
         except Exception as e:
             logger.error(f"텍스트 생성 실패: {e}")
             raise
 
+        self._store_cached(key, kwargs, text)
+        return text
+
+    # ==================== 응답 캐시 ====================
+
+    def _cache_key(
+        self, prompt: str, system_prompt: Optional[str], kwargs: Dict[str, Any]
+    ) -> Optional[str]:
+        """기본값을 채운 생성 파라미터까지 포함한 캐시 키"""
+        if self.response_cache is None:
+            return None
+        params = {"temperature": 0.7, "max_tokens": 1000, **kwargs}
+        model = params.pop("model", DEFAULT_MODELS[self.provider])
+        return self.response_cache.make_key(self.provider, model, system_prompt, prompt, params)
+
+    def _get_cached(self, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            return None
+        try:
+            response = self.response_cache.get(key)
+        except Exception as e:
+            logger.warning(f"LLM 응답 캐시 조회 실패: {e}")
+            response = None
+        self.token_monitor.record_cache_lookup(hit=response is not None)
+        return response
+
+    def _store_cached(self, key: Optional[str], kwargs: Dict[str, Any], response: str) -> None:
+        if key is not None:
+            model = kwargs.get("model", DEFAULT_MODELS[self.provider])
+            self.response_cache.set(key, self.provider, model, response)
+
     def _generate_openai(
         self, prompt: str, system_prompt: Optional[str] = None, **kwargs
     ) -> str:
         """OpenAI로 텍스트 생성"""
+        request = self._openai_request(prompt, system_prompt, kwargs)
+        started = time.monotonic()
+        response = self._client.chat.completions.create(**request)
+        return self._openai_result(response, request["model"], time.monotonic() - started)
+
+    def _openai_request(
+        self, prompt: str, system_prompt: Optional[str], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        chat.completions.create 인자
+
+        OpenAI는 1024토큰 이상의 같은 접두사를 자동으로 캐시하므로 시스템 프롬프트를
+        맨 앞에 두고, 같은 시스템 프롬프트끼리 같은 서버로 가도록 prompt_cache_key를 붙입니다.
+        (최소 길이 미만이면 붙이지 않음)
+        """
         messages = []
 
         if system_prompt:
@@ -187,72 +384,377 @@ class LLMClient:
 
         messages.append({"role": "user", "content": prompt})
 
-        model = kwargs.get("model", "gpt-4o-mini")
-        response = self._client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=kwargs.get("temperature", 0.7),
-            max_tokens=kwargs.get("max_tokens", 1000),
-        )
+        request = {
+            "model": kwargs.get("model", DEFAULT_MODELS["openai"]),
+            "messages": messages,
+            "temperature": kwargs.get("temperature", 0.7),
+            "max_tokens": kwargs.get("max_tokens", 1000),
+        }
+        if self._cacheable(system_prompt, request["model"]):
+            request["prompt_cache_key"] = self._prompt_cache_key(system_prompt)
+        return request
 
-        # 토큰 사용량 기록
-        if response.usage:
-            self.token_monitor.record_usage(
-                prompt_tokens=response.usage.prompt_tokens,
-                completion_tokens=response.usage.completion_tokens,
-                model=model,
-                provider="openai"
+    def _cacheable(self, system_prompt: Optional[str], model: str) -> bool:
+        """시스템 프롬프트에 캐시 표시(prompt_cache_key/cache_control)를 붙일지 여부"""
+        if not (self.prompt_caching and system_prompt):
+            return False
+        minimum = MIN_CACHEABLE_TOKENS[self.provider]
+        if self.provider == "anthropic" and "haiku" in model:
+            minimum = MIN_CACHEABLE_TOKENS_HAIKU
+        tokens = estimate_tokens(system_prompt)
+        if tokens < minimum:
+            logger.debug(
+                f"시스템 프롬프트가 캐시 최소 길이보다 짧아 프롬프트 캐시 생략: "
+                f"약 {tokens} < {minimum} 토큰 ({model})"
             )
+            return False
+        return True
+
+    @staticmethod
+    def _prompt_cache_key(system_prompt: str) -> str:
+        digest = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+        return f"daily-news-{digest}"
+
+    def _openai_result(self, response, model: str, latency: float = 0.0) -> str:
+        """OpenAI 응답에서 토큰 사용량 기록 후 텍스트 반환"""
+        if response.usage:
+            self._record_openai_usage(response.usage, model, latency)
 
         return response.choices[0].message.content
 
+    def _record_openai_usage(self, usage, model: str, latency: float) -> None:
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.token_monitor.record_usage(
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            model=model,
+            provider="openai",
+            latency_seconds=latency,
+            cached_tokens=getattr(details, "cached_tokens", None) or 0,
+        )
+
     def _generate_anthropic(
         self, prompt: str, system_prompt: Optional[str] = None, **kwargs
     ) -> str:
         """Anthropic으로 텍스트 생성"""
-        model = kwargs.get("model", "claude-3-haiku-20240307")
-        response = self._client.messages.create(
-            model=model,
-            max_tokens=kwargs.get("max_tokens", 1000),
-            temperature=kwargs.get("temperature", 0.7),
-            system=system_prompt or "",
-            messages=[{"role": "user", "content": prompt}],
-        )
+        request = self._anthropic_request(prompt, system_prompt, kwargs)
+        started = time.monotonic()
+        response = self._client.messages.create(**request)
+        return self._anthropic_result(response, request["model"], time.monotonic() - started)
+
+    def _anthropic_request(
+        self, prompt: str, system_prompt: Optional[str], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        messages.create 인자
 
-        # 토큰 사용량 기록
+        시스템 프롬프트 블록에 cache_control을 붙여 같은 시스템 프롬프트를 재사용하는
+        요청은 캐시에서 읽도록 합니다. (모델별 최소 길이 미만이면 붙이지 않음)
+        """
+        model = kwargs.get("model", DEFAULT_MODELS["anthropic"])
+        system: Any = system_prompt or ""
+        if self._cacheable(system_prompt, model):
+            system = [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ]
+        return {
+            "model": model,
+            "max_tokens": kwargs.get("max_tokens", 1000),
+            "temperature": kwargs.get("temperature", 0.7),
+            "system": system,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def _anthropic_result(self, response, model: str, latency: float = 0.0) -> str:
+        """Anthropic 응답에서 토큰 사용량 기록 후 텍스트 반환"""
         if response.usage:
-            self.token_monitor.record_usage(
-                prompt_tokens=response.usage.input_tokens,
-                completion_tokens=response.usage.output_tokens,
-                model=model,
-                provider="anthropic"
-            )
+            self._record_anthropic_usage(response.usage, model, latency)
 
         return response.content[0].text
 
+    def _record_anthropic_usage(self, usage, model: str, latency: float) -> None:
+        # input_tokens에는 캐시에서 읽거나 캐시에 쓴 토큰이 포함되지 않음
+        cached = getattr(usage, "cache_read_input_tokens", None) or 0
+        written = getattr(usage, "cache_creation_input_tokens", None) or 0
+        self.token_monitor.record_usage(
+            prompt_tokens=usage.input_tokens + cached + written,
+            completion_tokens=usage.output_tokens,
+            model=model,
+            provider="anthropic",
+            latency_seconds=latency,
+            cached_tokens=cached,
+            cache_write_tokens=written,
+        )
+
     def _generate_google(
         self, prompt: str, system_prompt: Optional[str] = None, **kwargs
     ) -> str:
         """Google Gemini로 텍스트 생성"""
-        full_prompt = prompt
+        model, full_prompt = self._google_request(prompt, system_prompt, kwargs)
+        started = time.monotonic()
+        response = model.generate_content(full_prompt)
+        return self._google_result(response, full_prompt, time.monotonic() - started)
+
+    def _google_request(
+        self, prompt: str, system_prompt: Optional[str], kwargs: Dict[str, Any]
+    ):
+        """
+        (모델, 프롬프트)
+
+        kwargs["cached_content"]로 미리 만든 CachedContent(또는 이름)를 넘기면
+        캐시된 시스템 지시/문맥을 사용하는 모델로 요청합니다. 이때 시스템 프롬프트는
+        캐시에 들어 있으므로 다시 보내지 않습니다. 그 외에는 시스템 프롬프트를
+        앞에 붙여 Gemini 2.5의 암묵적 접두사 캐시가 적용되도록 합니다.
+        """
+        cached_content = kwargs.get("cached_content")
+        if self.prompt_caching and cached_content is not None:
+            import google.generativeai as genai
+
+            return genai.GenerativeModel.from_cached_content(cached_content), prompt
         if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
+            return self._client, f"{system_prompt}\n\n{prompt}"
+        return self._client, prompt
 
-        response = self._client.generate_content(full_prompt)
-        
-        # Gemini 토큰 사용량 기록 (추정치)
-        # Gemini는 무료 티어이므로 대략적인 토큰 수만 추정
-        prompt_tokens = len(full_prompt.split()) * 1.3  # 대략적 추정
-        completion_tokens = len(response.text.split()) * 1.3 if response.text else 0
+    def _google_result(self, response, full_prompt: str, latency: float = 0.0) -> str:
+        """Gemini 응답에서 토큰 사용량 기록 후 텍스트 반환"""
+        self._record_google_usage(
+            getattr(response, "usage_metadata", None), full_prompt, response.text, latency
+        )
+        return response.text
+
+    def _record_google_usage(self, usage, full_prompt: str, text: str, latency: float) -> None:
+        if usage and usage.prompt_token_count:
+            prompt_tokens = usage.prompt_token_count
+            completion_tokens = usage.candidates_token_count or 0
+            cached_tokens = usage.cached_content_token_count or 0
+        else:
+            # 사용량 메타데이터가 없으면 대략적인 토큰 수만 추정
+            prompt_tokens = len(full_prompt.split()) * 1.3
+            completion_tokens = len(text.split()) * 1.3 if text else 0
+            cached_tokens = 0
         self.token_monitor.record_usage(
             prompt_tokens=int(prompt_tokens),
             completion_tokens=int(completion_tokens),
-            model="gemini-2.5-flash",
-            provider="google"
+            model=DEFAULT_MODELS["google"],
+            provider="google",
+            latency_seconds=latency,
+            cached_tokens=int(cached_tokens),
         )
-        
-        return response.text
     
+    # ==================== 비동기 생성 ====================
+
+    @classmethod
+    def get_limiter(cls) -> ProviderLimiter:
+        """전역 제공자별 제한기 (없으면 설정값으로 생성)"""
+        if cls.limiter is None:
+            cls.limiter = ProviderLimiter.from_settings()
+        return cls.limiter
+
+    def _get_async_client(self):
+        """현재 이벤트 루프용 비동기 SDK 클라이언트"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_loop is loop:
+            return self._async_client
+
+        if self.provider == "openai":
+            from openai import AsyncOpenAI
+
+            self._async_client = AsyncOpenAI(api_key=settings.openai_api_key)
+        elif self.provider == "anthropic":
+            from anthropic import AsyncAnthropic
+
+            self._async_client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        else:
+            # GenerativeModel은 generate_content_async를 직접 제공
+            self._async_client = self._client
+        self._async_loop = loop
+        return self._async_client
+
+    async def agenerate(
+        self, prompt: str, system_prompt: Optional[str] = None, **kwargs
+    ) -> str:
+        """
+        비동기 텍스트 생성
+
+        제공자별 동시 호출 수와 분당 요청/토큰 한도 안에서 실행되므로
+        여러 호출을 asyncio.gather로 동시에 실행해도 됩니다.
+        응답 캐시에 같은 요청이 있으면 제한 대기 없이 바로 반환합니다.
+        """
+        key = self._cache_key(prompt, system_prompt, kwargs)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        text = await self._agenerate(prompt, system_prompt, **kwargs)
+        self._store_cached(key, kwargs, text)
+        return text
+
+    async def _agenerate(
+        self, prompt: str, system_prompt: Optional[str] = None, **kwargs
+    ) -> str:
+        tokens = estimate_tokens(prompt, system_prompt) + kwargs.get("max_tokens", 1000)
+        try:
+            async with self.get_limiter().limit(self.provider, tokens):
+                client = self._get_async_client()
+                started = time.monotonic()
+                if self.provider == "openai":
+                    request = self._openai_request(prompt, system_prompt, kwargs)
+                    response = await client.chat.completions.create(**request)
+                    return self._openai_result(
+                        response, request["model"], time.monotonic() - started
+                    )
+                elif self.provider == "anthropic":
+                    request = self._anthropic_request(prompt, system_prompt, kwargs)
+                    response = await client.messages.create(**request)
+                    return self._anthropic_result(
+                        response, request["model"], time.monotonic() - started
+                    )
+                elif self.provider == "google":
+                    model, full_prompt = self._google_request(prompt, system_prompt, kwargs)
+                    response = await model.generate_content_async(full_prompt)
+                    return self._google_result(
+                        response, full_prompt, time.monotonic() - started
+                    )
+        except Exception as e:
+            logger.error(f"텍스트 생성 실패: {e}")
+            raise
+
+    # ==================== 스트리밍 생성 ====================
+
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        token_budget: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        스트리밍 텍스트 생성 (응답을 도착하는 조각 단위로 반환)
+
+        응답 토큰 수(추정)가 token_budget을 넘으면 그 시점에서 생성을 중단합니다.
+        소비자가 반복을 멈추면(예: 필요한 필드를 모두 받음) 연결도 바로 닫힙니다.
+        응답 캐시에 같은 요청이 있으면 한 조각으로 반환하며, 끝까지 받은 응답만
+        캐시에 저장합니다.
+
+        Args:
+            prompt: 프롬프트
+            system_prompt: 시스템 프롬프트
+            token_budget: 응답 토큰 상한 (None이면 max_tokens까지)
+        """
+        key = self._cache_key(prompt, system_prompt, kwargs)
+        cached = self._get_cached(key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts = []
+        received = 0
+        completed = False
+        usage: Dict[str, Any] = {}
+        tokens = estimate_tokens(prompt, system_prompt) + kwargs.get("max_tokens", 1000)
+        try:
+            async with self.get_limiter().limit(self.provider, tokens):
+                started = time.monotonic()
+                try:
+                    async with aclosing(
+                        self._stream_chunks(prompt, system_prompt, kwargs, usage)
+                    ) as chunks:
+                        async for text in chunks:
+                            parts.append(text)
+                            received += len(text)
+                            yield text
+                            # estimate_tokens와 같은 2글자당 1토큰 추정
+                            if token_budget and received // 2 > token_budget:
+                                logger.warning(
+                                    f"응답 토큰 예산 초과로 생성 중단: ~{token_budget} 토큰"
+                                )
+                                break
+                        else:
+                            completed = True
+                finally:
+                    self._record_stream_usage(
+                        usage, prompt, system_prompt, "".join(parts),
+                        time.monotonic() - started,
+                    )
+        except Exception as e:
+            logger.error(f"스트리밍 생성 실패: {e}")
+            raise
+
+        if completed:
+            self._store_cached(key, kwargs, "".join(parts))
+
+    async def _stream_chunks(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        kwargs: Dict[str, Any],
+        usage: Dict[str, Any],
+    ) -> AsyncIterator[str]:
+        """제공자 스트림을 텍스트 조각으로 변환 (완료 시 usage에 사용량 기록)"""
+        client = self._get_async_client()
+        if self.provider == "openai":
+            request = self._openai_request(prompt, system_prompt, kwargs)
+            usage["model"] = request["model"]
+            response = await client.chat.completions.create(
+                **request, stream=True, stream_options={"include_usage": True}
+            )
+            async with response:
+                async for chunk in response:
+                    if chunk.usage:
+                        usage["usage"] = chunk.usage
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+        elif self.provider == "anthropic":
+            request = self._anthropic_request(prompt, system_prompt, kwargs)
+            usage["model"] = request["model"]
+            async with client.messages.stream(**request) as response:
+                async for text in response.text_stream:
+                    yield text
+                usage["usage"] = (await response.get_final_message()).usage
+        elif self.provider == "google":
+            model, full_prompt = self._google_request(prompt, system_prompt, kwargs)
+            usage["model"] = DEFAULT_MODELS["google"]
+            usage["prompt"] = full_prompt
+            response = await model.generate_content_async(full_prompt, stream=True)
+            async for chunk in response:
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # 텍스트 파트가 없는 조각 (종료 사유만 담긴 마지막 조각 등)
+                    continue
+                if text:
+                    yield text
+            usage["usage"] = getattr(response, "usage_metadata", None)
+
+    def _record_stream_usage(
+        self,
+        usage: Dict[str, Any],
+        prompt: str,
+        system_prompt: Optional[str],
+        text: str,
+        latency: float,
+    ) -> None:
+        """스트림 사용량 기록 (중단되어 제공자 집계가 없으면 추정치)"""
+        model = usage.get("model", DEFAULT_MODELS[self.provider])
+        reported = usage.get("usage")
+        if reported is None and not text:
+            # 응답을 받기 전에 실패한 요청
+            return
+        if reported is not None and self.provider == "openai":
+            self._record_openai_usage(reported, model, latency)
+        elif reported is not None and self.provider == "anthropic":
+            self._record_anthropic_usage(reported, model, latency)
+        elif self.provider == "google" and "prompt" in usage:
+            self._record_google_usage(reported, usage["prompt"], text, latency)
+        else:
+            self.token_monitor.record_usage(
+                prompt_tokens=estimate_tokens(prompt, system_prompt),
+                completion_tokens=estimate_tokens(text) if text else 0,
+                model=model,
+                provider=self.provider,
+                latency_seconds=latency,
+            )
+
     @classmethod
     def get_usage_summary(cls) -> Dict[str, Any]:
         """전역 토큰 사용량 요약 조회"""
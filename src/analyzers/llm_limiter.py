@@ -0,0 +1,151 @@
+"""
+LLM 제공자별 동시성/속도 제한
+제공자마다 세마포어와 두 개의 토큰 버킷(분당 요청 수, 분당 토큰 수)을 두어
+동시 호출이 제공자 한도(RPM/TPM)를 넘지 않도록 합니다.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+import logging
+from ..utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProviderLimit:
+    """제공자별 제한 설정 (0이면 해당 제한 없음)"""
+    concurrency: int = 5
+    requests_per_minute: float = 0.0
+    tokens_per_minute: float = 0.0
+
+
+# 기본 한도 (각 제공자의 최하위 유료/무료 티어 기준)
+DEFAULT_PROVIDER_LIMITS: Dict[str, ProviderLimit] = {
+    "openai": ProviderLimit(concurrency=5, requests_per_minute=500, tokens_per_minute=200_000),
+    "anthropic": ProviderLimit(concurrency=5, requests_per_minute=50, tokens_per_minute=50_000),
+    "google": ProviderLimit(concurrency=5, requests_per_minute=10, tokens_per_minute=250_000),
+}
+
+
+def estimate_tokens(*texts: Optional[str]) -> int:
+    """
+    요청 토큰 수 대략 추정 (실제 토크나이저 없이 속도 제한 예약용)
+
+    한국어가 섞인 프롬프트를 감안해 2글자당 1토큰으로 넉넉하게 잡습니다.
+    """
+    return sum(len(text) for text in texts if text) // 2 + 1
+
+
+@dataclass
+class ProviderLimitStats:
+    """제공자별 대기 통계"""
+    requests: int = 0
+    reserved_tokens: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    total_wait_seconds: float = 0.0
+
+
+class ProviderLimiter:
+    """
+    제공자별 동시성 + 요청/토큰 속도 제한기
+
+    asyncio 동기화 객체는 이벤트 루프에 묶이므로 루프가 바뀌면
+    제공자별 상태를 새로 만듭니다.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, ProviderLimit]] = None):
+        self.limits = {**DEFAULT_PROVIDER_LIMITS, **(limits or {})}
+        self._primitives: Dict[
+            str, Tuple[asyncio.Semaphore, Optional[TokenBucket], Optional[TokenBucket]]
+        ] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: Dict[str, ProviderLimitStats] = {}
+
+    @classmethod
+    def from_settings(cls) -> "ProviderLimiter":
+        """환경 설정 값으로 제한기 생성"""
+        from config.settings import settings
+
+        limits = {}
+        for provider in set(DEFAULT_PROVIDER_LIMITS) | set(settings.llm_rate_limits):
+            base = DEFAULT_PROVIDER_LIMITS.get(provider, ProviderLimit())
+            values = settings.llm_rate_limits.get(provider, {})
+            limits[provider] = ProviderLimit(
+                concurrency=int(values.get("concurrency", settings.llm_concurrency)),
+                requests_per_minute=float(
+                    values.get("requests_per_minute", base.requests_per_minute)
+                ),
+                tokens_per_minute=float(values.get("tokens_per_minute", base.tokens_per_minute)),
+            )
+        return cls(limits)
+
+    def _ensure_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._primitives.clear()
+            self._loop = loop
+
+    def _get_primitives(self, provider: str):
+        self._ensure_loop()
+        if provider not in self._primitives:
+            limit = self.limits.get(provider, ProviderLimit())
+            request_bucket = (
+                TokenBucket(limit.requests_per_minute / 60, max(1, limit.concurrency))
+                if limit.requests_per_minute > 0
+                else None
+            )
+            token_bucket = (
+                TokenBucket(limit.tokens_per_minute / 60, int(limit.tokens_per_minute))
+                if limit.tokens_per_minute > 0
+                else None
+            )
+            self._primitives[provider] = (
+                asyncio.Semaphore(limit.concurrency), request_bucket, token_bucket
+            )
+        return self._primitives[provider]
+
+    @asynccontextmanager
+    async def limit(self, provider: str, tokens: int = 0):
+        """
+        제공자 슬롯, 요청 토큰, 예상 토큰 수만큼의 TPM 예산을 확보한 동안 블록 실행
+
+        Args:
+            provider: LLM 제공자
+            tokens: 예상 토큰 수 (프롬프트 + 최대 응답 토큰)
+        """
+        semaphore, request_bucket, token_bucket = self._get_primitives(provider)
+        stats = self._stats.setdefault(provider, ProviderLimitStats())
+        stats.requests += 1
+        stats.reserved_tokens += tokens
+        started = time.monotonic()
+
+        async with semaphore:
+            if request_bucket is not None:
+                await request_bucket.acquire()
+            if token_bucket is not None and tokens > 0:
+                await token_bucket.acquire(tokens)
+            stats.total_wait_seconds += time.monotonic() - started
+            stats.in_flight += 1
+            stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+            try:
+                yield
+            finally:
+                stats.in_flight -= 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """제공자별 대기 통계 조회"""
+        return {
+            provider: {
+                "requests": stats.requests,
+                "reserved_tokens": stats.reserved_tokens,
+                "max_in_flight": stats.max_in_flight,
+                "avg_wait_seconds": round(stats.total_wait_seconds / stats.requests, 4)
+                if stats.requests
+                else 0.0,
+            }
+            for provider, stats in self._stats.items()
+        }
@@ -2,30 +2,123 @@
 기술 분석기
 LLM을 사용하여 기술/저장소를 분석합니다.
 """
+import asyncio
 import json
-from typing import Dict, Any, List, Optional
+import time
+from contextlib import aclosing
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import logging
+from cachetools import TTLCache
+from .llm_cache import LLMResponseCache
 from .llm_client import LLMClient
+from .llm_limiter import estimate_tokens
 from ..scrapers.models import TrendingRepository
-from ..database.supabase_client import SupabaseClient
+from ..database.storage import create_storage
+from ..utils.json_stream import IncrementalJSONParser
 
 logger = logging.getLogger(__name__)
 
+# 시스템 프롬프트에는 요청마다 같은 지시/응답 형식을 모두 넣고, 사용자 프롬프트에는
+# 저장소/기사 데이터만 넣습니다. 제공자 프롬프트 캐시는 같은 접두사에만 적용되므로
+# 고정 텍스트를 앞쪽(시스템 프롬프트)에 모아야 캐시 대상이 됩니다.
+# (제공자 최소 길이보다 짧으면 LLMClient가 캐시 표시를 생략합니다)
+REPO_SYSTEM_PROMPT = """당신은 기술 전문가입니다. GitHub 저장소를 분석하고 한국어로 설명해주세요.
+
+다음 JSON 형식으로 응답해주세요:
+
+{
+  "what_is_it": "이 기술/라이브러리가 무엇인지 2-3문장으로 설명",
+  "key_features": ["특징1", "특징2", "특징3"],
+  "use_cases": ["실무 활용 사례1", "활용 사례2", "활용 사례3"],
+  "difficulty": "초급|중급|고급",
+  "related_stack": ["관련기술1", "관련기술2", "관련기술3"]
+}
+
+JSON만 반환하고 다른 텍스트는 포함하지 마세요."""
+
+TREND_SYSTEM_PROMPT = """당신은 기술 트렌드 분석 전문가입니다. 오늘의 기술 트렌드를 한국어로 요약해주세요.
+
+다음 JSON 형식으로 응답해주세요:
+
+{
+  "daily_summary": "오늘의 기술 트렌드를 3-4문장으로 요약",
+  "hot_technologies": [
+    {"name": "기술명1", "description": "설명", "why_hot": "주목받는 이유"},
+    {"name": "기술명2", "description": "설명", "why_hot": "주목받는 이유"}
+  ],
+  "learning_recommendations": ["배워볼 만한 기술1", "배워볼 만한 기술2"]
+}
+
+JSON만 반환하고 다른 텍스트는 포함하지 마세요."""
+
+ARTICLE_SYSTEM_PROMPT = """당신은 IT 뉴스 전문가입니다. 기사 제목을 보고 간결하게 설명해주세요.
+
+다음 IT 뉴스 기사 제목을 보고 한국어로 간단히 설명해주세요 (1-2문장).
+이 기사가 어떤 내용일지 제목을 바탕으로 추측해서 설명해주세요.
+설명만 작성하고 다른 텍스트는 포함하지 마세요."""
+
+ARTICLE_BATCH_SYSTEM_PROMPT = """당신은 IT 뉴스 전문가입니다. 여러 기사 제목을 보고 각각 간결하게 설명해주세요.
+
+다음 IT 뉴스 기사 목록의 각 제목을 보고 한국어로 간단히 설명해주세요 (기사마다 1-2문장).
+이 기사들이 어떤 내용일지 제목을 바탕으로 추측해서 설명해주세요.
+다음 JSON 형식으로 모든 id에 대해 응답해주세요:
+
+{
+  "summaries": [
+    {"id": 1, "summary": "설명"}
+  ]
+}
+
+JSON만 반환하고 다른 텍스트는 포함하지 마세요."""
+
+# 응답 JSON 키 → 결과 필드명 (스트리밍 시 필드 콜백에 사용)
+REPO_FIELDS = {
+    "what_is_it": "ai_summary",
+    "use_cases": "ai_use_cases",
+    "difficulty": "ai_difficulty",
+    "related_stack": "ai_related_tech",
+}
+TREND_FIELDS = {
+    "daily_summary": "ai_daily_summary",
+    "hot_technologies": "ai_hot_technologies",
+    "learning_recommendations": "ai_learning_recommendations",
+}
+
+# 스트리밍 필드 콜백: (결과 필드명, 값)
+FieldCallback = Callable[[str, Any], None]
+
 
 class TechAnalyzer:
     """기술 분석기"""
 
-    def __init__(self, provider: str = "openai", use_cache: bool = True):
-        self.llm = LLMClient(provider=provider)
+    def __init__(
+        self,
+        provider: str = "openai",
+        use_cache: bool = True,
+        cache_size: int = 1024,
+        cache_ttl: float = 3600.0,
+        response_cache: Optional[LLMResponseCache] = None,
+    ):
+        """
+        Args:
+            provider: LLM 제공자
+            use_cache: DB에 저장된 이전 분석 결과 재사용 여부
+            cache_size: 프로세스 내 분석 캐시 최대 항목 수 (LRU)
+            cache_ttl: 프로세스 내 분석 캐시 유효 시간 (초)
+            response_cache: LLM 응답 캐시 (요약/트렌드 분석 포함 모든 요청에 적용)
+        """
+        self.llm = LLMClient(provider=provider, response_cache=response_cache)
         self.use_cache = use_cache
         self._db = None
+        # 저장소명 → 분석 결과 (DB에 캐시가 없으면 None도 저장하여 재조회 방지)
+        self._analysis_cache: TTLCache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
     
     @property
-    def db(self) -> SupabaseClient:
-        """지연 초기화된 DB 클라이언트"""
+    def db(self):
+        """지연 초기화된 DB 클라이언트 (SupabaseClient 또는 SQLiteClient)"""
         if self._db is None:
             try:
-                self._db = SupabaseClient()
+                self._db = create_storage()
             except Exception as e:
                 logger.warning(f"DB 클라이언트 초기화 실패, 캐싱 비활성화: {e}")
                 self.use_cache = False
@@ -55,13 +148,13 @@ class TechAnalyzer:
             logger.info(f"🔄 저장소 분석 시작: {repo.name}")
 
             prompt = self._create_analysis_prompt(repo)
-            system_prompt = "당신은 기술 전문가입니다. GitHub 저장소를 분석하고 한국어로 설명해주세요."
-
-            response = self.llm.generate(prompt, system_prompt)
+            response = self.llm.generate(prompt, REPO_SYSTEM_PROMPT)
 
             # JSON 파싱
             analysis = self._parse_analysis_response(response)
 
+            if analysis:
+                self._analysis_cache[repo.name] = analysis
             logger.info(f"✅ 저장소 분석 완료: {repo.name}")
             return analysis
 
@@ -69,15 +162,91 @@ class TechAnalyzer:
             logger.error(f"저장소 분석 실패: {repo.name} - {e}")
             return {}
     
+    async def analyze_repository_async(
+        self, repo: TrendingRepository, skip_cache: bool = False
+    ) -> Dict[str, Any]:
+        """analyze_repository의 비동기 버전 (LLM 호출을 다른 작업과 겹쳐 실행)"""
+        try:
+            # analyze_repositories가 미리 일괄 조회하므로 보통 메모리 캐시에서 끝남
+            if self.use_cache and not skip_cache:
+                cached = self._get_cached_analysis(repo.name)
+                if cached:
+                    logger.info(f"✅ 캐시 사용: {repo.name}")
+                    return cached
+
+            logger.info(f"🔄 저장소 분석 시작: {repo.name}")
+
+            prompt = self._create_analysis_prompt(repo)
+            response = await self.llm.agenerate(prompt, REPO_SYSTEM_PROMPT)
+            analysis = self._parse_analysis_response(response)
+
+            if analysis:
+                self._analysis_cache[repo.name] = analysis
+            logger.info(f"✅ 저장소 분석 완료: {repo.name}")
+            return analysis
+
+        except Exception as e:
+            logger.error(f"저장소 분석 실패: {repo.name} - {e}")
+            return {}
+
+    async def analyze_repositories(
+        self, repos: List[TrendingRepository], skip_cache: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 저장소를 동시에 분석합니다.
+
+        캐시는 한 번의 DB 조회로 미리 가져오고, 나머지는 LLM 제공자 한도 안에서
+        동시에 분석합니다.
+
+        Returns:
+            repos와 같은 순서의 분석 결과 목록 (실패한 저장소는 빈 딕셔너리)
+        """
+        if self.use_cache and not skip_cache:
+            await asyncio.to_thread(
+                self.prefetch_cached_analyses, [repo.name for repo in repos]
+            )
+        return list(
+            await asyncio.gather(
+                *(self.analyze_repository_async(repo, skip_cache) for repo in repos)
+            )
+        )
+
+    def prefetch_cached_analyses(self, repo_names: List[str]) -> int:
+        """
+        여러 저장소의 캐시된 분석 결과를 한 번의 DB 조회로 미리 가져옵니다.
+
+        Returns:
+            DB에서 찾은 분석 결과 수
+        """
+        names = [name for name in dict.fromkeys(repo_names) if name not in self._analysis_cache]
+        if not names or not self.use_cache or self.db is None:
+            return 0
+
+        try:
+            found = self.db.get_cached_ai_analyses(names)
+        except Exception as e:
+            logger.warning(f"캐시 일괄 조회 실패: {e}")
+            return 0
+
+        for name in names:
+            self._analysis_cache[name] = found.get(name)
+        return len(found)
+
     def _get_cached_analysis(self, repo_name: str) -> Optional[Dict[str, Any]]:
-        """캐시된 분석 결과 조회"""
-        if not self.use_cache or self.db is None:
+        """캐시된 분석 결과 조회 (프로세스 내 캐시 → DB 순)"""
+        if not self.use_cache:
             return None
-        
+        if repo_name in self._analysis_cache:
+            return self._analysis_cache[repo_name]
+        if self.db is None:
+            return None
+
         try:
             cached = self.db.get_cached_ai_analysis(repo_name)
-            if cached and cached.get("ai_summary"):
-                return cached
+            if not (cached and cached.get("ai_summary")):
+                cached = None
+            self._analysis_cache[repo_name] = cached
+            return cached
         except Exception as e:
             logger.warning(f"캐시 조회 실패: {e}")
         return None
@@ -92,18 +261,6 @@ class TechAnalyzer:
 언어: {repo.language or "알 수 없음"}
 Stars: {repo.stars:,}
 오늘 증가한 Stars: {repo.stars_today}
-
-다음 JSON 형식으로 응답해주세요:
-
-{{
-  "what_is_it": "이 기술/라이브러리가 무엇인지 2-3문장으로 설명",
-  "key_features": ["특징1", "특징2", "특징3"],
-  "use_cases": ["실무 활용 사례1", "활용 사례2", "활용 사례3"],
-  "difficulty": "초급|중급|고급",
-  "related_stack": ["관련기술1", "관련기술2", "관련기술3"]
-}}
-
-JSON만 반환하고 다른 텍스트는 포함하지 마세요.
 """
         return prompt
 
@@ -121,18 +278,21 @@ JSON만 반환하고 다른 텍스트는 포함하지 마세요.
 
             # JSON 파싱
             data = json.loads(response)
-
-            return {
-                "ai_summary": data.get("what_is_it", ""),
-                "ai_use_cases": data.get("use_cases", []),
-                "ai_difficulty": data.get("difficulty", "중급"),
-                "ai_related_tech": data.get("related_stack", []),
-            }
+            return self._analysis_from_data(data)
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {e}")
             return {}
 
+    @staticmethod
+    def _analysis_from_data(data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "ai_summary": data.get("what_is_it", ""),
+            "ai_use_cases": data.get("use_cases", []),
+            "ai_difficulty": data.get("difficulty", "중급"),
+            "ai_related_tech": data.get("related_stack", []),
+        }
+
     def analyze_daily_trends(
         self, repos: List[TrendingRepository], articles: List[Any]
     ) -> Dict[str, Any]:
@@ -150,9 +310,7 @@ JSON만 반환하고 다른 텍스트는 포함하지 마세요.
             logger.info("일일 트렌드 분석 시작")
 
             prompt = self._create_daily_summary_prompt(repos, articles)
-            system_prompt = "당신은 기술 트렌드 분석 전문가입니다. 오늘의 기술 트렌드를 한국어로 요약해주세요."
-
-            response = self.llm.generate(prompt, system_prompt, max_tokens=1500)
+            response = self.llm.generate(prompt, TREND_SYSTEM_PROMPT, max_tokens=1500)
 
             # JSON 파싱
             analysis = self._parse_daily_summary(response)
@@ -164,6 +322,24 @@ JSON만 반환하고 다른 텍스트는 포함하지 마세요.
             logger.error(f"일일 트렌드 분석 실패: {e}")
             return {}
 
+    async def analyze_daily_trends_async(
+        self, repos: List[TrendingRepository], articles: List[Any]
+    ) -> Dict[str, Any]:
+        """analyze_daily_trends의 비동기 버전"""
+        try:
+            logger.info("일일 트렌드 분석 시작")
+
+            prompt = self._create_daily_summary_prompt(repos, articles)
+            response = await self.llm.agenerate(prompt, TREND_SYSTEM_PROMPT, max_tokens=1500)
+            analysis = self._parse_daily_summary(response)
+
+            logger.info("일일 트렌드 분석 완료")
+            return analysis
+
+        except Exception as e:
+            logger.error(f"일일 트렌드 분석 실패: {e}")
+            return {}
+
     def _create_daily_summary_prompt(
         self, repos: List[TrendingRepository], articles: List[Any]
     ) -> str:
@@ -191,19 +367,6 @@ JSON만 반환하고 다른 텍스트는 포함하지 마세요.
 
 ## IT 뉴스 (상위 5개)
 {article_list}
-
-다음 JSON 형식으로 응답해주세요:
-
-{{
-  "daily_summary": "오늘의 기술 트렌드를 3-4문장으로 요약",
-  "hot_technologies": [
-    {{"name": "기술명1", "description": "설명", "why_hot": "주목받는 이유"}},
-    {{"name": "기술명2", "description": "설명", "why_hot": "주목받는 이유"}}
-  ],
-  "learning_recommendations": ["배워볼 만한 기술1", "배워볼 만한 기술2"]
-}}
-
-JSON만 반환하고 다른 텍스트는 포함하지 마세요.
 """
         return prompt
 
@@ -219,17 +382,20 @@ JSON만 반환하고 다른 텍스트는 포함하지 마세요.
                     response = response[4:]
 
             data = json.loads(response)
-
-            return {
-                "ai_daily_summary": data.get("daily_summary", ""),
-                "ai_hot_technologies": data.get("hot_technologies", []),
-                "ai_learning_recommendations": data.get("learning_recommendations", []),
-            }
+            return self._daily_summary_from_data(data)
 
         except json.JSONDecodeError as e:
             logger.error(f"일일 요약 JSON 파싱 실패: {e}")
             return {}
 
+    @staticmethod
+    def _daily_summary_from_data(data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "ai_daily_summary": data.get("daily_summary", ""),
+            "ai_hot_technologies": data.get("hot_technologies", []),
+            "ai_learning_recommendations": data.get("learning_recommendations", []),
+        }
+
     def summarize_article(self, article) -> str:
         """
         뉴스 기사를 AI로 요약합니다.
@@ -244,25 +410,36 @@ JSON만 반환하고 다른 텍스트는 포함하지 마세요.
             # 이미 요약이 있으면 그대로 반환
             if article.summary and len(article.summary) > 50:
                 return article.summary
+
+            prompt = self._create_article_prompt(article)
+            summary = self.llm.generate(prompt, ARTICLE_SYSTEM_PROMPT, max_tokens=150)
+            return summary.strip()
             
-            prompt = f"""
-다음 IT 뉴스 기사 제목을 보고 한국어로 간단히 설명해주세요 (1-2문장):
+        except Exception as e:
+            logger.error(f"기사 요약 실패: {article.title} - {e}")
+            return ""
 
-제목: {article.title}
-출처: {article.source}
+    async def summarize_article_async(self, article) -> str:
+        """summarize_article의 비동기 버전"""
+        try:
+            if article.summary and len(article.summary) > 50:
+                return article.summary
 
-이 기사가 어떤 내용일지 제목을 바탕으로 추측해서 설명해주세요.
-설명만 작성하고 다른 텍스트는 포함하지 마세요.
-"""
-            system_prompt = "당신은 IT 뉴스 전문가입니다. 기사 제목을 보고 간결하게 설명해주세요."
-            
-            summary = self.llm.generate(prompt, system_prompt, max_tokens=150)
+            prompt = self._create_article_prompt(article)
+            summary = await self.llm.agenerate(prompt, ARTICLE_SYSTEM_PROMPT, max_tokens=150)
             return summary.strip()
-            
+
         except Exception as e:
             logger.error(f"기사 요약 실패: {article.title} - {e}")
             return ""
 
+    def _create_article_prompt(self, article) -> str:
+        """기사 요약 프롬프트 생성"""
+        return f"""
+제목: {article.title}
+출처: {article.source}
+"""
+
     def summarize_articles(self, articles: List, max_articles: int = 10) -> List:
         """
         여러 뉴스 기사를 요약합니다.
@@ -284,3 +461,266 @@ JSON만 반환하고 다른 텍스트는 포함하지 마세요.
                     logger.info(f"  ✅ [{i+1}/{min(len(articles), max_articles)}] {article.title[:30]}...")
         
         return articles
+
+    async def summarize_articles_async(
+        self, articles: List, max_articles: int = 10, batch_size: int = 1
+    ) -> List:
+        """
+        여러 뉴스 기사를 동시에 요약합니다. (summarize_articles의 비동기 버전)
+
+        Args:
+            articles: NewsArticle 리스트
+            max_articles: 최대 요약할 기사 수
+            batch_size: 한 요청에 묶을 기사 수 (1이면 기사마다 개별 요청)
+
+        Returns:
+            요약이 추가된 NewsArticle 리스트
+        """
+        logger.info(
+            f"📰 뉴스 기사 AI 요약 시작 (최대 {max_articles}개, 배치 크기 {batch_size})"
+        )
+
+        targets = [
+            article for article in articles[:max_articles]
+            if not article.summary or len(article.summary) < 50
+        ]
+        if batch_size > 1:
+            batches = [targets[i:i + batch_size] for i in range(0, len(targets), batch_size)]
+            results = await asyncio.gather(
+                *(self._summarize_batch_async(batch) for batch in batches)
+            )
+            summaries = [summary for batch_summaries in results for summary in batch_summaries]
+        else:
+            summaries = await asyncio.gather(
+                *(self.summarize_article_async(article) for article in targets)
+            )
+        for i, (article, summary) in enumerate(zip(targets, summaries)):
+            if summary:
+                article.summary = summary
+                logger.info(f"  ✅ [{i+1}/{len(targets)}] {article.title[:30]}...")
+
+        return articles
+
+    async def _summarize_batch_async(self, articles: List) -> List[str]:
+        """
+        기사 여러 개를 한 번의 요청으로 요약합니다.
+
+        응답에서 빠졌거나 파싱할 수 없는 항목만 개별 요청으로 다시 요약합니다.
+
+        Returns:
+            articles와 같은 순서의 요약 목록 (실패한 기사는 빈 문자열)
+        """
+        if len(articles) == 1:
+            return [await self.summarize_article_async(articles[0])]
+
+        prompt = self._create_article_batch_prompt(articles)
+        started = time.monotonic()
+        try:
+            response = await self.llm.agenerate(
+                prompt, ARTICLE_BATCH_SYSTEM_PROMPT, max_tokens=150 * len(articles) + 100
+            )
+            parsed = self._parse_article_batch(response, len(articles))
+        except Exception as e:
+            logger.error(f"기사 일괄 요약 실패, 개별 요약으로 전환: {e}")
+            parsed = {}
+        latency = time.monotonic() - started
+
+        summaries = [parsed.get(i, "") for i in range(1, len(articles) + 1)]
+        missing = [i for i, summary in enumerate(summaries) if not summary]
+        if missing:
+            logger.warning(f"일괄 요약에서 {len(missing)}개 항목 누락, 개별 요약으로 재시도")
+            retried = await asyncio.gather(
+                *(self.summarize_article_async(articles[i]) for i in missing)
+            )
+            for i, summary in zip(missing, retried):
+                summaries[i] = summary
+
+        single_tokens = sum(
+            estimate_tokens(self._create_article_prompt(article), ARTICLE_SYSTEM_PROMPT)
+            for article in articles
+        )
+        self.llm.token_monitor.record_batch(
+            items=len(articles),
+            fallback_items=len(missing),
+            prompt_tokens_saved=single_tokens - estimate_tokens(prompt, ARTICLE_BATCH_SYSTEM_PROMPT),
+            latency_seconds=latency,
+        )
+        return summaries
+
+    def _create_article_batch_prompt(self, articles: List) -> str:
+        """기사 일괄 요약 프롬프트 생성 (기사마다 1부터 번호 부여)"""
+        items = json.dumps(
+            [
+                {"id": i, "title": article.title, "source": article.source}
+                for i, article in enumerate(articles, 1)
+            ],
+            ensure_ascii=False,
+            indent=2,
+        )
+        return f"""
+{items}
+"""
+
+    def _parse_article_batch(self, response: str, count: int) -> Dict[int, str]:
+        """
+        일괄 요약 응답 파싱
+
+        {"summaries": [...]}, 최상위 배열, {"1": "요약"} 형태를 모두 받아들이며
+        항목 하나가 잘못되어도 나머지는 사용합니다.
+
+        Returns:
+            기사 번호(1부터) → 요약
+        """
+        response = response.strip()
+        if response.startswith("```"):
+            response = response.split("```")[1]
+            if response.startswith("json"):
+                response = response[4:]
+
+        # 앞뒤 설명 문장이 붙은 경우 JSON 부분만 사용
+        starts = [pos for pos in (response.find("{"), response.find("[")) if pos >= 0]
+        end = max(response.rfind("}"), response.rfind("]"))
+        if not starts or end < 0:
+            logger.error("일괄 요약 응답에서 JSON을 찾지 못했습니다")
+            return {}
+        try:
+            data = json.loads(response[min(starts):end + 1])
+        except json.JSONDecodeError as e:
+            logger.error(f"일괄 요약 JSON 파싱 실패: {e}")
+            return {}
+
+        if isinstance(data, dict) and isinstance(data.get("summaries"), list):
+            data = data["summaries"]
+        if isinstance(data, dict):
+            entries = [{"id": key, "summary": value} for key, value in data.items()]
+        elif isinstance(data, list):
+            entries = data
+        else:
+            return {}
+
+        parsed = {}
+        for position, entry in enumerate(entries, 1):
+            if isinstance(entry, str):
+                # 번호 없이 순서대로 요약만 준 경우
+                item_id, summary = position, entry
+            elif isinstance(entry, dict):
+                item_id, summary = entry.get("id", position), entry.get("summary")
+            else:
+                continue
+            try:
+                item_id = int(item_id)
+            except (TypeError, ValueError):
+                continue
+            if 1 <= item_id <= count and isinstance(summary, str) and summary.strip():
+                parsed[item_id] = summary.strip()
+        return parsed
+
+    # ==================== 스트리밍 분석 ====================
+
+    async def _stream_fields(
+        self,
+        prompt: str,
+        system_prompt: str,
+        field_names: Dict[str, str],
+        on_field: Optional[FieldCallback],
+        token_budget: Optional[int],
+        **kwargs,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        응답을 스트리밍하며 완성된 최상위 필드를 on_field로 즉시 전달
+
+        응답은 끝까지 받아 LLM 응답 캐시에 저장되도록 합니다.
+        (JSON 객체가 닫힌 뒤의 코드 블록 끝 등은 파서가 무시)
+
+        Returns:
+            (완성된 필드, JSON 객체를 끝까지 받았는지 여부)
+        """
+        parser = IncrementalJSONParser()
+        async with aclosing(
+            self.llm.stream(prompt, system_prompt, token_budget=token_budget, **kwargs)
+        ) as chunks:
+            async for chunk in chunks:
+                for key, value in parser.feed(chunk):
+                    if on_field and key in field_names:
+                        on_field(field_names[key], value)
+        return parser.fields, parser.done
+
+    async def analyze_repository_stream(
+        self,
+        repo: TrendingRepository,
+        on_field: Optional[FieldCallback] = None,
+        token_budget: Optional[int] = None,
+        skip_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        저장소를 스트리밍으로 분석합니다.
+
+        ai_summary 등 각 필드는 응답 전체를 기다리지 않고 완성되는 즉시
+        on_field(필드명, 값)로 전달됩니다. 캐시된 결과도 같은 콜백으로 전달합니다.
+
+        Args:
+            repo: TrendingRepository 객체
+            on_field: 필드 완성 콜백
+            token_budget: 응답 토큰 상한 (넘으면 생성 중단, 완성된 필드만 사용)
+            skip_cache: 캐시 무시 여부
+
+        Returns:
+            분석 결과 딕셔너리 (중단된 경우 없는 필드는 기본값)
+        """
+        try:
+            if self.use_cache and not skip_cache:
+                cached = self._get_cached_analysis(repo.name)
+                if cached:
+                    logger.info(f"✅ 캐시 사용: {repo.name}")
+                    for name, value in cached.items():
+                        if on_field:
+                            on_field(name, value)
+                    return cached
+
+            logger.info(f"🔄 저장소 분석 시작 (스트리밍): {repo.name}")
+            fields, complete = await self._stream_fields(
+                self._create_analysis_prompt(repo), REPO_SYSTEM_PROMPT,
+                REPO_FIELDS, on_field, token_budget,
+            )
+            if not fields:
+                return {}
+
+            analysis = self._analysis_from_data(fields)
+            # 중단된 부분 결과는 재사용하지 않음
+            if complete:
+                self._analysis_cache[repo.name] = analysis
+            logger.info(f"✅ 저장소 분석 완료: {repo.name}")
+            return analysis
+
+        except Exception as e:
+            logger.error(f"저장소 분석 실패: {repo.name} - {e}")
+            return {}
+
+    async def analyze_daily_trends_stream(
+        self,
+        repos: List[TrendingRepository],
+        articles: List[Any],
+        on_field: Optional[FieldCallback] = None,
+        token_budget: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        일일 트렌드를 스트리밍으로 분석합니다.
+
+        ai_daily_summary가 완성되면 나머지 필드를 기다리지 않고
+        on_field(필드명, 값)로 전달됩니다.
+        """
+        try:
+            logger.info("일일 트렌드 분석 시작 (스트리밍)")
+            fields, _ = await self._stream_fields(
+                self._create_daily_summary_prompt(repos, articles), TREND_SYSTEM_PROMPT,
+                TREND_FIELDS, on_field, token_budget, max_tokens=1500,
+            )
+            if not fields:
+                return {}
+
+            logger.info("일일 트렌드 분석 완료")
+            return self._daily_summary_from_data(fields)
+
+        except Exception as e:
+            logger.error(f"일일 트렌드 분석 실패: {e}")
+            return {}
@@ -0,0 +1,8 @@
+-- ============================================
+-- news_articles 자연 키 UNIQUE 제약
+-- add_natural_keys.sql과 python -m src.database.backfill_natural_keys 실행 후
+-- Supabase SQL Editor로 한 번 실행하세요
+-- ============================================
+
+ALTER TABLE news_articles
+    ADD CONSTRAINT news_articles_canonical_url_key UNIQUE (canonical_url);
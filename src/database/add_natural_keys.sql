@@ -0,0 +1,24 @@
+-- ============================================
+-- 자연 키 추가 (upsert로 재실행 시 행 중복 방지)
+-- 기존 데이터베이스에서 순서대로 한 번 실행하세요
+--   1) 이 파일: Supabase SQL Editor
+--   2) python -m src.database.backfill_natural_keys (먼저 --dry-run으로 확인)
+--   3) add_canonical_url_constraint.sql: Supabase SQL Editor
+-- ============================================
+
+-- 1. 키 컬럼 추가
+ALTER TABLE trending_repos ADD COLUMN IF NOT EXISTS collected_date DATE;
+ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS canonical_url VARCHAR(500);
+
+-- 2. trending_repos 키 채우기 및 중복 정리 (키별 가장 최근 행만 유지)
+--    (name, collected_date)는 SQL로 정확히 계산되므로 여기서 처리
+UPDATE trending_repos SET collected_date = collected_at::date WHERE collected_date IS NULL;
+DELETE FROM trending_repos a USING trending_repos b
+WHERE a.name = b.name AND a.collected_date = b.collected_date AND a.id < b.id;
+
+ALTER TABLE trending_repos
+    ADD CONSTRAINT trending_repos_name_collected_date_key UNIQUE (name, collected_date);
+
+-- news_articles.canonical_url은 저장 시와 같은 canonicalize_url(https 통일,
+-- 'www.' 제거, 추적 파라미터만 제거, HN 'item?id=' 유지)이 필요하므로
+-- SQL 대신 Python 마이그레이션(backfill_natural_keys)으로 채웁니다.
@@ -0,0 +1,33 @@
+"""
+자연 키 채우기 (일회성 마이그레이션)
+기존 news_articles 행의 canonical_url을 저장 시와 같은 canonicalize_url로 채웁니다.
+SQL만으로는 같은 정규화를 재현할 수 없어 Python으로 실행합니다.
+
+사용법 (add_natural_keys.sql 실행 후, add_canonical_url_constraint.sql 실행 전):
+    python -m src.database.backfill_natural_keys --dry-run
+    python -m src.database.backfill_natural_keys
+"""
+import argparse
+import logging
+
+from .storage import create_storage
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="news_articles.canonical_url 채우기")
+    parser.add_argument("--backend", help="supabase / sqlite (기본: 설정값)")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="변경하지 않고 갱신/삭제될 행 수만 출력"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    counts = create_storage(args.backend).backfill_canonical_urls(dry_run=args.dry_run)
+    prefix = "[dry-run] " if args.dry_run else ""
+    print(f"{prefix}갱신 {counts['updated']}개, 중복 삭제 {counts['deleted']}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,9 @@ CREATE TABLE trending_repos (
     ai_difficulty VARCHAR(20),
     ai_related_tech JSONB,
     collected_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    collected_date DATE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    UNIQUE (name, collected_date)
 );
 
 -- 3. news_articles 테이블 생성
@@ -37,6 +39,7 @@ CREATE TABLE news_articles (
     score INTEGER,
     published_at TIMESTAMP WITH TIME ZONE,
     collected_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    canonical_url VARCHAR(500) UNIQUE,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
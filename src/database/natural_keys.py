@@ -0,0 +1,104 @@
+"""
+자연 키 기반 upsert 보조 함수
+같은 날 재실행해도 행이 늘어나지 않도록 테이블별 자연 키를 정의하고,
+저장 전에 키 컬럼 채우기/배치 내 중복 제거/청크 분할을 수행합니다.
+"""
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from ..utils.url_utils import canonicalize_url
+
+# 테이블별 자연 키 (UNIQUE 제약과 동일한 순서)
+NATURAL_KEYS: Dict[str, Tuple[str, ...]] = {
+    "trending_repos": ("name", "collected_date"),
+    "news_articles": ("canonical_url",),
+}
+
+# 값이 없으면(None) 기존 값을 덮어쓰지 않는 컬럼
+# (예: 이번 실행에서 AI 분석 대상이 아니었던 저장소의 기존 분석 결과 유지)
+PRESERVE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "trending_repos": ("ai_summary", "ai_use_cases", "ai_difficulty", "ai_related_tech"),
+    "news_articles": ("summary",),
+}
+
+
+def _collected_date(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if value:
+        return str(value)[:10]
+    return date.today().isoformat()
+
+
+def prepare_rows(table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    자연 키 컬럼을 채우고 배치 안의 같은 키는 마지막 행만 남깁니다.
+    PRESERVE_COLUMNS 중 None인 값은 행에서 제거합니다.
+    """
+    prepared: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    preserve = PRESERVE_COLUMNS.get(table, ())
+
+    for row in rows:
+        row = {
+            key: value for key, value in row.items()
+            if key != "id" and not (key in preserve and value is None)
+        }
+        if table == "trending_repos":
+            row["collected_date"] = _collected_date(row.get("collected_at"))
+        elif table == "news_articles":
+            row["canonical_url"] = canonicalize_url(row.get("url", ""))
+        key = tuple(row.get(column) for column in NATURAL_KEYS[table])
+        prepared.pop(key, None)
+        prepared[key] = row
+
+    return list(prepared.values())
+
+
+def plan_canonical_backfill(
+    rows: Iterable[Dict[str, Any]]
+) -> Tuple[Dict[Any, str], List[Any]]:
+    """
+    기존 news_articles 행의 canonical_url 채우기 계획
+
+    저장 시와 같은 canonicalize_url을 사용하므로 'item?id=', 'watch?v=' 같이
+    쿼리로 구분되는 기사는 합쳐지지 않습니다. 정규화 결과가 정확히 같은 행끼리만
+    중복으로 보고 id가 가장 큰(최근) 행만 남깁니다.
+
+    Args:
+        rows: id, url, canonical_url(없으면 None) 컬럼을 가진 행
+
+    Returns:
+        ({id: canonical_url} 갱신할 행, 삭제할 중복 행 id 목록)
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        canonical = row.get("canonical_url") or canonicalize_url(row.get("url") or "")
+        if canonical:
+            groups.setdefault(canonical, []).append(row)
+
+    updates: Dict[Any, str] = {}
+    duplicates: List[Any] = []
+    for canonical, group in groups.items():
+        keep = max(group, key=lambda row: row["id"])
+        duplicates.extend(row["id"] for row in group if row is not keep)
+        if keep.get("canonical_url") != canonical:
+            updates[keep["id"]] = canonical
+    return updates, duplicates
+
+
+def natural_key(table: str, row: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(row[column] for column in NATURAL_KEYS[table])
+
+
+def group_by_columns(rows: List[Dict[str, Any]]) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+    """컬럼 구성이 같은 행끼리 묶기 (한 번의 upsert 요청은 같은 컬럼만 갱신)"""
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    return groups
+
+
+def chunked(rows: List[Any], size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
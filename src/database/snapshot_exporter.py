@@ -0,0 +1,176 @@
+"""
+컬럼형 스냅샷 내보내기
+실행마다 DailyDigest 내용을 날짜/소스/언어로 파티션된 Parquet 파일로 저장합니다.
+오프라인 분석에서 몇 달치 데이터를 필요한 컬럼만 읽어 스캔할 수 있습니다.
+
+pyarrow가 필요합니다 (선택 의존성, `pip install pyarrow`).
+
+디렉터리 구조 (Hive 파티션):
+    <base_dir>/trending_repos/date=2026-01-01/language=Python/run-<id>-0.parquet
+    <base_dir>/news_articles/date=2026-01-01/source=GeekNews/run-<id>-0.parquet
+    <base_dir>/daily_digests/date=2026-01-01/run-<id>-0.parquet
+
+파티션 컬럼(date/source/language)은 파일 안이 아니라 경로에 저장되며,
+값이 없으면 pyarrow 기본값(__HIVE_DEFAULT_PARTITION__)이 사용됩니다.
+읽을 때는 pyarrow.dataset.dataset(path, partitioning="hive")로 복원됩니다.
+"""
+import json
+import typing
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Type
+import logging
+from pydantic import BaseModel
+from ..scrapers.models import DailyDigest, NewsArticle, TrendingRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "스냅샷 내보내기에는 pyarrow가 필요합니다: pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+def _arrow_type(annotation: Any):
+    """필드 타입 → Arrow 타입 (dict 등 구조가 정해지지 않은 값은 JSON 문자열)"""
+    pa = _pyarrow()
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+
+    if origin is typing.Union and len(args) == 1:
+        return _arrow_type(args[0])
+    if origin in (list, List):
+        item_type = args[0] if args else str
+        if item_type in (dict, Dict) or typing.get_origin(item_type) in (dict, Dict):
+            return pa.string()
+        return pa.list_(_arrow_type(item_type))
+    if annotation is str:
+        return pa.string()
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    if annotation is datetime:
+        return pa.timestamp("us")
+    if annotation is date:
+        return pa.date32()
+    return pa.string()
+
+
+def arrow_schema(model: Type[BaseModel], exclude: tuple = ()):
+    """Pydantic 모델 필드로 Arrow 스키마 생성"""
+    pa = _pyarrow()
+    return pa.schema(
+        [
+            pa.field(name, _arrow_type(field.annotation), nullable=not field.is_required())
+            for name, field in model.model_fields.items()
+            if name not in exclude
+        ]
+    )
+
+
+class SnapshotExporter:
+    """
+    DailyDigest Parquet 내보내기
+
+    Args:
+        base_dir: 스냅샷 루트 디렉터리
+        compression: Parquet 압축 코덱
+    """
+
+    def __init__(self, base_dir: str = "data/snapshots", compression: str = "zstd"):
+        self.base_dir = Path(base_dir)
+        self.compression = compression
+
+    @classmethod
+    def from_settings(cls) -> "SnapshotExporter":
+        """config.settings의 스냅샷 설정으로 생성"""
+        from config.settings import settings
+
+        return cls(settings.snapshot_dir)
+
+    def export(self, digest: DailyDigest, run_id: str = None) -> Dict[str, int]:
+        """
+        다이제스트 내용을 테이블별 파티션 파일로 저장
+
+        같은 날 재실행해도 기존 파일을 덮어쓰지 않도록 파일 이름에 run_id를 붙입니다.
+
+        Args:
+            digest: 저장할 다이제스트
+            run_id: 실행 식별자 (기본: 다이제스트 생성 시각)
+
+        Returns:
+            테이블별 저장 행 수
+        """
+        day = digest.date.date().isoformat()
+        run_id = run_id or digest.created_at.strftime("%Y%m%dT%H%M%S")
+        # 다이제스트 자체의 date 필드는 date 파티션으로 대신함
+        digest_exclude = ("date", "trending_repos", "news_articles")
+        digest_row = {
+            name: getattr(digest, name)
+            for name in DailyDigest.model_fields
+            if name not in digest_exclude
+        }
+
+        counts = {
+            "trending_repos": self._write(
+                "trending_repos", TrendingRepository, digest.trending_repos,
+                day, run_id, partition="language",
+            ),
+            "news_articles": self._write(
+                "news_articles", NewsArticle, digest.news_articles,
+                day, run_id, partition="source",
+            ),
+            "daily_digests": self._write(
+                "daily_digests", DailyDigest, [digest_row], day, run_id,
+                exclude=digest_exclude,
+            ),
+        }
+        logger.info(f"스냅샷 저장 완료: {self.base_dir} ({counts})")
+        return counts
+
+    def _write(
+        self,
+        table_name: str,
+        model: Type[BaseModel],
+        items: List[Any],
+        day: str,
+        run_id: str,
+        partition: str = None,
+        exclude: tuple = (),
+    ) -> int:
+        """테이블 하나를 date(+partition) 파티션으로 저장"""
+        if not items:
+            return 0
+        pa = _pyarrow()
+        import pyarrow.parquet as pq
+
+        schema = arrow_schema(model, exclude)
+        columns = {name: [] for name in schema.names}
+        for item in items:
+            for name in schema.names:
+                value = item[name] if isinstance(item, dict) else getattr(item, name)
+                if pa.types.is_string(schema.field(name).type) and isinstance(value, (dict, list)):
+                    value = json.dumps(value, ensure_ascii=False)
+                columns[name].append(value)
+
+        table = pa.table(columns, schema=schema)
+        table = table.append_column("date", pa.array([day] * len(items), pa.string()))
+        partition_cols = ["date", partition] if partition else ["date"]
+
+        pq.write_to_dataset(
+            table,
+            root_path=str(self.base_dir / table_name),
+            partition_cols=partition_cols,
+            basename_template=f"run-{run_id}-{{i}}.parquet",
+            compression=self.compression,
+        )
+        return len(items)
@@ -0,0 +1,472 @@
+"""
+SQLite 클라이언트
+SupabaseClient와 같은 메서드를 제공하는 로컬 저장소입니다.
+원격 서비스 없이 실행/테스트하거나 저장 비용을 측정할 때 사용합니다.
+"""
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+import logging
+from .natural_keys import (
+    NATURAL_KEYS,
+    chunked,
+    group_by_columns,
+    natural_key,
+    plan_canonical_backfill,
+    prepare_rows,
+)
+
+logger = logging.getLogger(__name__)
+
+# JSONB 컬럼 (TEXT에 JSON 문자열로 저장)
+JSON_COLUMNS = {
+    "ai_use_cases", "ai_related_tech", "top_keywords",
+    "ai_hot_technologies", "ai_learning_recommendations",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trending_repos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    description TEXT,
+    url TEXT NOT NULL,
+    language TEXT,
+    stars INTEGER DEFAULT 0,
+    stars_today INTEGER DEFAULT 0,
+    forks INTEGER DEFAULT 0,
+    ai_summary TEXT,
+    ai_use_cases TEXT,
+    ai_difficulty TEXT,
+    ai_related_tech TEXT,
+    collected_at TEXT NOT NULL,
+    collected_date TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS news_articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    summary TEXT,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    category TEXT,
+    score INTEGER,
+    published_at TEXT,
+    collected_at TEXT NOT NULL,
+    canonical_url TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS daily_digests (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    digest_date TEXT UNIQUE NOT NULL,
+    top_keywords TEXT,
+    ai_daily_summary TEXT,
+    ai_hot_technologies TEXT,
+    ai_learning_recommendations TEXT,
+    created_at TEXT NOT NULL
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_trending_repos_collected_at ON trending_repos(collected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_trending_repos_language ON trending_repos(language);
+CREATE INDEX IF NOT EXISTS idx_trending_repos_name ON trending_repos(name, collected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_news_articles_collected_at ON news_articles(collected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_news_articles_source ON news_articles(source);
+CREATE INDEX IF NOT EXISTS idx_daily_digests_date ON daily_digests(digest_date DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_trending_repos_name_date ON trending_repos(name, collected_date);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_news_articles_canonical_url ON news_articles(canonical_url);
+"""
+
+# 이전 버전 DB 파일에 추가할 컬럼 (자연 키)
+MIGRATIONS = {
+    "trending_repos": {"collected_date": "TEXT"},
+    "news_articles": {"canonical_url": "TEXT"},
+}
+
+
+class SQLiteClient:
+    """
+    SQLite 데이터베이스 클라이언트 (SupabaseClient와 동일한 인터페이스)
+
+    Args:
+        path: DB 파일 경로 (':memory:'면 메모리 전용)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            from config.settings import settings
+
+            path = settings.sqlite_path
+        try:
+            if path != ":memory:":
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            # 알림 전송 등 다른 스레드에서도 사용할 수 있도록 잠금으로 보호
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._lock = threading.Lock()
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._migrate()
+            self._conn.executescript(INDEXES)
+            logger.info(f"SQLite 클라이언트 초기화 완료: {path}")
+        except Exception as e:
+            logger.error(f"SQLite 클라이언트 초기화 실패: {e}")
+            raise
+
+    # ==================== Helpers ====================
+
+    def _migrate(self) -> None:
+        """기존 테이블에 없는 컬럼 추가 (기존 행의 키는 NULL로 남아 UNIQUE에 걸리지 않음)"""
+        for table, columns in MIGRATIONS.items():
+            existing = {row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+            for column, column_type in columns.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat()
+
+    @staticmethod
+    def _encode(row: Dict[str, Any]) -> Dict[str, Any]:
+        encoded = {}
+        for key, value in row.items():
+            if key in JSON_COLUMNS and value is not None:
+                value = json.dumps(value, ensure_ascii=False)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            encoded[key] = value
+        return encoded
+
+    @staticmethod
+    def _decode(row: sqlite3.Row) -> Dict[str, Any]:
+        decoded = dict(row)
+        for key in JSON_COLUMNS & decoded.keys():
+            if decoded[key] is not None:
+                decoded[key] = json.loads(decoded[key])
+        return decoded
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._decode(row) for row in rows]
+
+    def _insert_many(self, table: str, rows: List[Dict[str, Any]]) -> None:
+        """같은 컬럼 구성의 행끼리 묶어 executemany로 삽입"""
+        now = self._now()
+        groups: Dict[tuple, List[tuple]] = {}
+        for row in rows:
+            row = self._encode({"collected_at": now, **row, "created_at": now})
+            row.pop("id", None)
+            columns = tuple(row)
+            groups.setdefault(columns, []).append(tuple(row.values()))
+
+        with self._lock, self._conn:
+            for columns, values in groups.items():
+                self._conn.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    values,
+                )
+
+    # ==================== Trending Repos ====================
+
+    def insert_trending_repos(self, repos: List[Dict[str, Any]]) -> bool:
+        """트렌딩 저장소 삽입"""
+        try:
+            self._insert_many("trending_repos", repos)
+            logger.info(f"{len(repos)}개의 트렌딩 저장소를 저장했습니다.")
+            return True
+        except Exception as e:
+            logger.error(f"트렌딩 저장소 저장 실패: {e}")
+            return False
+
+    def get_trending_repos(
+        self, limit: int = 25, language: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """트렌딩 저장소 조회"""
+        try:
+            if language:
+                return self._query(
+                    "SELECT * FROM trending_repos WHERE language = ? "
+                    "ORDER BY collected_at DESC LIMIT ?",
+                    (language, limit),
+                )
+            return self._query(
+                "SELECT * FROM trending_repos ORDER BY collected_at DESC LIMIT ?", (limit,)
+            )
+        except Exception as e:
+            logger.error(f"트렌딩 저장소 조회 실패: {e}")
+            return []
+
+    def update_repo_ai_analysis(
+        self, repo_id: int, ai_data: Dict[str, Any]
+    ) -> bool:
+        """저장소 AI 분석 결과 업데이트"""
+        try:
+            data = self._encode(ai_data)
+            assignments = ", ".join(f"{column} = ?" for column in data)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    f"UPDATE trending_repos SET {assignments} WHERE id = ?",
+                    (*data.values(), repo_id),
+                )
+            logger.info(f"저장소 {repo_id} AI 분석 결과 업데이트 완료")
+            return True
+        except Exception as e:
+            logger.error(f"AI 분석 결과 업데이트 실패: {e}")
+            return False
+
+    def upsert_trending_repos(
+        self, repos: List[Dict[str, Any]], chunk_size: int = 500
+    ) -> Dict[str, int]:
+        """트렌딩 저장소 upsert (저장소명 + 수집 날짜 기준)"""
+        return self._upsert("trending_repos", repos, chunk_size)
+
+    # ==================== News Articles ====================
+
+    def insert_news_articles(self, articles: List[Dict[str, Any]]) -> bool:
+        """뉴스 기사 삽입"""
+        try:
+            self._insert_many("news_articles", articles)
+            logger.info(f"{len(articles)}개의 뉴스 기사를 저장했습니다.")
+            return True
+        except Exception as e:
+            logger.error(f"뉴스 기사 저장 실패: {e}")
+            return False
+
+    def get_news_articles(
+        self, limit: int = 50, source: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """뉴스 기사 조회"""
+        try:
+            if source:
+                return self._query(
+                    "SELECT * FROM news_articles WHERE source = ? "
+                    "ORDER BY collected_at DESC LIMIT ?",
+                    (source, limit),
+                )
+            return self._query(
+                "SELECT * FROM news_articles ORDER BY collected_at DESC LIMIT ?", (limit,)
+            )
+        except Exception as e:
+            logger.error(f"뉴스 기사 조회 실패: {e}")
+            return []
+
+    def upsert_news_articles(
+        self, articles: List[Dict[str, Any]], chunk_size: int = 500
+    ) -> Dict[str, int]:
+        """뉴스 기사 upsert (정규화된 URL 기준)"""
+        return self._upsert("news_articles", articles, chunk_size)
+
+    def _upsert(
+        self, table: str, rows: List[Dict[str, Any]], chunk_size: int
+    ) -> Dict[str, int]:
+        """
+        자연 키 기준 upsert
+
+        Returns:
+            {"inserted": 추가 수, "updated": 갱신 수, "failed": 실패 수}
+        """
+        key_columns = NATURAL_KEYS[table]
+        counts = {"inserted": 0, "updated": 0, "failed": 0}
+        now = self._now()
+
+        rows = [{"collected_at": now, **row} for row in rows]
+        for chunk in chunked(prepare_rows(table, rows), chunk_size):
+            try:
+                with self._lock, self._conn:
+                    existing = self._existing_keys(table, chunk)
+                    for columns, group in group_by_columns(chunk).items():
+                        columns = (*columns, "created_at")
+                        updates = ", ".join(
+                            f"{column} = excluded.{column}"
+                            for column in columns
+                            if column not in key_columns and column != "created_at"
+                        )
+                        self._conn.executemany(
+                            f"INSERT INTO {table} ({', '.join(columns)}) "
+                            f"VALUES ({', '.join('?' * len(columns))}) "
+                            f"ON CONFLICT({', '.join(key_columns)}) DO UPDATE SET {updates}",
+                            [
+                                tuple(self._encode({**row, "created_at": now})[c] for c in columns)
+                                for row in group
+                            ],
+                        )
+                updated = sum(1 for row in chunk if natural_key(table, row) in existing)
+                counts["updated"] += updated
+                counts["inserted"] += len(chunk) - updated
+            except Exception as e:
+                logger.error(f"{table} upsert 실패: {e}")
+                counts["failed"] += len(chunk)
+
+        logger.info(
+            f"{table} 저장: 추가 {counts['inserted']}개, 갱신 {counts['updated']}개, "
+            f"실패 {counts['failed']}개"
+        )
+        return counts
+
+    def _existing_keys(self, table: str, rows: List[Dict[str, Any]]) -> set:
+        """이미 저장된 자연 키 조회 (잠금을 잡은 상태에서 호출)"""
+        key_columns = NATURAL_KEYS[table]
+        placeholder = "(" + ", ".join("?" * len(key_columns)) + ")"
+        params = [value for row in rows for value in natural_key(table, row)]
+        return {
+            tuple(row)
+            for row in self._conn.execute(
+                f"SELECT {', '.join(key_columns)} FROM {table} "
+                f"WHERE ({', '.join(key_columns)}) IN (VALUES {', '.join([placeholder] * len(rows))})",
+                params,
+            )
+        }
+
+    def backfill_canonical_urls(self, dry_run: bool = False) -> Dict[str, int]:
+        """
+        canonical_url이 비어 있는 기존 기사 행 채우기 (plan_canonical_backfill 참고)
+
+        Returns:
+            {"updated": 갱신 행 수, "deleted": 삭제한 중복 행 수}
+        """
+        rows = self._query("SELECT id, url, canonical_url FROM news_articles")
+        if not any(row["canonical_url"] is None for row in rows):
+            return {"updated": 0, "deleted": 0}
+        updates, duplicates = plan_canonical_backfill(rows)
+        if not dry_run:
+            with self._lock, self._conn:
+                for chunk in chunked(duplicates, 500):
+                    self._conn.execute(
+                        f"DELETE FROM news_articles WHERE id IN ({', '.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                self._conn.executemany(
+                    "UPDATE news_articles SET canonical_url = ? WHERE id = ?",
+                    [(canonical, row_id) for row_id, canonical in updates.items()],
+                )
+        logger.info(f"canonical_url 채우기: 갱신 {len(updates)}개, 중복 삭제 {len(duplicates)}개")
+        return {"updated": len(updates), "deleted": len(duplicates)}
+
+    # ==================== Daily Digests ====================
+
+    def insert_or_update_daily_digest(self, digest: Dict[str, Any]) -> bool:
+        """일일 다이제스트 삽입 또는 업데이트 (digest_date 기준)"""
+        try:
+            row = self._encode({**digest, "created_at": self._now()})
+            row.pop("id", None)
+            columns = list(row)
+            updates = ", ".join(
+                f"{column} = excluded.{column}"
+                for column in columns
+                if column not in ("digest_date", "created_at")
+            )
+            with self._lock, self._conn:
+                self._conn.execute(
+                    f"INSERT INTO daily_digests ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))}) "
+                    f"ON CONFLICT(digest_date) DO UPDATE SET {updates}",
+                    tuple(row.values()),
+                )
+            logger.info(f"일일 다이제스트 저장 완료: {digest.get('digest_date')}")
+            return True
+        except Exception as e:
+            logger.error(f"일일 다이제스트 저장 실패: {e}")
+            return False
+
+    def get_daily_digest(self, date: str) -> Optional[Dict[str, Any]]:
+        """특정 날짜의 다이제스트 조회"""
+        try:
+            rows = self._query("SELECT * FROM daily_digests WHERE digest_date = ?", (date,))
+            return rows[0] if rows else None
+        except Exception as e:
+            logger.error(f"일일 다이제스트 조회 실패: {e}")
+            return None
+
+    def get_latest_digest(self) -> Optional[Dict[str, Any]]:
+        """최신 다이제스트 조회"""
+        try:
+            rows = self._query("SELECT * FROM daily_digests ORDER BY digest_date DESC LIMIT 1")
+            return rows[0] if rows else None
+        except Exception as e:
+            logger.error(f"최신 다이제스트 조회 실패: {e}")
+            return None
+
+    # ==================== AI Cache ====================
+
+    def get_cached_ai_analysis(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        """캐시된 AI 분석 결과 조회 (동일 저장소명 기준)"""
+        try:
+            rows = self._query(
+                "SELECT ai_summary, ai_use_cases, ai_difficulty, ai_related_tech "
+                "FROM trending_repos WHERE name = ? AND ai_summary IS NOT NULL "
+                "ORDER BY collected_at DESC LIMIT 1",
+                (repo_name,),
+            )
+            if rows and rows[0].get("ai_summary"):
+                logger.info(f"캐시된 AI 분석 결과 사용: {repo_name}")
+                return rows[0]
+            return None
+        except Exception as e:
+            logger.error(f"AI 분석 캐시 조회 실패: {e}")
+            return None
+
+    def get_cached_ai_analyses(
+        self, repo_names: List[str], chunk_size: int = 500
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 저장소의 캐시된 AI 분석 결과를 한 번에 조회
+
+        Returns:
+            {저장소명: 분석 결과} (캐시가 없는 저장소는 제외)
+        """
+        names = list(dict.fromkeys(repo_names))
+        cached: Dict[str, Dict[str, Any]] = {}
+        try:
+            for start in range(0, len(names), chunk_size):
+                chunk = names[start:start + chunk_size]
+                rows = self._query(
+                    "SELECT name, ai_summary, ai_use_cases, ai_difficulty, ai_related_tech "
+                    f"FROM trending_repos WHERE name IN ({', '.join('?' * len(chunk))}) "
+                    "AND ai_summary IS NOT NULL ORDER BY collected_at DESC",
+                    tuple(chunk),
+                )
+                for row in rows:
+                    name = row.pop("name")
+                    if row.get("ai_summary") and name not in cached:
+                        cached[name] = row
+
+            logger.info(f"캐시된 AI 분석 결과 {len(cached)}/{len(names)}개 조회")
+            return cached
+        except Exception as e:
+            logger.error(f"AI 분석 캐시 일괄 조회 실패: {e}")
+            return cached
+
+    def get_digests_by_date_range(
+        self, start_date: str, end_date: str
+    ) -> List[Dict[str, Any]]:
+        """날짜 범위로 다이제스트 조회"""
+        try:
+            return self._query(
+                "SELECT * FROM daily_digests WHERE digest_date BETWEEN ? AND ? "
+                "ORDER BY digest_date DESC",
+                (start_date, end_date),
+            )
+        except Exception as e:
+            logger.error(f"다이제스트 범위 조회 실패: {e}")
+            return []
+
+    def get_all_digest_dates(self) -> List[str]:
+        """모든 다이제스트 날짜 목록 조회"""
+        try:
+            rows = self._query("SELECT digest_date FROM daily_digests ORDER BY digest_date DESC")
+            return [row["digest_date"] for row in rows]
+        except Exception as e:
+            logger.error(f"다이제스트 날짜 목록 조회 실패: {e}")
+            return []
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
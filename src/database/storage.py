@@ -0,0 +1,56 @@
+"""
+저장소 선택
+설정에 따라 SupabaseClient 또는 SQLiteClient를 생성합니다.
+두 클라이언트는 같은 메서드를 제공하므로 호출하는 쪽은 구분하지 않아도 됩니다.
+"""
+from typing import Optional, Union
+import logging
+from .sqlite_client import SQLiteClient
+
+logger = logging.getLogger(__name__)
+
+STORAGE_BACKENDS = ("auto", "supabase", "sqlite")
+
+
+def create_storage(backend: Optional[str] = None) -> Union["SupabaseClient", SQLiteClient]:
+    """
+    저장소 클라이언트 생성
+
+    Args:
+        backend: 'supabase', 'sqlite' 또는 'auto' (기본: settings.storage_backend).
+            'auto'는 Supabase URL/키가 설정되어 있으면 Supabase, 아니면 SQLite
+            (SQLite로 대체되면 경고, settings.environment가 'production'이면 오류)
+
+    Returns:
+        SupabaseClient 또는 SQLiteClient
+
+    Raises:
+        ValueError: 지원하지 않는 저장소이거나, 운영 환경에서 Supabase 설정이 없을 때
+    """
+    from config.settings import settings
+
+    backend = (backend or settings.storage_backend).lower()
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"지원하지 않는 저장소입니다: {backend}")
+
+    if backend == "auto":
+        if settings.supabase_url and settings.supabase_key:
+            backend = "supabase"
+        elif settings.environment.lower() == "production":
+            raise ValueError(
+                "운영 환경에서 Supabase 설정(SUPABASE_URL/SUPABASE_KEY)이 없습니다. "
+                "SQLite를 쓰려면 STORAGE_BACKEND=sqlite로 명시하세요."
+            )
+        else:
+            logger.warning(
+                f"Supabase 설정이 없어 로컬 SQLite를 사용합니다: {settings.sqlite_path}"
+            )
+            backend = "sqlite"
+
+    if backend == "sqlite":
+        return SQLiteClient(settings.sqlite_path)
+
+    # supabase 패키지는 사용할 때만 import
+    from .supabase_client import SupabaseClient
+
+    return SupabaseClient()
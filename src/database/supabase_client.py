@@ -6,6 +6,14 @@ from supabase import create_client, Client
 from typing import List, Dict, Any, Optional
 import logging
 from config.settings import settings
+from .natural_keys import (
+    NATURAL_KEYS,
+    chunked,
+    group_by_columns,
+    natural_key,
+    plan_canonical_backfill,
+    prepare_rows,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +82,12 @@ class SupabaseClient:
             logger.error(f"AI 분석 결과 업데이트 실패: {e}")
             return False
 
+    def upsert_trending_repos(
+        self, repos: List[Dict[str, Any]], chunk_size: int = 500
+    ) -> Dict[str, int]:
+        """트렌딩 저장소 upsert (저장소명 + 수집 날짜 기준)"""
+        return self._upsert("trending_repos", repos, chunk_size)
+
     # ==================== News Articles ====================
 
     def insert_news_articles(self, articles: List[Dict[str, Any]]) -> bool:
@@ -107,6 +121,105 @@ class SupabaseClient:
             logger.error(f"뉴스 기사 조회 실패: {e}")
             return []
 
+    def upsert_news_articles(
+        self, articles: List[Dict[str, Any]], chunk_size: int = 500
+    ) -> Dict[str, int]:
+        """뉴스 기사 upsert (정규화된 URL 기준)"""
+        return self._upsert("news_articles", articles, chunk_size)
+
+    def _upsert(
+        self, table: str, rows: List[Dict[str, Any]], chunk_size: int
+    ) -> Dict[str, int]:
+        """
+        자연 키 기준 upsert
+
+        chunk_size개씩 나눠 저장하며, 청크마다 기존 키를 한 번 조회하여
+        새로 추가/갱신된 행 수를 계산합니다.
+
+        Returns:
+            {"inserted": 추가 수, "updated": 갱신 수, "failed": 실패 수}
+        """
+        key_columns = NATURAL_KEYS[table]
+        counts = {"inserted": 0, "updated": 0, "failed": 0}
+
+        for chunk in chunked(prepare_rows(table, rows), chunk_size):
+            try:
+                existing = self._existing_keys(table, chunk)
+                for group in group_by_columns(chunk).values():
+                    (
+                        self.client.table(table)
+                        .upsert(group, on_conflict=",".join(key_columns))
+                        .execute()
+                    )
+                updated = sum(1 for row in chunk if natural_key(table, row) in existing)
+                counts["updated"] += updated
+                counts["inserted"] += len(chunk) - updated
+            except Exception as e:
+                logger.error(f"{table} upsert 실패: {e}")
+                counts["failed"] += len(chunk)
+
+        logger.info(
+            f"{table} 저장: 추가 {counts['inserted']}개, 갱신 {counts['updated']}개, "
+            f"실패 {counts['failed']}개"
+        )
+        return counts
+
+    def _existing_keys(self, table: str, rows: List[Dict[str, Any]]) -> set:
+        """이미 저장된 자연 키 조회 (첫 키 컬럼은 in 필터, 나머지는 eq 필터)"""
+        first, *rest = NATURAL_KEYS[table]
+        groups: Dict[tuple, List[Any]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row[column] for column in rest), []).append(row[first])
+
+        existing = set()
+        for rest_values, values in groups.items():
+            query = self.client.table(table).select(",".join((first, *rest))).in_(first, values)
+            for column, value in zip(rest, rest_values):
+                query = query.eq(column, value)
+            for row in query.execute().data or []:
+                existing.add(natural_key(table, row))
+        return existing
+
+    def backfill_canonical_urls(
+        self, dry_run: bool = False, page_size: int = 1000
+    ) -> Dict[str, int]:
+        """
+        canonical_url이 비어 있는 기존 기사 행 채우기 (plan_canonical_backfill 참고)
+
+        add_natural_keys.sql의 컬럼 추가 후, UNIQUE 제약 추가 전에 실행합니다.
+
+        Returns:
+            {"updated": 갱신 행 수, "deleted": 삭제한 중복 행 수}
+        """
+        rows: List[Dict[str, Any]] = []
+        while True:
+            page = (
+                self.client.table("news_articles")
+                .select("id,url,canonical_url")
+                .order("id")
+                .range(len(rows), len(rows) + page_size - 1)
+                .execute()
+                .data
+                or []
+            )
+            rows.extend(page)
+            if len(page) < page_size:
+                break
+
+        updates, duplicates = plan_canonical_backfill(rows)
+        if not dry_run:
+            for chunk in chunked(duplicates, 100):
+                self.client.table("news_articles").delete().in_("id", chunk).execute()
+            for row_id, canonical in updates.items():
+                (
+                    self.client.table("news_articles")
+                    .update({"canonical_url": canonical})
+                    .eq("id", row_id)
+                    .execute()
+                )
+        logger.info(f"canonical_url 채우기: 갱신 {len(updates)}개, 중복 삭제 {len(duplicates)}개")
+        return {"updated": len(updates), "deleted": len(duplicates)}
+
     # ==================== Daily Digests ====================
 
     def insert_or_update_daily_digest(self, digest: Dict[str, Any]) -> bool:
@@ -177,6 +290,41 @@ class SupabaseClient:
             logger.error(f"AI 분석 캐시 조회 실패: {e}")
             return None
 
+    def get_cached_ai_analyses(
+        self, repo_names: List[str], chunk_size: int = 100
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 저장소의 캐시된 AI 분석 결과를 한 번에 조회
+
+        저장소명 chunk_size개씩 `in` 필터로 묶어 조회하며,
+        저장소마다 가장 최근 분석 결과만 반환합니다.
+
+        Returns:
+            {저장소명: 분석 결과} (캐시가 없는 저장소는 제외)
+        """
+        names = list(dict.fromkeys(repo_names))
+        cached: Dict[str, Dict[str, Any]] = {}
+        try:
+            for start in range(0, len(names), chunk_size):
+                response = (
+                    self.client.table("trending_repos")
+                    .select("name, ai_summary, ai_use_cases, ai_difficulty, ai_related_tech")
+                    .in_("name", names[start:start + chunk_size])
+                    .not_.is_("ai_summary", "null")
+                    .order("collected_at", desc=True)
+                    .execute()
+                )
+                for row in response.data or []:
+                    name = row.pop("name")
+                    if row.get("ai_summary") and name not in cached:
+                        cached[name] = row
+
+            logger.info(f"캐시된 AI 분석 결과 {len(cached)}/{len(names)}개 조회")
+            return cached
+        except Exception as e:
+            logger.error(f"AI 분석 캐시 일괄 조회 실패: {e}")
+            return cached
+
     def get_digests_by_date_range(
         self, start_date: str, end_date: str
     ) -> List[Dict[str, Any]]:
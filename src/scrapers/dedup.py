@@ -0,0 +1,324 @@
+"""
+유사 중복 기사 탐지
+URL 정규화와 MinHash LSH 인덱스로 소스가 달라도 같은 이야기인 기사를 찾습니다.
+인덱스는 SQLite 파일에 보관되어 여러 날에 걸쳐 유지됩니다.
+"""
+import hashlib
+import random
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+import logging
+from .models import NewsArticle
+from ..utils.url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# 단어 토큰 ('3.14', '1.0' 같은 버전 번호는 한 토큰으로 유지)
+_TOKEN = re.compile(r"\w+(?:\.\w+)*", re.UNICODE)
+_NUMBER = re.compile(r"\d")
+# 소스마다 붙거나 빠지는 제목 접두어
+_TITLE_PREFIX = re.compile(r"^\s*(show|ask|launch|tell)\s+hn\s*[:\-–]\s*", re.IGNORECASE)
+
+
+def _hash32(value: str) -> int:
+    """프로세스와 무관하게 안정적인 32비트 해시"""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 단어 토큰 ('Show HN:' 같은 접두어 제외, 숫자/버전 번호 유지)"""
+    return _TOKEN.findall(_TITLE_PREFIX.sub("", text).lower())
+
+
+def shingles(text: str) -> Set[str]:
+    """
+    단어 1-gram + 2-gram 집합
+
+    문자 n-gram과 달리 '3.14'와 '3.15', 'SQLite'와 'Postgres'가 서로 다른
+    토큰이 되므로 한 단어만 다른 제목도 유사도가 충분히 떨어집니다.
+    """
+    tokens = tokenize(text)
+    return set(tokens) | {f"{left} {right}" for left, right in zip(tokens, tokens[1:])}
+
+
+def numbers(text: str) -> FrozenSet[str]:
+    """제목의 숫자 토큰 (버전/연도가 다르면 다른 기사로 판정)"""
+    return frozenset(token for token in tokenize(text) if _NUMBER.search(token))
+
+
+def url_host(url: str) -> str:
+    """'www.'를 제외한 호스트"""
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class MinHasher:
+    """고정 시드 MinHash (디스크에 저장된 서명과 호환되도록 계수 고정)"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 42):
+        self.num_perm = num_perm
+        rng = random.Random(seed)
+        self._a = [rng.randint(1, _MERSENNE_PRIME - 1) for _ in range(num_perm)]
+        self._b = [rng.randint(0, _MERSENNE_PRIME - 1) for _ in range(num_perm)]
+
+    def signature(self, features: Set[str]) -> Tuple[int, ...]:
+        """특징 집합의 MinHash 서명"""
+        if not features:
+            return tuple([_MAX_HASH] * self.num_perm)
+        hashes = [_hash32(feature) for feature in features]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    @staticmethod
+    def similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        """서명으로 추정한 Jaccard 유사도"""
+        matches = sum(1 for x, y in zip(left, right) if x == y)
+        return matches / len(left)
+
+
+@dataclass
+class DuplicateMatch:
+    """중복 판정 결과"""
+    doc_id: str
+    similarity: float
+    matched_doc: str = ""
+
+
+class NearDuplicateIndex:
+    """
+    MinHash LSH 유사 중복 인덱스
+
+    서명을 bands개 구간으로 나눠 구간별 버킷에 저장하고, 버킷이 하나라도
+    겹치는 문서만 후보로 비교합니다. 기사 n개 클러스터링이 O(n)에 가깝게
+    동작합니다.
+
+    제목의 숫자 토큰이 다르면 유사도와 관계없이 다른 기사로 봅니다. 기사 호스트가
+    다르면(소스 간 중복) 같은 호스트보다 엄격한 cross_host_threshold를 적용합니다.
+
+    Args:
+        path: SQLite 파일 경로 (':memory:'면 메모리 전용)
+        threshold: 같은 호스트에서 중복으로 볼 추정 Jaccard 유사도
+        cross_host_threshold: 호스트가 다르거나 없을 때 중복으로 볼 추정 Jaccard 유사도
+        num_perm: MinHash 서명 길이
+        bands: LSH 구간 수 (num_perm의 약수)
+        retention_days: 인덱스 보관 기간 (일)
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/dedup_index.db",
+        threshold: float = 0.8,
+        cross_host_threshold: float = 0.9,
+        num_perm: int = 64,
+        bands: int = 16,
+        retention_days: int = 7,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.threshold = threshold
+        self.cross_host_threshold = max(threshold, cross_host_threshold)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.retention_days = retention_days
+        self.hasher = MinHasher(num_perm)
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS dedup_docs (
+                doc_id TEXT PRIMARY KEY,
+                cluster_id TEXT NOT NULL,
+                title TEXT,
+                host TEXT NOT NULL DEFAULT '',
+                signature TEXT NOT NULL,
+                seen_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS dedup_bands (
+                band INTEGER NOT NULL,
+                bucket TEXT NOT NULL,
+                doc_id TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_dedup_bands ON dedup_bands (band, bucket);
+            CREATE INDEX IF NOT EXISTS idx_dedup_docs_seen ON dedup_docs (seen_at);
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(dedup_docs)")}
+        if "host" not in columns:
+            # 이전 버전 인덱스: 호스트가 없는 문서는 cross_host_threshold로 비교됨
+            self._conn.execute("ALTER TABLE dedup_docs ADD COLUMN host TEXT NOT NULL DEFAULT ''")
+        self.prune()
+
+    def _buckets(self, signature: Tuple[int, ...]) -> List[str]:
+        return [
+            hashlib.blake2b(
+                ",".join(map(str, signature[band * self.rows:(band + 1) * self.rows])).encode(),
+                digest_size=8,
+            ).hexdigest()
+            for band in range(self.bands)
+        ]
+
+    def signature_for(self, article: NewsArticle) -> Tuple[int, ...]:
+        """제목 + 요약 기반 서명 (요약은 'Posted by ...' 같은 메타 정보 제외)"""
+        text = article.title
+        if article.summary and not article.summary.startswith("Posted by "):
+            text = f"{text} {article.summary}"
+        return self.hasher.signature(shingles(text))
+
+    def find(
+        self,
+        signature: Tuple[int, ...],
+        exclude: Optional[str] = None,
+        title: str = "",
+        host: str = "",
+    ) -> Optional[DuplicateMatch]:
+        """
+        가장 유사한 기존 문서
+
+        숫자 토큰이 다르면 제외하고, 호스트가 다르거나 없으면
+        cross_host_threshold 이상이어야 합니다 (없으면 None).
+        """
+        buckets = self._buckets(signature)
+        conditions = " OR ".join(["(band = ? AND bucket = ?)"] * self.bands)
+        params = [value for band, bucket in enumerate(buckets) for value in (band, bucket)]
+        rows = self._conn.execute(
+            f"""
+            SELECT DISTINCT d.doc_id, d.cluster_id, d.title, d.host, d.signature FROM dedup_bands b
+            JOIN dedup_docs d ON d.doc_id = b.doc_id
+            WHERE {conditions}
+            """,
+            params,
+        ).fetchall()
+
+        best: Optional[DuplicateMatch] = None
+        title_numbers = numbers(title)
+        for doc_id, cluster_id, stored_title, stored_host, stored in rows:
+            if doc_id == exclude:
+                continue
+            similarity = self.hasher.similarity(
+                signature, tuple(int(v) for v in stored.split(","))
+            )
+            if similarity < self.threshold or (best is not None and similarity <= best.similarity):
+                continue
+            cross_host = not host or stored_host != host
+            if cross_host and similarity < self.cross_host_threshold:
+                continue
+            if numbers(stored_title or "") != title_numbers:
+                logger.debug(
+                    f"유사 제목이지만 다른 기사로 판정: {title[:40]} / {(stored_title or '')[:40]} "
+                    f"(유사도 {similarity:.2f})"
+                )
+                continue
+            best = DuplicateMatch(doc_id=cluster_id, similarity=similarity, matched_doc=doc_id)
+        return best
+
+    def add(
+        self,
+        doc_id: str,
+        title: str,
+        signature: Tuple[int, ...],
+        cluster_id: str,
+        host: str = "",
+    ) -> None:
+        """문서 추가 (이미 있으면 마지막 확인 시각만 갱신)"""
+        now = time.time()
+        with self._conn:
+            updated = self._conn.execute(
+                "UPDATE dedup_docs SET seen_at = ? WHERE doc_id = ?", (now, doc_id)
+            ).rowcount
+            if updated:
+                return
+            self._conn.execute(
+                "INSERT INTO dedup_docs (doc_id, cluster_id, title, host, signature, seen_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (doc_id, cluster_id, title, host, ",".join(map(str, signature)), now),
+            )
+            self._conn.executemany(
+                "INSERT INTO dedup_bands (band, bucket, doc_id) VALUES (?, ?, ?)",
+                [(band, bucket, doc_id) for band, bucket in enumerate(self._buckets(signature))],
+            )
+
+    def contains(self, doc_id: str) -> bool:
+        return (
+            self._conn.execute("SELECT 1 FROM dedup_docs WHERE doc_id = ?", (doc_id,)).fetchone()
+            is not None
+        )
+
+    def prune(self) -> int:
+        """보관 기간이 지난 문서 삭제"""
+        cutoff = time.time() - self.retention_days * 86400
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM dedup_bands WHERE doc_id IN (SELECT doc_id FROM dedup_docs WHERE seen_at < ?)",
+                (cutoff,),
+            )
+            return self._conn.execute("DELETE FROM dedup_docs WHERE seen_at < ?", (cutoff,)).rowcount
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class ArticleDeduplicator:
+    """
+    기사 중복 제거 단계
+
+    1) 정규화된 URL이 같으면 중복
+    2) 제목/요약의 MinHash 유사도가 threshold(호스트가 다르면
+       cross_host_threshold) 이상이고 숫자 토큰이 같은 다른 기사가 인덱스에
+       있으면 중복 (이전 실행에서 본 기사 포함)
+
+    같은 기사(같은 정규화 URL)를 다시 보는 것은 중복으로 치지 않으므로
+    같은 날 재실행해도 기사가 사라지지 않습니다.
+    """
+
+    def __init__(self, index: Optional[NearDuplicateIndex] = None):
+        self.index = index or NearDuplicateIndex(":memory:")
+        # 마지막 실행의 클러스터 ({정규화 URL: 클러스터 대표 URL})
+        self.clusters: Dict[str, str] = {}
+
+    def is_duplicate(self, article: NewsArticle, seen_urls: Set[str]) -> bool:
+        """기사가 중복인지 판정하고, 아니면 인덱스에 등록"""
+        doc_id = canonicalize_url(article.url) or article.title
+        if doc_id in seen_urls:
+            return True
+        seen_urls.add(doc_id)
+
+        signature = self.index.signature_for(article)
+        host = url_host(article.url)
+        match = (
+            None
+            if self.index.contains(doc_id)
+            else self.index.find(signature, exclude=doc_id, title=article.title, host=host)
+        )
+        if match is not None:
+            self.clusters[doc_id] = match.doc_id
+            logger.info(
+                f"유사 중복 기사 제외: {article.title[:40]} ({doc_id}) → {match.matched_doc} "
+                f"(유사도 {match.similarity:.2f})"
+            )
+            return True
+
+        self.clusters[doc_id] = doc_id
+        self.index.add(doc_id, article.title, signature, cluster_id=doc_id, host=host)
+        return False
+
+    def deduplicate(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        """중복을 제외한 기사 목록 (입력 순서 유지)"""
+        seen_urls: Set[str] = set()
+        self.clusters = {}
+        unique = [article for article in articles if not self.is_duplicate(article, seen_urls)]
+
+        removed = len(articles) - len(unique)
+        if removed:
+            logger.info(f"{removed}개의 중복/유사 기사를 제거했습니다.")
+        return unique
@@ -2,12 +2,14 @@
 GeekNews 스크래퍼
 한국어 기술 뉴스를 수집합니다.
 """
-from bs4 import BeautifulSoup
-from typing import List
+import asyncio
+from contextlib import aclosing
+from typing import AsyncIterator, List, Optional
 import logging
 from datetime import datetime
-from .models import NewsArticle
+from .models import ArticleRecord
 from ..utils.http_client import HTTPClient
+from ..utils.html_parser import HTMLParser, RowStreamParser
 
 logger = logging.getLogger(__name__)
 
@@ -17,26 +19,33 @@ class GeekNewsScraper:
 
     BASE_URL = "https://news.hada.io"
 
-    def __init__(self):
-        self.client = HTTPClient()
+    def __init__(
+        self,
+        client: Optional[HTTPClient] = None,
+        parser: Optional[HTMLParser] = None,
+    ):
+        self.client = client or HTTPClient()
+        self.parser = parser or HTMLParser()
 
-    def scrape(self, limit: int = 10) -> List[NewsArticle]:
+    async def scrape(self, limit: int = 10, stream: bool = False) -> List[ArticleRecord]:
         """
         GeekNews에서 최신 뉴스를 수집합니다.
 
         Args:
             limit: 최대 기사 수
+            stream: True면 페이지를 스트리밍으로 받으며 파싱 (HTTP 캐시 미사용)
 
         Returns:
-            NewsArticle 리스트
+            ArticleRecord 리스트 (검증은 저장/출력 직전에 to_articles로)
         """
         try:
             logger.info(f"GeekNews 수집 시작 (최대 {limit}개)")
 
-            response = self.client.get_sync(self.BASE_URL)
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            articles = self._parse_articles(soup, limit)
+            if stream:
+                articles = [article async for article in self.iter_articles(limit)]
+            else:
+                response = await self.client.get(self.BASE_URL)
+                articles = self._parse_articles(response.text, limit)
 
             logger.info(f"총 {len(articles)}개의 기사를 수집했습니다.")
             return articles
@@ -45,13 +54,42 @@ class GeekNewsScraper:
             logger.error(f"GeekNews 스크래핑 실패: {e}")
             return []
 
-    def _parse_articles(self, soup: BeautifulSoup, limit: int) -> List[NewsArticle]:
-        """기사 목록 파싱"""
+    async def iter_articles(self, limit: int = 10) -> AsyncIterator[ArticleRecord]:
+        """
+        페이지를 스트리밍으로 받으며 기사가 완성되는 대로 반환합니다.
+        limit개를 만들면 남은 본문은 읽지 않고 연결을 닫습니다.
+        """
+        if limit <= 0:
+            return
+        row_parser = RowStreamParser("div", "topic_row", self.parser)
+        count = 0
+
+        # 중간에 return해도 스트림 제너레이터를 즉시 닫아 연결 반환
+        async with aclosing(self.client.iter_text(self.BASE_URL)) as chunks:
+            async for chunk in chunks:
+                for elem in row_parser.feed(chunk):
+                    try:
+                        article = self._parse_single_article(elem)
+                    except Exception as e:
+                        logger.warning(f"기사 파싱 중 오류: {e}")
+                        continue
+                    if article:
+                        yield article
+                        count += 1
+                        if count >= limit:
+                            return
+
+    def scrape_sync(self, limit: int = 10) -> List[ArticleRecord]:
+        """동기 버전의 scrape"""
+        return asyncio.run(self.scrape(limit))
+
+    def _parse_articles(self, html: str, limit: int) -> List[ArticleRecord]:
+        """기사 목록 파싱 (검증 전 레코드)"""
         articles = []
 
         # GeekNews의 기사 목록 찾기
         # 실제 HTML 구조에 맞춰 셀렉터를 조정해야 할 수 있습니다
-        article_elements = soup.find_all("div", class_="topic_row")[:limit]
+        article_elements = self.parser.parse_rows(html, "div", "topic_row", limit)
 
         for elem in article_elements:
             try:
@@ -64,7 +102,7 @@ class GeekNewsScraper:
 
         return articles
 
-    def _parse_single_article(self, elem) -> NewsArticle:
+    def _parse_single_article(self, elem) -> ArticleRecord:
         """단일 기사 파싱"""
         # 제목과 링크
         title_elem = elem.find("h1", class_="topictitle")
@@ -86,7 +124,7 @@ class GeekNewsScraper:
             except (ValueError, AttributeError):
                 score = 0
 
-        return NewsArticle(
+        return ArticleRecord(
             title=title,
             url=link,
             source="GeekNews",
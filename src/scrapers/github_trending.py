@@ -2,29 +2,65 @@
 GitHub Trending 스크래퍼
 GitHub Trending 페이지에서 저장소 정보를 수집합니다.
 """
-from bs4 import BeautifulSoup
-from typing import List, Optional
+import asyncio
+from contextlib import aclosing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 import logging
-from .models import TrendingRepository
+from .models import (
+    RepositoryRecord,
+    TrendingCrawlResult,
+    TrendingRepository,
+    to_repositories,
+)
 from ..utils.http_client import HTTPClient
+from ..utils.html_parser import HTMLParser, RowStreamParser
 
 logger = logging.getLogger(__name__)
 
 
 class GitHubTrendingScraper:
-    """GitHub Trending 스크래퍼"""
+    """
+    GitHub Trending 스크래퍼
+
+    파이프라인 단계(scrape, iter_repositories)는 가벼운 RepositoryRecord를
+    반환하고 검증은 저장/출력 직전에 합니다. 단독으로 쓰는 진입점(scrape_sync,
+    crawl)은 결과를 바로 쓸 수 있도록 검증된 TrendingRepository로 반환합니다.
+    """
 
     BASE_URL = "https://github.com/trending"
 
-    def __init__(self):
-        self.client = HTTPClient()
+    # 다중 수집 기본 대상 (None은 전체 언어)
+    DEFAULT_LANGUAGES: Tuple[Optional[str], ...] = (
+        None, "python", "javascript", "typescript", "go", "rust", "java", "kotlin",
+        "swift", "c++", "c", "c#", "ruby", "php", "dart", "scala", "shell",
+        "jupyter-notebook", "html", "lua",
+    )
+    DEFAULT_PERIODS: Tuple[str, ...] = ("daily", "weekly", "monthly")
+
+    def __init__(
+        self,
+        client: Optional[HTTPClient] = None,
+        parser: Optional[HTMLParser] = None,
+    ):
+        self.client = client or HTTPClient()
+        self.parser = parser or HTMLParser()
+        # crawl이 executor 없이 호출될 때 쓰는 파싱 프로세스 풀 (첫 crawl에서 생성, close에서 종료)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def close(self) -> None:
+        """스크래퍼가 만든 파싱 프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
-    def scrape(
+    async def scrape(
         self,
         language: Optional[str] = None,
         since: str = "daily",
         limit: int = 25,
-    ) -> List[TrendingRepository]:
+        stream: bool = False,
+    ) -> List[RepositoryRecord]:
         """
         GitHub Trending 저장소를 스크래핑합니다.
 
@@ -32,22 +68,23 @@ class GitHubTrendingScraper:
             language: 프로그래밍 언어 필터 (예: 'python', 'javascript')
             since: 기간 ('daily', 'weekly', 'monthly')
             limit: 최대 저장소 수
+            stream: True면 페이지를 스트리밍으로 받으며 파싱 (HTTP 캐시 미사용)
 
         Returns:
-            TrendingRepository 리스트
+            RepositoryRecord 리스트 (검증은 저장/출력 직전에 to_repositories로)
         """
         try:
-            url = self.BASE_URL
-            if language:
-                url = f"{url}/{language.lower()}"
-
+            url = self._build_url(language)
             params = {"since": since}
 
             logger.info(f"GitHub Trending 수집 시작: {url} (since={since})")
-            response = self.client.get_sync(url, params=params)
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            repos = self._parse_repositories(soup, limit)
+            if stream:
+                repos = [
+                    repo async for repo in self.iter_repositories(language, since, limit)
+                ]
+            else:
+                response = await self.client.get(url, params=params)
+                repos = self._parse_repositories(response.text, limit)
 
             logger.info(f"총 {len(repos)}개의 저장소를 수집했습니다.")
             return repos
@@ -56,12 +93,151 @@ class GitHubTrendingScraper:
             logger.error(f"GitHub Trending 스크래핑 실패: {e}")
             return []
 
-    def _parse_repositories(
-        self, soup: BeautifulSoup, limit: int
+    async def iter_repositories(
+        self,
+        language: Optional[str] = None,
+        since: str = "daily",
+        limit: int = 25,
+    ) -> AsyncIterator[RepositoryRecord]:
+        """
+        페이지를 스트리밍으로 받으며 저장소가 완성되는 대로 반환합니다.
+        limit개를 만들면 남은 본문은 읽지 않고 연결을 닫습니다.
+        """
+        if limit <= 0:
+            return
+        row_parser = RowStreamParser("article", "Box-row", self.parser)
+        count = 0
+
+        # 중간에 return해도 스트림 제너레이터를 즉시 닫아 연결 반환
+        async with aclosing(
+            self.client.iter_text(self._build_url(language), params={"since": since})
+        ) as chunks:
+            async for chunk in chunks:
+                for article in row_parser.feed(chunk):
+                    repo = self._parse_single_repo(article)
+                    if repo:
+                        yield repo
+                        count += 1
+                        if count >= limit:
+                            return
+
+    def _build_url(self, language: Optional[str] = None) -> str:
+        """언어 필터를 반영한 트렌딩 URL"""
+        if language:
+            return f"{self.BASE_URL}/{language.lower()}"
+        return self.BASE_URL
+
+    async def crawl(
+        self,
+        languages: Optional[Sequence[Optional[str]]] = None,
+        periods: Optional[Sequence[str]] = None,
+        limit: int = 25,
+        executor: Optional[Executor] = None,
+        max_workers: int = 4,
+    ) -> TrendingCrawlResult:
+        """
+        여러 언어 × 기간의 트렌딩 페이지를 한 번에 수집합니다.
+
+        페이지는 공유 연결 풀로 동시에 받고, 받은 페이지부터 워커 풀에서
+        파싱한 뒤 저장소 이름 기준으로 병합합니다.
+
+        Args:
+            languages: 언어 목록 (None 항목은 전체 언어, 기본: DEFAULT_LANGUAGES)
+            periods: 기간 목록 (기본: daily/weekly/monthly)
+            limit: 페이지당 최대 저장소 수
+            executor: 파싱에 사용할 Executor (기본: 스크래퍼가 소유한 프로세스 풀)
+            max_workers: 기본 프로세스 풀 크기 (풀을 처음 만들 때만 적용)
+
+        Returns:
+            TrendingCrawlResult (저장소는 병합 후 검증된 TrendingRepository)
+        """
+        languages = list(self.DEFAULT_LANGUAGES if languages is None else languages)
+        periods = list(self.DEFAULT_PERIODS if periods is None else periods)
+        pages = [(language, since) for language in languages for since in periods]
+        logger.info(f"GitHub Trending 다중 수집 시작: {len(pages)}개 페이지")
+
+        if executor is None:
+            # 호출마다 프로세스를 띄우지 않도록 스크래퍼 수명 동안 재사용
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=max_workers)
+            executor = self._executor
+
+        results = await asyncio.gather(
+            *[
+                self._crawl_page(language, since, limit, executor)
+                for language, since in pages
+            ]
+        )
+
+        result = self._merge_pages(results)
+        logger.info(
+            f"총 {len(result.repositories)}개의 고유 저장소를 수집했습니다 "
+            f"(실패 페이지 {len(result.failed_pages)}개)."
+        )
+        return result
+
+    async def _crawl_page(
+        self,
+        language: Optional[str],
+        since: str,
+        limit: int,
+        executor: Executor,
+    ) -> Tuple[str, Optional[List[RepositoryRecord]]]:
+        """페이지 하나를 받아 워커 풀에서 파싱 (실패 시 None, 레코드는 가볍게 전달)"""
+        page_key = f"{(language or 'all').lower()}:{since}"
+        try:
+            response = await self.client.get(self._build_url(language), params={"since": since})
+
+            loop = asyncio.get_running_loop()
+            repos = await loop.run_in_executor(
+                executor, parse_trending_page, response.text, limit, self.parser.backend
+            )
+            return page_key, repos
+        except Exception as e:
+            logger.warning(f"트렌딩 페이지 수집 실패: {page_key} - {e}")
+            return page_key, None
+
+    @staticmethod
+    def _merge_pages(
+        pages: List[Tuple[str, Optional[List[RepositoryRecord]]]]
+    ) -> TrendingCrawlResult:
+        """페이지별 결과를 저장소 이름 기준으로 병합 (병합 후 한 번에 모델로 변환)"""
+        result = TrendingCrawlResult()
+        unique = {}
+
+        for page_key, repos in pages:
+            if repos is None:
+                result.failed_pages.append(page_key)
+                continue
+            result.page_counts[page_key] = len(repos)
+            for rank, repo in enumerate(repos, start=1):
+                unique.setdefault(repo.name, repo)
+                result.ranks.setdefault(repo.name, {})[page_key] = rank
+
+        result.repositories = to_repositories(
+            sorted(
+                unique.values(),
+                key=lambda repo: (min(result.ranks[repo.name].values()), -repo.stars),
+            )
+        )
+        return result
+
+    def scrape_sync(
+        self,
+        language: Optional[str] = None,
+        since: str = "daily",
+        limit: int = 25,
     ) -> List[TrendingRepository]:
-        """저장소 목록 파싱"""
+        """동기 버전의 scrape (검증된 TrendingRepository 리스트)"""
+        return to_repositories(asyncio.run(self.scrape(language, since, limit)))
+
+    def _parse_repositories(
+        self, html: str, limit: int
+    ) -> List[RepositoryRecord]:
+        """저장소 목록 파싱 (검증 전 레코드)"""
         repos = []
-        articles = soup.find_all("article", class_="Box-row")[:limit]
+        # 대상 행의 하위 트리만 파싱
+        articles = self.parser.parse_rows(html, "article", "Box-row", limit)
 
         for article in articles:
             try:
@@ -74,7 +250,7 @@ class GitHubTrendingScraper:
 
         return repos
 
-    def _parse_single_repo(self, article) -> Optional[TrendingRepository]:
+    def _parse_single_repo(self, article) -> Optional[RepositoryRecord]:
         """단일 저장소 파싱"""
         try:
             # 저장소 이름과 URL
@@ -123,7 +299,7 @@ class GitHubTrendingScraper:
                 forks_text = forks_elem.parent.get_text(strip=True)
                 forks = self._parse_number(forks_text)
 
-            return TrendingRepository(
+            return RepositoryRecord(
                 name=name,
                 description=description,
                 url=url,
@@ -147,3 +323,11 @@ class GitHubTrendingScraper:
             return int(text)
         except (ValueError, AttributeError):
             return 0
+
+
+def parse_trending_page(
+    html: str, limit: int, backend: Optional[str] = None
+) -> List[RepositoryRecord]:
+    """트렌딩 페이지 HTML 파싱 (프로세스 풀에서 실행할 수 있도록 모듈 함수로 제공)"""
+    scraper = GitHubTrendingScraper(parser=HTMLParser(backend))
+    return scraper._parse_repositories(html, limit)
@@ -3,11 +3,15 @@ Hacker News 스크래퍼
 Hacker News API를 사용하여 뉴스를 수집합니다.
 """
 import asyncio
-from typing import List, Optional
+import time
+from typing import List, Optional, Dict, Any
 import logging
 from datetime import datetime
-from .models import NewsArticle
+from .models import ArticleRecord
+from .hn_item_loader import HNItemLoader
+from .hn_store import HNStoryStore
 from ..utils.http_client import HTTPClient
+from ..utils.url_utils import canonicalize_url, hn_item_url
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +21,31 @@ class HackerNewsScraper:
 
     BASE_URL = "https://hacker-news.firebaseio.com/v0"
 
-    def __init__(self):
-        self.client = HTTPClient()
-
-    async def scrape(self, limit: int = 10) -> List[NewsArticle]:
+    def __init__(
+        self,
+        client: Optional[HTTPClient] = None,
+        concurrency: int = 20,
+        item_ttl: float = 600.0,
+        store: Optional[HNStoryStore] = None,
+        max_staleness: float = 6 * 3600,
+    ):
+        """
+        Args:
+            client: 공유 HTTP 클라이언트
+            concurrency: 아이템 동시 요청 수
+            item_ttl: 프로세스 내 아이템 캐시 TTL (초)
+            store: 지정하면 증분 모드로 동작 (로컬 스토리 테이블 + 체크포인트)
+            max_staleness: 증분 모드에서 변경 알림이 없어도 재조회하는 주기 (초)
+        """
+        self.client = client or HTTPClient()
+        self.loader = HNItemLoader(self.client, concurrency=concurrency, ttl=item_ttl)
+        self.store = store
+        self.max_staleness = max_staleness
+        self.last_run_stats: Dict[str, int] = {}
+        # 외부 링크 기사의 HN 토론 페이지 ({정규화된 대상 URL: 토론 URL})
+        self.item_urls: Dict[str, str] = {}
+
+    async def scrape(self, limit: int = 10) -> List[ArticleRecord]:
         """
         Hacker News Top Stories를 수집합니다.
 
@@ -28,7 +53,7 @@ class HackerNewsScraper:
             limit: 최대 기사 수
 
         Returns:
-            NewsArticle 리스트
+            ArticleRecord 리스트 (검증은 저장/출력 직전에 to_articles로)
         """
         try:
             logger.info(f"Hacker News Top Stories 수집 시작 (최대 {limit}개)")
@@ -38,16 +63,17 @@ class HackerNewsScraper:
             response = await self.client.get(top_stories_url)
             story_ids = response.json()[:limit]
 
-            # 각 스토리 상세 정보 가져오기
+            # 스토리 상세 정보를 배치로 가져오기 (캐시/동시성 제한은 로더가 담당)
+            if self.store is not None:
+                items = await self._load_incremental(story_ids)
+            else:
+                items = await self.loader.load_many(story_ids)
             articles = []
-            tasks = [self._fetch_story(story_id) for story_id in story_ids]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, NewsArticle):
-                    articles.append(result)
-                elif isinstance(result, Exception):
-                    logger.warning(f"스토리 가져오기 실패: {result}")
+            for story_id in story_ids:
+                article = self._to_article(story_id, items.get(story_id))
+                if article:
+                    self._remember_item(story_id, article)
+                    articles.append(article)
 
             logger.info(f"총 {len(articles)}개의 기사를 수집했습니다.")
             return articles
@@ -56,39 +82,107 @@ class HackerNewsScraper:
             logger.error(f"Hacker News 스크래핑 실패: {e}")
             return []
 
-    async def _fetch_story(self, story_id: int) -> Optional[NewsArticle]:
-        """단일 스토리 가져오기"""
-        try:
-            story_url = f"{self.BASE_URL}/item/{story_id}.json"
-            response = await self.client.get(story_url)
-            data = response.json()
-
-            if not data or data.get("type") != "story":
-                return None
-
-            title = data.get("title", "")
-            url = data.get("url", f"https://news.ycombinator.com/item?id={story_id}")
-            score = data.get("score", 0)
-            author = data.get("by", "")
-            timestamp = data.get("time", 0)
-
-            published_at = None
-            if timestamp:
-                published_at = datetime.fromtimestamp(timestamp)
-
-            return NewsArticle(
-                title=title,
-                summary=f"Posted by {author}" if author else None,
-                url=url,
-                source="Hacker News",
-                score=score,
-                published_at=published_at,
+    async def _load_incremental(self, story_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        증분 모드 아이템 조회
+
+        다음 아이템만 다시 가져오고 나머지는 로컬 사본을 사용합니다.
+        - 로컬 스토리 테이블에 없는 아이템
+        - 지난 체크포인트의 maxitem 이후에 생긴 아이템
+        - 변경된 아이템: 이번 updates.json + 지난 실행까지 변경 알림을 받았지만
+          아직 다시 가져오지 않은 아이템 (updates.json은 최근 변경만 담으므로
+          체크포인트에 누적해 둠)
+        - max_staleness보다 오래된 아이템
+        """
+        checkpoint = self.store.get_checkpoint()
+        previous_max = checkpoint["max_item"] if checkpoint else 0
+        changed = set(checkpoint.get("changed_ids", [])) if checkpoint else set()
+        max_item = previous_max
+
+        if checkpoint is not None:
+            updates, max_item_response = await asyncio.gather(
+                self.client.get(f"{self.BASE_URL}/updates.json"),
+                self.client.get(f"{self.BASE_URL}/maxitem.json"),
             )
+            changed.update((updates.json() or {}).get("items", []))
+            max_item = max_item_response.json() or max_item
+
+        stored = self.store.get_items(story_ids)
+        now = time.time()
+        to_fetch = [
+            story_id
+            for story_id in story_ids
+            if story_id not in stored
+            or story_id in changed
+            or (checkpoint is not None and story_id > previous_max)
+            or now - stored[story_id][1] > self.max_staleness
+        ]
+
+        # 변경된 아이템은 프로세스 내 캐시도 건너뛰고 새로 가져옴
+        self.loader.invalidate(changed.intersection(to_fetch))
+        fetched = await self.loader.load_many(to_fetch) if to_fetch else {}
+        if fetched:
+            self.store.upsert_items(fetched)
+        if checkpoint is None:
+            max_item = max(story_ids, default=0)
+        # 이번에 다시 가져오지 못한 변경 아이템은 다음 실행으로 넘김 (저장된 것만)
+        pending = self.store.existing_ids(changed.difference(fetched))
+        self.store.save_checkpoint(max_item, sorted(pending))
+
+        self.last_run_stats = {
+            "requested_items": len(to_fetch),
+            "reused_items": len(story_ids) - len(to_fetch),
+            "changed_items": len(changed.intersection(story_ids)),
+        }
+        logger.info(
+            f"HN 증분 수집: {len(to_fetch)}개 조회, {len(story_ids) - len(to_fetch)}개 로컬 사용"
+        )
+
+        items = {story_id: data for story_id, (data, _) in stored.items()}
+        items.update(fetched)
+        return items
+
+    def _remember_item(self, story_id: int, article: ArticleRecord) -> None:
+        """기사 URL과 HN 토론 페이지의 대응 관계 기록"""
+        item_url = hn_item_url(story_id)
+        if canonicalize_url(article.url) != item_url:
+            self.item_urls[canonicalize_url(article.url)] = item_url
+
+    def aliases(self, article: ArticleRecord) -> List[str]:
+        """
+        같은 기사를 가리키는 다른 URL
 
-        except Exception as e:
-            logger.error(f"스토리 {story_id} 가져오기 실패: {e}")
+        다른 소스가 외부 링크 대신 HN 토론 페이지를 링크해도
+        같은 기사로 인식할 수 있도록 토론 URL을 함께 반환합니다.
+        """
+        item_url = self.item_urls.get(canonicalize_url(article.url))
+        return [item_url] if item_url else []
+
+    @staticmethod
+    def _to_article(story_id: int, data: Optional[Dict[str, Any]]) -> Optional[ArticleRecord]:
+        """아이템 JSON을 레코드로 변환 (스토리가 아니면 None)"""
+        if not data or data.get("type") != "story":
             return None
 
-    def scrape_sync(self, limit: int = 10) -> List[NewsArticle]:
+        title = data.get("title", "")
+        url = data.get("url", hn_item_url(story_id))
+        score = data.get("score", 0)
+        author = data.get("by", "")
+        timestamp = data.get("time", 0)
+
+        published_at = None
+        if timestamp:
+            published_at = datetime.fromtimestamp(timestamp)
+
+        return ArticleRecord(
+            title=title,
+            summary=f"Posted by {author}" if author else None,
+            url=url,
+            source="Hacker News",
+            score=score,
+            published_at=published_at,
+        )
+
+    def scrape_sync(self, limit: int = 10) -> List[ArticleRecord]:
         """동기 버전의 scrape"""
         return asyncio.run(self.scrape(limit))
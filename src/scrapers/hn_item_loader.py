@@ -0,0 +1,157 @@
+"""
+Hacker News 아이템 배치 로더
+동시 요청 수를 제한하면서 여러 아이템을 가져오고, 아이템 JSON을
+프로세스 내에 TTL 캐시로 보관합니다.
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+from ..utils.http_client import HTTPClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedItem:
+    """캐시된 아이템 JSON"""
+    data: Dict[str, Any]
+    fetched_at: float
+    ttl: float
+
+    def is_fresh(self, now: float) -> bool:
+        return now - self.fetched_at < self.ttl
+
+
+class HNItemLoader:
+    """
+    Hacker News 아이템 배치 로더
+
+    - concurrency개 이하의 요청만 동시에 실행 (동시에 호출된 load_many 전체 기준)
+    - 같은 id에 대한 진행 중 요청은 하나로 합침
+    - 아이템 JSON을 ttl초 동안 캐시하되, 다시 가져왔을 때 직전 조회 대비
+      점수가 score_delta 이상 변한 아이템은 hot_ttl초만 캐시
+
+    asyncio 동기화 객체는 이벤트 루프에 묶이므로 루프가 바뀌면
+    세마포어와 진행 중 요청 목록을 새로 만듭니다.
+    """
+
+    BASE_URL = "https://hacker-news.firebaseio.com/v0"
+
+    def __init__(
+        self,
+        client: HTTPClient,
+        concurrency: int = 20,
+        ttl: float = 600.0,
+        hot_ttl: float = 60.0,
+        score_delta: int = 10,
+    ):
+        self.client = client
+        self.concurrency = concurrency
+        self.ttl = ttl
+        self.hot_ttl = hot_ttl
+        self.score_delta = score_delta
+        self._cache: Dict[int, CachedItem] = {}
+        self._inflight: Dict[int, asyncio.Future] = {}
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {"hits": 0, "fetched": 0, "deduped": 0, "failed": 0}
+
+    def _ensure_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None:
+                self._semaphore = asyncio.Semaphore(self.concurrency)
+                self._inflight.clear()
+            self._loop = loop
+
+    async def load(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """단일 아이템 조회"""
+        return (await self.load_many([item_id])).get(item_id)
+
+    async def load_many(self, item_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        여러 아이템을 조회합니다.
+
+        Args:
+            item_ids: 아이템 id 목록 (중복 허용)
+
+        Returns:
+            {id: 아이템 JSON} (조회 실패/삭제된 아이템은 제외)
+        """
+        self._ensure_loop()
+        now = time.time()
+        results: Dict[int, Dict[str, Any]] = {}
+        to_fetch: List[int] = []
+        waiting: Dict[int, asyncio.Future] = {}
+
+        for item_id in dict.fromkeys(item_ids):
+            cached = self._cache.get(item_id)
+            if cached and cached.is_fresh(now):
+                self.stats["hits"] += 1
+                results[item_id] = cached.data
+            elif item_id in self._inflight:
+                self.stats["deduped"] += 1
+                waiting[item_id] = self._inflight[item_id]
+            else:
+                to_fetch.append(item_id)
+
+        loop = asyncio.get_running_loop()
+        for item_id in to_fetch:
+            self._inflight[item_id] = loop.create_future()
+            waiting[item_id] = self._inflight[item_id]
+
+        if to_fetch:
+            await asyncio.gather(*[self._fetch(item_id) for item_id in to_fetch])
+
+        for item_id, future in waiting.items():
+            data = await future
+            if data:
+                results[item_id] = data
+
+        return results
+
+    async def _fetch(self, item_id: int) -> None:
+        """아이템 하나를 가져와 캐시에 저장하고 대기 중인 요청에 결과 전달"""
+        future = self._inflight[item_id]
+        data = None
+        try:
+            async with self._semaphore:
+                response = await self.client.get(f"{self.BASE_URL}/item/{item_id}.json")
+            data = response.json()
+            self.stats["fetched"] += 1
+            if data:
+                self._store(item_id, data)
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error(f"아이템 {item_id} 가져오기 실패: {e}")
+        finally:
+            self._inflight.pop(item_id, None)
+            if not future.done():
+                future.set_result(data)
+
+    def _store(self, item_id: int, data: Dict[str, Any]) -> None:
+        """점수 변화량에 따라 TTL을 정해 캐시에 저장"""
+        ttl = self.ttl
+        previous = self._cache.get(item_id)
+        if previous is not None:
+            delta = abs(data.get("score", 0) - previous.data.get("score", 0))
+            if delta >= self.score_delta:
+                ttl = self.hot_ttl
+        self._cache[item_id] = CachedItem(data=data, fetched_at=time.time(), ttl=ttl)
+
+    def invalidate(self, item_ids: Iterable[int]) -> None:
+        """
+        지정한 아이템을 만료 처리
+
+        점수 변화량 비교를 위해 데이터는 남겨두고 TTL만 0으로 만듭니다.
+        """
+        for item_id in item_ids:
+            cached = self._cache.get(item_id)
+            if cached is not None:
+                cached.ttl = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시/요청 통계 조회"""
+        return {**self.stats, "cached_items": len(self._cache)}
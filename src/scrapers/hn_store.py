@@ -0,0 +1,100 @@
+"""
+Hacker News 로컬 스토리 저장소
+증분 수집을 위해 아이템 JSON과 체크포인트(maxitem, 변경 아이템 목록)를
+SQLite 파일에 보관합니다.
+"""
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class HNStoryStore:
+    """SQLite 기반 Hacker News 아이템 저장소"""
+
+    def __init__(self, path: str = ".cache/hn_items.db"):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS hn_items (
+                id INTEGER PRIMARY KEY,
+                data TEXT NOT NULL,
+                score INTEGER,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS hn_checkpoint (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+
+    def get_items(self, item_ids: Iterable[int]) -> Dict[int, Tuple[Dict[str, Any], float]]:
+        """{id: (아이템 JSON, 저장 시각)} 조회"""
+        ids = list(item_ids)
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        rows = self._conn.execute(
+            f"SELECT id, data, fetched_at FROM hn_items WHERE id IN ({placeholders})",
+            ids,
+        ).fetchall()
+        return {row[0]: (json.loads(row[1]), row[2]) for row in rows}
+
+    def existing_ids(self, item_ids: Iterable[int]) -> List[int]:
+        """저장되어 있는 id만 반환"""
+        ids = list(item_ids)
+        if not ids:
+            return []
+        placeholders = ",".join("?" * len(ids))
+        rows = self._conn.execute(
+            f"SELECT id FROM hn_items WHERE id IN ({placeholders})", ids
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def upsert_items(self, items: Dict[int, Dict[str, Any]]) -> int:
+        """아이템 저장/갱신 후 저장한 개수 반환"""
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO hn_items (id, data, score, fetched_at) VALUES (?, ?, ?, ?)",
+                [
+                    (item_id, json.dumps(data), data.get("score"), now)
+                    for item_id, data in items.items()
+                ],
+            )
+        return len(items)
+
+    def get_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """마지막 체크포인트 조회 (없으면 None)"""
+        row = self._conn.execute(
+            "SELECT value FROM hn_checkpoint WHERE key = 'hn'"
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_checkpoint(self, max_item: int, changed_ids: List[int]) -> None:
+        """
+        체크포인트 저장
+
+        Args:
+            max_item: 마지막 실행 시점의 maxitem (이후 id는 새 아이템)
+            changed_ids: 변경 알림을 받았지만 아직 다시 가져오지 않은 저장 아이템
+        """
+        value = json.dumps(
+            {"max_item": max_item, "changed_ids": changed_ids, "saved_at": time.time()}
+        )
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hn_checkpoint (key, value) VALUES ('hn', ?)",
+                (value,),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
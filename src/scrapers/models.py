@@ -1,10 +1,18 @@
 """
 데이터 모델 정의
 Pydantic 모델을 사용하여 데이터 구조를 정의합니다.
+
+수집/랭킹 단계에서는 검증 비용이 없는 가벼운 레코드(__slots__ dataclass)를
+사용하고, 저장/출력 직전에 to_repositories/to_articles로 한 번에
+Pydantic 모델로 변환(검증)합니다.
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from dataclasses import dataclass, field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
 from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class TrendingRepository(BaseModel):
@@ -43,6 +51,22 @@ class NewsArticle(BaseModel):
     )
 
 
+class TrendingCrawlResult(BaseModel):
+    """여러 언어/기간 GitHub Trending 수집 결과 모델"""
+
+    repositories: List[TrendingRepository] = Field(
+        default_factory=list, description="중복 제거된 저장소 목록 (최고 순위 순)"
+    )
+    ranks: Dict[str, Dict[str, int]] = Field(
+        default_factory=dict,
+        description="저장소별 페이지 순위 ({name: {'python:daily': 1, ...}})",
+    )
+    page_counts: Dict[str, int] = Field(
+        default_factory=dict, description="페이지별 수집 저장소 수"
+    )
+    failed_pages: List[str] = Field(default_factory=list, description="수집 실패 페이지")
+
+
 class DailyDigest(BaseModel):
     """일일 다이제스트 모델"""
 
@@ -67,3 +91,86 @@ class DailyDigest(BaseModel):
     )
 
     created_at: datetime = Field(default_factory=datetime.now, description="생성 시간")
+
+
+# ==================== 내부 레코드 ====================
+
+@dataclass(slots=True)
+class RepositoryRecord:
+    """수집 단계용 저장소 레코드 (필드는 TrendingRepository와 동일)"""
+
+    name: str
+    url: str
+    description: Optional[str] = None
+    language: Optional[str] = None
+    stars: int = 0
+    stars_today: int = 0
+    forks: int = 0
+    collected_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(slots=True)
+class ArticleRecord:
+    """수집/랭킹 단계용 기사 레코드 (필드는 NewsArticle과 동일)"""
+
+    title: str
+    url: str
+    source: str
+    summary: Optional[str] = None
+    category: Optional[str] = None
+    score: Optional[int] = None
+    published_at: Optional[datetime] = None
+    collected_at: datetime = field(default_factory=datetime.now)
+
+
+_REPOSITORY_LIST = TypeAdapter(List[TrendingRepository])
+_ARTICLE_LIST = TypeAdapter(List[NewsArticle])
+
+
+def _as_dicts(records: Iterable[Any], names: Iterable[str]) -> List[Dict[str, Any]]:
+    # from_attributes 검증보다 dict 목록 검증이 빠름
+    return [{name: getattr(record, name) for name in names} for record in records]
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _validate_rows(
+    adapter: TypeAdapter, model: Type[ModelT], rows: List[Dict[str, Any]]
+) -> List[ModelT]:
+    """목록을 한 번에 검증하고, 실패하면 행 단위로 다시 검증해 잘못된 행만 제외"""
+    try:
+        return adapter.validate_python(rows)
+    except ValidationError:
+        pass
+
+    valid = []
+    for row in rows:
+        try:
+            valid.append(model.model_validate(row))
+        except ValidationError as e:
+            logger.warning(
+                f"{model.__name__} 검증 실패로 제외: {row.get('url')} "
+                f"({e.error_count()}개 오류: {e.errors()[0]['loc']})"
+            )
+    return valid
+
+
+def to_repositories(records: Iterable[Any]) -> List[TrendingRepository]:
+    """
+    레코드(또는 같은 속성을 가진 객체) 목록을 검증하여 TrendingRepository로 변환
+
+    검증에 실패한 행은 경고를 남기고 제외합니다.
+    """
+    return _validate_rows(
+        _REPOSITORY_LIST, TrendingRepository, _as_dicts(records, RepositoryRecord.__slots__)
+    )
+
+
+def to_articles(records: Iterable[Any]) -> List[NewsArticle]:
+    """
+    레코드(또는 같은 속성을 가진 객체) 목록을 검증하여 NewsArticle로 변환
+
+    검증에 실패한 행은 경고를 남기고 제외합니다.
+    """
+    return _validate_rows(_ARTICLE_LIST, NewsArticle, _as_dicts(records, ArticleRecord.__slots__))
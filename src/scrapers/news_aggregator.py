@@ -3,30 +3,196 @@
 여러 뉴스 소스를 통합하여 관리합니다.
 """
 import asyncio
-from typing import List
+import time
+from typing import AsyncIterator, Dict, List, Optional, Any
 import logging
-from .models import NewsArticle
-from .hacker_news import HackerNewsScraper
-from .geeknews import GeekNewsScraper
-from .yozm_it import YozmITScraper
+from .models import ArticleRecord, NewsArticle
+from .hn_store import HNStoryStore
+from .dedup import ArticleDeduplicator
+from .seen_index import SeenArticleIndex
+from .registry import build_scrapers, get_source
+from ..utils.http_client import HTTPClient
+from ..utils.url_utils import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SOURCES = ["hacker_news", "geeknews", "yozm_it"]
+
 
 class NewsAggregator:
     """뉴스 통합 수집기"""
 
-    def __init__(self):
-        self.hacker_news = HackerNewsScraper()
-        self.geeknews = GeekNewsScraper()
-        self.yozm_it = YozmITScraper()
+    def __init__(
+        self,
+        client: Optional[HTTPClient] = None,
+        hn_store: Optional[HNStoryStore] = None,
+        sources: Optional[List[str]] = None,
+        source_timeout: float = 60.0,
+        deduplicator: Optional[ArticleDeduplicator] = None,
+        seen_index: Optional[SeenArticleIndex] = None,
+    ):
+        """
+        Args:
+            client: 모든 소스가 공유하는 HTTP 클라이언트
+            hn_store: 지정하면 Hacker News를 증분 모드로 수집
+            sources: 사용할 소스 이름 목록 (기본: DEFAULT_SOURCES, registry 참고)
+            source_timeout: 소스별 기본 제한 시간 (초)
+            deduplicator: 지정하면 제목/요약 유사도 기반 중복 제거도 수행
+            seen_index: 지정하면 이전 날짜에 이미 수집한 기사를 제외
+        """
+        # 모든 소스가 하나의 연결 풀을 공유
+        self.client = client or HTTPClient()
+        self.source_timeout = source_timeout
+        self.deduplicator = deduplicator
+        self.seen_index = seen_index
+        self.scrapers: Dict[str, Any] = build_scrapers(
+            sources or DEFAULT_SOURCES, self.client, hn_store=hn_store
+        )
+        # 마지막 수집의 소스별 결과 ({이름: {"status", "count", "elapsed"}})
+        self.last_report: Dict[str, Dict[str, Any]] = {}
+        # 마지막 수집에서 반환한 기사의 식별 URL ({정규화 URL: 별칭 포함 URL 목록})
+        self._returned_keys: Dict[str, List[str]] = {}
+
+    @property
+    def hacker_news(self):
+        return self.scrapers.get("hacker_news")
+
+    @property
+    def geeknews(self):
+        return self.scrapers.get("geeknews")
+
+    @property
+    def yozm_it(self):
+        return self.scrapers.get("yozm_it")
+
+    async def iter_articles(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[ArticleRecord]:
+        """
+        소스별 수집이 끝나는 순서대로 기사를 반환합니다.
+
+        느린 소스를 기다리지 않고 먼저 끝난 소스의 기사부터 넘겨주며,
+        제한 시간을 넘기거나 실패한 소스는 건너뜁니다(부분 결과).
+        이미 반환한 URL(정규화 기준, HN 토론 페이지 등 별칭 포함)과,
+        deduplicator가 있으면 유사 중복 기사도 다시 반환하지 않습니다.
+        seen_index가 있으면 이전 날짜에 수집한 기사는 요약 등 후속 처리 전에
+        여기서 제외됩니다. 수집 이력 기록은 저장이 끝난 뒤 mark_seen으로 합니다.
+
+        Args:
+            limits: 소스별 기사 수 ({이름: 개수}, 없으면 소스 기본값)
+            timeout: 모든 소스에 적용할 제한 시간 (없으면 소스별 설정/기본값)
+
+        Yields:
+            ArticleRecord (검증 전 레코드, 외부 등록 소스는 NewsArticle일 수 있음)
+        """
+        limits = limits or {}
+        self.last_report = {}
+        self._returned_keys = {}
+        tasks = [
+            asyncio.create_task(self._collect_source(name, scraper, limits, timeout))
+            for name, scraper in self.scrapers.items()
+        ]
+        seen_urls = set()
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                name, articles = await next_done
+                skipped = 0
+                for article in articles:
+                    keys = self._article_keys(name, article)
+                    if self.seen_index is not None and self.seen_index.seen_before(keys):
+                        skipped += 1
+                        continue
+                    if any(key in seen_urls for key in keys[1:]) or self._is_duplicate(
+                        article, seen_urls
+                    ):
+                        continue
+                    seen_urls.update(keys)
+                    if keys:
+                        self._returned_keys[keys[0]] = keys
+                    yield article
+                if self.seen_index is not None:
+                    self.last_report[name]["seen_before"] = skipped
+                if skipped:
+                    logger.info(f"{name}: 이전에 수집한 기사 {skipped}개 제외")
+        finally:
+            # 소비자가 중간에 멈추면 남은 수집 작업 취소
+            for task in tasks:
+                task.cancel()
+
+    def mark_seen(self, articles: List[NewsArticle]) -> None:
+        """
+        저장까지 끝난 기사를 수집 이력에 한 번에 기록
+
+        수집 중에 기록하면 랭킹 상위에 들지 못한 후보나 저장에 실패한 실행의
+        기사까지 다음 날 제외되므로, 저장 성공 후에 호출합니다.
+        """
+        if self.seen_index is None or not articles:
+            return
+        urls: List[str] = []
+        for article in articles:
+            url = canonicalize_url(article.url)
+            urls.extend(self._returned_keys.get(url, [url]))
+        self.seen_index.mark_seen(urls)
+        self.seen_index.save()
+
+    def _article_keys(self, name: str, article: ArticleRecord) -> List[str]:
+        """기사를 식별하는 정규화 URL 목록 (첫 번째가 기사 URL, 나머지는 소스가 알려준 별칭)"""
+        keys = [canonicalize_url(article.url)]
+        aliases = getattr(self.scrapers.get(name), "aliases", None)
+        if aliases is not None:
+            keys.extend(canonicalize_url(url) for url in aliases(article))
+        return [key for key in keys if key]
+
+    def _is_duplicate(self, article: ArticleRecord, seen_urls: set) -> bool:
+        """이번 수집에서 이미 반환한 기사와 중복인지 판정"""
+        if self.deduplicator is not None:
+            return self.deduplicator.is_duplicate(article, seen_urls)
+
+        url = canonicalize_url(article.url)
+        if url in seen_urls:
+            return True
+        seen_urls.add(url)
+        return False
+
+    async def _collect_source(
+        self,
+        name: str,
+        scraper: Any,
+        limits: Dict[str, int],
+        timeout: Optional[float],
+    ):
+        """소스 하나 수집 (제한 시간/실패 시 빈 목록)"""
+        source = get_source(name)
+        limit = limits.get(name, source.default_limit)
+        timeout = timeout or source.timeout or self.source_timeout
+        started = time.monotonic()
+
+        try:
+            articles = await asyncio.wait_for(scraper.scrape(limit), timeout)
+            status = "ok"
+        except asyncio.TimeoutError:
+            logger.error(f"뉴스 소스 제한 시간 초과: {name} ({timeout}초)")
+            articles, status = [], "timeout"
+        except Exception as e:
+            logger.error(f"뉴스 수집 중 오류: {name} - {e}")
+            articles, status = [], "error"
+
+        self.last_report[name] = {
+            "status": status,
+            "count": len(articles),
+            "elapsed": round(time.monotonic() - started, 3),
+        }
+        return name, articles
 
     async def collect_all(
         self,
         hn_limit: int = 10,
         gn_limit: int = 10,
         yozm_limit: int = 10,
-    ) -> List[NewsArticle]:
+    ) -> List[ArticleRecord]:
         """
         모든 소스에서 뉴스를 수집합니다.
 
@@ -36,25 +202,12 @@ class NewsAggregator:
             yozm_limit: 요즘IT 기사 수
 
         Returns:
-            통합된 NewsArticle 리스트
+            통합된 ArticleRecord 리스트 (검증은 저장/출력 직전에 to_articles로)
         """
         logger.info("모든 뉴스 소스에서 수집 시작")
 
-        # 비동기로 여러 소스 수집
-        tasks = [
-            self.hacker_news.scrape(hn_limit),
-            asyncio.to_thread(self.geeknews.scrape, gn_limit),
-            asyncio.to_thread(self.yozm_it.scrape, yozm_limit),
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        all_articles = []
-        for result in results:
-            if isinstance(result, list):
-                all_articles.extend(result)
-            elif isinstance(result, Exception):
-                logger.error(f"뉴스 수집 중 오류: {result}")
+        limits = {"hacker_news": hn_limit, "geeknews": gn_limit, "yozm_it": yozm_limit}
+        all_articles = [article async for article in self.iter_articles(limits)]
 
         # 중복 제거
         all_articles = self._remove_duplicates(all_articles)
@@ -67,19 +220,20 @@ class NewsAggregator:
         hn_limit: int = 10,
         gn_limit: int = 10,
         yozm_limit: int = 10,
-    ) -> List[NewsArticle]:
+    ) -> List[ArticleRecord]:
         """동기 버전의 collect_all"""
         return asyncio.run(self.collect_all(hn_limit, gn_limit, yozm_limit))
 
     @staticmethod
-    def _remove_duplicates(articles: List[NewsArticle]) -> List[NewsArticle]:
-        """URL 기반으로 중복 기사 제거"""
+    def _remove_duplicates(articles: List[ArticleRecord]) -> List[ArticleRecord]:
+        """URL 기반으로 중복 기사 제거 (추적 파라미터 등을 정규화하여 비교)"""
         seen_urls = set()
         unique_articles = []
 
         for article in articles:
-            if article.url not in seen_urls:
-                seen_urls.add(article.url)
+            url = canonicalize_url(article.url)
+            if url not in seen_urls:
+                seen_urls.add(url)
                 unique_articles.append(article)
 
         removed_count = len(articles) - len(unique_articles)
@@ -0,0 +1,130 @@
+"""
+기사 랭킹
+소스마다 단위가 다른 인기도(HN 포인트, GeekNews 투표 수 등)와 발행 시각을
+하나의 점수로 합쳐, 비싼 AI 단계에는 상위 기사만 넘기도록 합니다.
+후보 전체를 NumPy 배열로 한 번에 계산하므로 수천 개도 빠르게 정렬됩니다.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+import logging
+import numpy as np
+from .models import NewsArticle
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourceCalibration:
+    """
+    소스별 보정값
+
+    Args:
+        reference_score: 인기도 1.0에 해당하는 점수 (log 스케일로 정규화)
+        weight: 소스 가중치
+        default_popularity: 점수가 없는 기사의 인기도
+    """
+    reference_score: float = 10.0
+    weight: float = 1.0
+    default_popularity: float = 0.5
+
+
+DEFAULT_CALIBRATION: Dict[str, SourceCalibration] = {
+    "Hacker News": SourceCalibration(reference_score=200.0),
+    "GeekNews": SourceCalibration(reference_score=20.0),
+    "요즘IT": SourceCalibration(weight=0.9),
+}
+
+
+class ArticleRanker:
+    """
+    기사 랭킹
+
+    점수 = 소스 가중치 × 인기도 × 시간 감쇠
+      - 인기도: log1p(점수) / log1p(기준 점수), 1.0에서 상한 (점수 없으면 기본값)
+      - 시간 감쇠: 0.5 ** (경과 시간 / 반감기)
+        발행 시각이 없는 기사(GeekNews, 요즘IT)는 수집 시각이 항상 "방금"이라
+        감쇠를 적용하지 않고, 발행 시각이 있는 후보들의 감쇠 중앙값을 사용합니다
+        (발행 시각이 있는 후보가 없으면 1.0).
+
+    Args:
+        calibration: 소스 이름별 보정값 (없는 소스는 SourceCalibration 기본값)
+        half_life_hours: 시간 감쇠 반감기 (시간)
+    """
+
+    def __init__(
+        self,
+        calibration: Optional[Dict[str, SourceCalibration]] = None,
+        half_life_hours: float = 24.0,
+    ):
+        self.calibration = {**DEFAULT_CALIBRATION, **(calibration or {})}
+        self.half_life_hours = half_life_hours
+
+    @classmethod
+    def from_settings(cls) -> "ArticleRanker":
+        """config.settings의 랭킹 설정으로 생성"""
+        from config.settings import settings
+
+        calibration = {
+            source: SourceCalibration(**values)
+            for source, values in settings.rank_source_calibration.items()
+        }
+        return cls(calibration, half_life_hours=settings.rank_half_life_hours)
+
+    def score(self, articles: List[NewsArticle], now: Optional[datetime] = None) -> np.ndarray:
+        """기사별 점수 배열 (입력 순서)"""
+        if not articles:
+            return np.zeros(0)
+        now = now or datetime.now()
+        default = SourceCalibration()
+        calibrations = [self.calibration.get(article.source, default) for article in articles]
+
+        raw = np.array(
+            [np.nan if article.score is None else article.score for article in articles],
+            dtype=float,
+        )
+        reference = np.array([c.reference_score for c in calibrations], dtype=float)
+        weight = np.array([c.weight for c in calibrations], dtype=float)
+        fallback = np.array([c.default_popularity for c in calibrations], dtype=float)
+        age_hours = np.array(
+            [
+                np.nan if article.published_at is None
+                else (now - article.published_at).total_seconds()
+                for article in articles
+            ],
+            dtype=float,
+        ) / 3600.0
+
+        popularity = np.log1p(np.clip(raw, 0, None)) / np.log1p(reference)
+        popularity = np.where(np.isnan(raw), fallback, np.minimum(popularity, 1.0))
+        undated = np.isnan(age_hours)
+        decay = 0.5 ** (np.clip(np.nan_to_num(age_hours), 0, None) / self.half_life_hours)
+        neutral = float(np.median(decay[~undated])) if (~undated).any() else 1.0
+        decay = np.where(undated, neutral, decay)
+        return weight * popularity * decay
+
+    def rank(
+        self,
+        articles: List[NewsArticle],
+        top_k: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> List[NewsArticle]:
+        """
+        점수 내림차순으로 정렬된 기사 목록
+
+        Args:
+            articles: 후보 기사 (NewsArticle 또는 ArticleRecord)
+            top_k: 상위 몇 개만 반환할지 (없으면 전체)
+            now: 기준 시각 (테스트용)
+        """
+        scores = self.score(articles, now)
+        if top_k is not None and top_k < len(articles):
+            # 상위 k개만 부분 정렬한 뒤 그 안에서 정렬
+            candidates = np.argpartition(-scores, top_k)[:top_k]
+            order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+
+        ranked = [articles[i] for i in order]
+        logger.info(f"기사 {len(articles)}개 중 상위 {len(ranked)}개 선정")
+        return ranked
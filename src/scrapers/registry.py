@@ -0,0 +1,107 @@
+"""
+뉴스 소스 레지스트리
+NewsAggregator가 사용할 뉴스 소스를 이름으로 등록/조회합니다.
+
+외부 패키지는 `daily_news.sources` entry point 그룹에 NewsSource 객체(또는
+NewsSource를 반환하는 함수)를 등록하여 소스를 추가할 수 있습니다.
+"""
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, List, Optional
+import logging
+from ..utils.http_client import HTTPClient
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "daily_news.sources"
+
+
+@dataclass
+class NewsSource:
+    """
+    뉴스 소스 정의
+
+    Args:
+        name: 소스 이름 (설정/로그에서 사용)
+        factory: (HTTPClient, **options) -> 스크래퍼. 스크래퍼는
+            `async scrape(limit) -> List[ArticleRecord]`을 제공해야 함
+            (NewsArticle 등 같은 속성을 가진 객체도 가능)
+        default_limit: 기본 수집 기사 수
+        timeout: 소스별 제한 시간 (초, None이면 집계기 기본값)
+    """
+    name: str
+    factory: Callable[..., Any]
+    default_limit: int = 10
+    timeout: Optional[float] = None
+
+
+_REGISTRY: Dict[str, NewsSource] = {}
+_entry_points_loaded = False
+
+
+def register_source(source: NewsSource) -> NewsSource:
+    """소스 등록 (같은 이름이면 교체)"""
+    _REGISTRY[source.name] = source
+    return source
+
+
+def get_source(name: str) -> NewsSource:
+    """이름으로 소스 조회"""
+    _load_entry_points()
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"등록되지 않은 뉴스 소스: {name}") from None
+
+
+def available_sources() -> List[str]:
+    """등록된 소스 이름 목록"""
+    _load_entry_points()
+    return list(_REGISTRY)
+
+
+def _load_entry_points() -> None:
+    """entry point로 제공된 외부 소스를 한 번만 로드"""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            loaded = entry_point.load()
+            source = loaded if isinstance(loaded, NewsSource) else loaded()
+            register_source(source)
+            logger.info(f"외부 뉴스 소스 등록: {source.name}")
+        except Exception as e:
+            logger.warning(f"뉴스 소스 entry point 로드 실패: {entry_point.name} - {e}")
+
+
+def _register_builtin_sources() -> None:
+    """기본 제공 소스 등록"""
+    from .hacker_news import HackerNewsScraper
+    from .geeknews import GeekNewsScraper
+    from .yozm_it import YozmITScraper
+
+    register_source(
+        NewsSource(
+            name="hacker_news",
+            factory=lambda client, hn_store=None, **_: HackerNewsScraper(client, store=hn_store),
+        )
+    )
+    register_source(
+        NewsSource(name="geeknews", factory=lambda client, **_: GeekNewsScraper(client))
+    )
+    register_source(
+        NewsSource(name="yozm_it", factory=lambda client, **_: YozmITScraper(client))
+    )
+
+
+_register_builtin_sources()
+
+
+def build_scrapers(
+    names: List[str], client: HTTPClient, **options
+) -> Dict[str, Any]:
+    """이름 목록으로 스크래퍼 생성 ({이름: 스크래퍼})"""
+    return {name: get_source(name).factory(client, **options) for name in names}
@@ -0,0 +1,148 @@
+"""
+수집 이력 인덱스
+이전 날짜에 이미 수집한 기사를 걸러내기 위해 정규화된 URL을 날짜와 함께
+보관합니다. 블룸 필터로 처음 보는 URL을 DB 조회 없이 판정하고,
+블룸 필터가 "있을 수도 있음"이라고 할 때만 SQLite 정확 저장소를 확인합니다.
+URL 원문 대신 64비트 해시만 저장하여 크기를 작게 유지합니다.
+"""
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable, List, Optional
+import logging
+from ..utils.bloom import BloomFilter, hash64
+from ..utils.url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+
+def _to_signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)에 맞게 변환"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+class SeenArticleIndex:
+    """
+    날짜별 기사 수집 이력
+
+    Args:
+        path: SQLite 파일 경로 (':memory:'면 메모리 전용)
+        capacity: 블룸 필터 예상 원소 수
+        error_rate: 블룸 필터 오탐률
+        retention_days: 이력 보관 기간 (일)
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/seen_articles.db",
+        capacity: int = 100_000,
+        error_rate: float = 0.01,
+        retention_days: int = 30,
+    ):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS seen_urls (
+                url_hash INTEGER PRIMARY KEY,
+                first_seen TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS seen_meta (
+                key TEXT PRIMARY KEY,
+                value BLOB
+            );
+            """
+        )
+        self.retention_days = retention_days
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.stats = {"bloom_negative": 0, "store_lookups": 0, "seen": 0}
+        self._dirty = False
+        pruned = self.prune()
+        self._load_bloom(force_rebuild=pruned > 0)
+
+    # ==================== Bloom ====================
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+
+    def _load_bloom(self, force_rebuild: bool = False) -> None:
+        """저장된 블룸 필터를 복원하고, 저장소와 맞지 않으면 다시 생성"""
+        rows = dict(
+            self._conn.execute(
+                "SELECT key, value FROM seen_meta WHERE key IN ('bloom', 'bloom_count')"
+            ).fetchall()
+        )
+        if (
+            not force_rebuild
+            and rows.get("bloom") is not None
+            and rows.get("bloom_count") == self._count()
+            and self.bloom.load_bytes(rows["bloom"])
+        ):
+            return
+
+        for (url_hash,) in self._conn.execute("SELECT url_hash FROM seen_urls"):
+            self.bloom.add_hash(url_hash & 0xFFFFFFFFFFFFFFFF)
+        self._dirty = True
+        self.save()
+
+    def save(self) -> None:
+        """블룸 필터를 저장 (저장소 행 수와 함께 기록하여 불일치 감지)"""
+        if not self._dirty:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen_meta (key, value) VALUES (?, ?)",
+                [("bloom", self.bloom.to_bytes()), ("bloom_count", self._count())],
+            )
+        self._dirty = False
+
+    # ==================== Lookup ====================
+
+    def first_seen(self, url: str) -> Optional[date]:
+        """URL을 처음 수집한 날짜 (수집한 적 없으면 None)"""
+        url_hash = hash64(canonicalize_url(url))
+        if not self.bloom.might_contain_hash(url_hash):
+            self.stats["bloom_negative"] += 1
+            return None
+
+        self.stats["store_lookups"] += 1
+        row = self._conn.execute(
+            "SELECT first_seen FROM seen_urls WHERE url_hash = ?", (_to_signed(url_hash),)
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
+
+    def seen_before(self, urls: Iterable[str], today: Optional[date] = None) -> bool:
+        """URL(별칭 포함) 중 하나라도 오늘 이전에 수집한 적이 있는지"""
+        today = today or date.today()
+        for url in urls:
+            seen = self.first_seen(url)
+            if seen is not None and seen < today:
+                self.stats["seen"] += 1
+                return True
+        return False
+
+    def mark_seen(self, urls: Iterable[str], today: Optional[date] = None) -> None:
+        """URL(별칭 포함)을 수집 이력에 추가 (이미 있으면 최초 날짜 유지)"""
+        day = (today or date.today()).isoformat()
+        hashes: List[int] = [hash64(canonicalize_url(url)) for url in urls if url]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_urls (url_hash, first_seen) VALUES (?, ?)",
+                [(_to_signed(url_hash), day) for url_hash in hashes],
+            )
+        for url_hash in hashes:
+            self.bloom.add_hash(url_hash)
+        self._dirty = True
+
+    def prune(self) -> int:
+        """보관 기간이 지난 이력 삭제"""
+        cutoff = (date.today() - timedelta(days=self.retention_days)).isoformat()
+        with self._conn:
+            return self._conn.execute(
+                "DELETE FROM seen_urls WHERE first_seen < ?", (cutoff,)
+            ).rowcount
+
+    def close(self) -> None:
+        self.save()
+        self._conn.close()
@@ -2,11 +2,12 @@
 요즘IT 스크래퍼
 한국어 IT 뉴스를 수집합니다.
 """
-from bs4 import BeautifulSoup
-from typing import List
+import asyncio
+from typing import List, Optional
 import logging
-from .models import NewsArticle
+from .models import ArticleRecord
 from ..utils.http_client import HTTPClient
+from ..utils.html_parser import HTMLParser
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +17,15 @@ class YozmITScraper:
 
     BASE_URL = "https://yozm.wishket.com"
 
-    def __init__(self):
-        self.client = HTTPClient()
+    def __init__(
+        self,
+        client: Optional[HTTPClient] = None,
+        parser: Optional[HTMLParser] = None,
+    ):
+        self.client = client or HTTPClient()
+        self.parser = parser or HTMLParser()
 
-    def scrape(self, limit: int = 10) -> List[NewsArticle]:
+    async def scrape(self, limit: int = 10) -> List[ArticleRecord]:
         """
         요즘IT에서 최신 뉴스를 수집합니다.
 
@@ -27,16 +33,14 @@ class YozmITScraper:
             limit: 최대 기사 수
 
         Returns:
-            NewsArticle 리스트
+            ArticleRecord 리스트 (검증은 저장/출력 직전에 to_articles로)
         """
         try:
             logger.info(f"요즘IT 수집 시작 (최대 {limit}개)")
 
             url = f"{self.BASE_URL}/magazine/list/develop/"
-            response = self.client.get_sync(url)
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            articles = self._parse_articles(soup, limit)
+            response = await self.client.get(url)
+            articles = self._parse_articles(response.text, limit)
 
             logger.info(f"총 {len(articles)}개의 기사를 수집했습니다.")
             return articles
@@ -45,12 +49,16 @@ class YozmITScraper:
             logger.error(f"요즘IT 스크래핑 실패: {e}")
             return []
 
-    def _parse_articles(self, soup: BeautifulSoup, limit: int) -> List[NewsArticle]:
-        """기사 목록 파싱"""
+    def scrape_sync(self, limit: int = 10) -> List[ArticleRecord]:
+        """동기 버전의 scrape"""
+        return asyncio.run(self.scrape(limit))
+
+    def _parse_articles(self, html: str, limit: int) -> List[ArticleRecord]:
+        """기사 목록 파싱 (검증 전 레코드)"""
         articles = []
 
         # 요즘IT의 기사 목록 찾기
-        article_elements = soup.find_all("article", class_="article-list")[:limit]
+        article_elements = self.parser.parse_rows(html, "article", "article-list", limit)
 
         for elem in article_elements:
             try:
@@ -63,7 +71,7 @@ class YozmITScraper:
 
         return articles
 
-    def _parse_single_article(self, elem) -> NewsArticle:
+    def _parse_single_article(self, elem) -> ArticleRecord:
         """단일 기사 파싱"""
         # 제목과 링크
         title_elem = elem.find("h3") or elem.find("h2")
@@ -84,7 +92,7 @@ class YozmITScraper:
         if summary_elem:
             summary = summary_elem.get_text(strip=True)
 
-        return NewsArticle(
+        return ArticleRecord(
             title=title,
             summary=summary,
             url=link,
@@ -0,0 +1,61 @@
+"""
+블룸 필터
+"확실히 없음"을 빠르게 판정하기 위한 고정 크기 비트 배열입니다.
+"""
+import hashlib
+import math
+
+
+def hash64(value: str) -> int:
+    """프로세스와 무관하게 안정적인 64비트 해시 (부호 없는 정수)"""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class BloomFilter:
+    """
+    블룸 필터
+
+    Args:
+        capacity: 예상 원소 수
+        error_rate: 허용 오탐률
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: int):
+        # 64비트 해시 하나를 둘로 나눠 k개의 위치를 만드는 double hashing
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add_hash(self, value: int) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain_hash(self, value: int) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    def add(self, item: str) -> None:
+        self.add_hash(hash64(item))
+
+    def __contains__(self, item: str) -> bool:
+        return self.might_contain_hash(hash64(item))
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.bits)
+
+    def load_bytes(self, data: bytes) -> bool:
+        """저장된 비트 배열 복원 (크기가 다르면 False)"""
+        if len(data) != len(self.bits):
+            return False
+        self.bits = bytearray(data)
+        return True
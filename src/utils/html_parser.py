@@ -0,0 +1,153 @@
+"""
+HTML 파서 유틸리티
+설치된 백엔드(selectolax, lxml, html.parser) 중 가장 빠른 것을 골라
+목록 페이지에서 필요한 행(row) 요소만 파싱합니다.
+"""
+import re
+from typing import Iterator, List, Optional
+import logging
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+logger = logging.getLogger(__name__)
+
+def _selectolax_parser_class():
+    """selectolax 파서 클래스 (1.0부터 lexbor 백엔드, 이전 버전은 modest 백엔드)"""
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+
+        return LexborHTMLParser
+    except ImportError:
+        pass
+    try:
+        from selectolax.parser import HTMLParser as ModestHTMLParser
+
+        return ModestHTMLParser
+    except ImportError:
+        return None
+
+
+def available_backends() -> List[str]:
+    """설치된 파서 백엔드 목록 (빠른 순)"""
+    backends = []
+    if _selectolax_parser_class() is not None:
+        backends.append("selectolax")
+    try:
+        import lxml  # noqa: F401
+
+        backends.append("lxml")
+    except ImportError:
+        pass
+    backends.append("html.parser")
+    return backends
+
+
+class HTMLParser:
+    """
+    행 단위 HTML 파서
+
+    - lxml / html.parser: SoupStrainer로 대상 행의 하위 트리만 생성
+    - selectolax: C 기반 파서로 행을 찾은 뒤, 행 조각만 BeautifulSoup으로 변환
+
+    어느 백엔드든 BeautifulSoup Tag를 반환하므로 스크래퍼의 행 파싱 코드는
+    그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, backend: Optional[str] = None):
+        available = available_backends()
+        if backend is None:
+            backend = available[0]
+        elif backend not in available:
+            logger.warning(f"파서 백엔드 '{backend}'를 사용할 수 없어 '{available[0]}'를 사용합니다.")
+            backend = available[0]
+        self.backend = backend
+
+    def parse_rows(
+        self, html: str, name: str, class_: str, limit: Optional[int] = None
+    ) -> List[Tag]:
+        """
+        name.class_ 요소(행)를 찾아 반환합니다.
+
+        Args:
+            html: 페이지 HTML
+            name: 태그 이름 (예: 'article')
+            class_: CSS 클래스 (예: 'Box-row')
+            limit: 최대 행 수
+
+        Returns:
+            행 요소(Tag) 리스트
+        """
+        if self.backend == "selectolax":
+            return self._parse_rows_selectolax(html, name, class_, limit)
+
+        strainer = SoupStrainer(name, class_=class_)
+        soup = BeautifulSoup(html, self.backend, parse_only=strainer)
+        return soup.find_all(name, class_=class_, limit=limit)
+
+    @staticmethod
+    def _parse_rows_selectolax(
+        html: str, name: str, class_: str, limit: Optional[int]
+    ) -> List[Tag]:
+        nodes = _selectolax_parser_class()(html).css(f"{name}.{class_}")
+        if limit is not None:
+            nodes = nodes[:limit]
+
+        rows = []
+        for node in nodes:
+            fragment = BeautifulSoup(node.html, "html.parser")
+            row = fragment.find(name)
+            if row is not None:
+                rows.append(row)
+        return rows
+
+
+class RowStreamParser:
+    """
+    점진적 행 파서
+
+    HTML 텍스트 조각을 feed()로 넣으면 완성된 name.class_ 행부터 Tag로
+    돌려줍니다. 행 경계는 같은 태그의 열림/닫힘 깊이로 판단하므로
+    페이지 전체를 메모리에 올리거나 트리로 만들 필요가 없습니다.
+    """
+
+    def __init__(self, name: str, class_: str, parser: Optional[HTMLParser] = None):
+        self.name = name
+        self.class_ = class_
+        self.parser = parser or HTMLParser()
+        self._row_start = re.compile(
+            rf"<{name}\b[^>]*\bclass\s*=\s*[\"'][^\"']*\b{re.escape(class_)}\b[^\"']*[\"'][^>]*>",
+            re.IGNORECASE,
+        )
+        self._tag = re.compile(rf"<(/?){name}\b[^>]*>", re.IGNORECASE)
+        self._buffer = ""
+
+    def feed(self, text: str) -> Iterator[Tag]:
+        """텍스트 조각을 추가하고 완성된 행을 순서대로 반환"""
+        self._buffer += text
+
+        while True:
+            start = self._row_start.search(self._buffer)
+            if start is None:
+                # 태그가 조각 경계에서 잘렸을 수 있으므로 마지막 '<' 이후만 보관
+                cut = self._buffer.rfind("<")
+                self._buffer = self._buffer[cut:] if cut >= 0 else ""
+                return
+
+            end = self._find_row_end(start.start())
+            if end is None:
+                # 행이 아직 끝나지 않음: 행 시작부터 보관
+                self._buffer = self._buffer[start.start():]
+                return
+
+            fragment = self._buffer[start.start():end]
+            self._buffer = self._buffer[end:]
+            yield from self.parser.parse_rows(fragment, self.name, self.class_)
+
+    def _find_row_end(self, row_start: int) -> Optional[int]:
+        """행을 닫는 태그의 끝 위치 (아직 없으면 None)"""
+        depth = 0
+        for match in self._tag.finditer(self._buffer, row_start):
+            depth += -1 if match.group(1) else 1
+            if depth == 0:
+                return match.end()
+        return None
@@ -0,0 +1,234 @@
+"""
+HTTP 응답 캐시
+ETag/Last-Modified 기반 조건부 GET과 Cache-Control max-age를 지원하는
+디스크 캐시를 제공합니다.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlencode
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 디코딩된 본문을 저장하므로 재생 시 제거해야 하는 헤더
+_STRIPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+
+
+@dataclass
+class CacheEntry:
+    """캐시된 응답"""
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified")
+
+    @property
+    def max_age(self) -> Optional[int]:
+        """Cache-Control max-age (no-cache면 0)"""
+        directives = parse_cache_control(self.headers.get("cache-control", ""))
+        if "no-cache" in directives:
+            return 0
+        try:
+            return int(directives["max-age"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """재검증 없이 바로 사용할 수 있는지 여부"""
+        max_age = self.max_age
+        if not max_age:
+            return False
+        return ((now or time.time()) - self.stored_at) < max_age
+
+    def validation_headers(self) -> Dict[str, str]:
+        """조건부 GET 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """httpx.Response로 복원"""
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Cache-Control 헤더 파싱"""
+    directives: Dict[str, Optional[str]] = {}
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+class HTTPCache:
+    """
+    디스크 기반 HTTP 응답 캐시
+
+    URL+파라미터로 키를 만들고, 항목별로 메타데이터(.json)와 본문(.body)을
+    저장합니다. 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은
+    항목부터 제거합니다(LRU, 파일 mtime 기준).
+
+    본문 전체 크기는 저장할 때마다 누적하여 관리하고, 디렉터리 스캔은
+    처음 한 번과 제한을 넘었을 때만 수행합니다.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/http", max_bytes: int = 50 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._total_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """URL+파라미터 기반 캐시 키"""
+        raw = url
+        if params:
+            raw = f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """캐시 항목 조회 (조회 시 LRU 순서 갱신)"""
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            content = body_path.read_bytes()
+            os.utime(body_path)
+        except (OSError, ValueError):
+            return None
+
+        return CacheEntry(
+            url=meta["url"],
+            status_code=meta["status_code"],
+            headers=meta["headers"],
+            content=content,
+            stored_at=meta["stored_at"],
+        )
+
+    def store(self, key: str, response: httpx.Response) -> Optional[CacheEntry]:
+        """응답 저장 (no-store 응답은 저장하지 않음)"""
+        directives = parse_cache_control(response.headers.get("cache-control", ""))
+        if response.status_code != 200 or "no-store" in directives:
+            return None
+
+        entry = CacheEntry(
+            url=str(response.url),
+            status_code=response.status_code,
+            headers={
+                k.lower(): v
+                for k, v in response.headers.items()
+                if k.lower() not in _STRIPPED_HEADERS
+            },
+            content=response.content,
+        )
+        _, body_path = self._paths(key)
+        try:
+            replaced = body_path.stat().st_size
+        except OSError:
+            replaced = 0
+        if self._write(key, entry) and self._total_bytes is not None:
+            self._total_bytes += len(entry.content) - replaced
+        self.stats["stores"] += 1
+        self._evict()
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry, not_modified: httpx.Response) -> CacheEntry:
+        """304 응답으로 기존 항목의 헤더와 저장 시각 갱신"""
+        for name in ("cache-control", "etag", "last-modified", "expires", "date"):
+            if name in not_modified.headers:
+                entry.headers[name] = not_modified.headers[name]
+        entry.stored_at = time.time()
+        self._write(key, entry)
+        return entry
+
+    def _write(self, key: str, entry: CacheEntry) -> bool:
+        """임시 파일에 쓴 뒤 교체하여 부분 기록을 방지 (성공 여부 반환)"""
+        meta_path, body_path = self._paths(key)
+        meta = {
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "stored_at": entry.stored_at,
+        }
+        tmp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            tmp_body = body_path.with_suffix(f".body{tmp_suffix}")
+            tmp_body.write_bytes(entry.content)
+            os.replace(tmp_body, body_path)
+            tmp_meta = meta_path.with_suffix(f".json{tmp_suffix}")
+            tmp_meta.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_meta, meta_path)
+        except OSError as e:
+            logger.warning(f"HTTP 캐시 저장 실패: {entry.url} - {e}")
+            return False
+        return True
+
+    def _scan(self) -> Tuple[List[Tuple[float, int, Path]], int]:
+        """본문 파일 목록 (mtime, 크기, 경로)과 전체 크기"""
+        bodies: List[Tuple[float, int, Path]] = []
+        total = 0
+        for body_path in self.cache_dir.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            bodies.append((stat.st_mtime, stat.st_size, body_path))
+            total += stat.st_size
+        return bodies, total
+
+    def _evict(self) -> None:
+        """크기 제한을 넘으면 LRU 순으로 제거"""
+        if self._total_bytes is None:
+            self._total_bytes = self._scan()[1]
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        # 다른 프로세스가 같은 디렉터리를 쓸 수 있으므로 제거 전에 실제 크기로 보정
+        bodies, total = self._scan()
+
+        for _, size, body_path in sorted(bodies):
+            if total <= self.max_bytes:
+                break
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+            self.stats["evictions"] += 1
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        for path in self.cache_dir.iterdir():
+            if path.suffix in (".json", ".body"):
+                path.unlink(missing_ok=True)
+        self._total_bytes = 0
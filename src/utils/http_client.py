@@ -2,21 +2,217 @@
 HTTP 클라이언트 유틸리티
 재사용 가능한 HTTP 클라이언트를 제공합니다.
 """
+import asyncio
 import httpx
-from typing import Optional, Dict, Any
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator
+from dataclasses import dataclass
 import logging
+from .http_cache import HTTPCache, CacheEntry
+from .rate_limiter import HostLimiter
+from .retry import RetryPolicy, RetryState
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class HostConnectionStats:
+    """호스트별 연결 재사용 통계"""
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
+    @property
+    def reused_requests(self) -> int:
+        """기존 연결을 재사용한 요청 수"""
+        return max(self.requests - self.connections_opened, 0)
+
+
 class HTTPClient:
-    """HTTP 클라이언트 래퍼"""
+    """
+    HTTP 클라이언트 래퍼
 
-    def __init__(self, timeout: int = 30):
+    하나의 httpx.AsyncClient 연결 풀을 여러 요청이 공유합니다.
+    파이프라인 단위로 `async with HTTPClient() as client:` 형태로 사용하면
+    종료 시 연결 풀이 정리됩니다.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[HTTPCache] = None,
+        limiter: Optional[HostLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
         self.timeout = timeout
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and self._http2_available()
+        self.transport = transport
+        self.cache = cache
+        self.limiter = limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: Dict[str, HostConnectionStats] = {}
+
+    @classmethod
+    def from_settings(cls) -> "HTTPClient":
+        """환경 설정 값으로 HTTP 클라이언트 생성"""
+        from config.settings import settings
+
+        cache = None
+        if settings.http_cache_enabled:
+            cache = HTTPCache(
+                cache_dir=settings.http_cache_dir,
+                max_bytes=settings.http_cache_max_bytes,
+            )
+
+        return cls(
+            timeout=settings.http_timeout,
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+            http2=settings.http2_enabled,
+            cache=cache,
+            limiter=HostLimiter.from_settings(),
+            retry_policy=RetryPolicy.from_settings(),
+        )
+
+    @staticmethod
+    def _http2_available() -> bool:
+        """HTTP/2 지원 패키지(h2) 설치 여부 확인"""
+        try:
+            import h2  # noqa: F401
+
+            return True
+        except ImportError:
+            logger.warning("h2 패키지가 없어 HTTP/1.1로 동작합니다.")
+            return False
+
+    # ==================== Lifecycle ====================
+
+    async def __aenter__(self) -> "HTTPClient":
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """연결 풀 종료"""
+        if self._client is not None:
+            client, self._client, self._client_loop = self._client, None, None
+            await client.aclose()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에 묶인 공유 AsyncClient 반환 (지연 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            # 다른 이벤트 루프(예: 이전 asyncio.run)에서 만든 풀은 재사용할 수 없으므로
+            # 소켓이 남지 않도록 닫은 뒤 새로 생성
+            logger.warning("이벤트 루프가 바뀌어 기존 연결 풀을 닫고 새로 생성합니다.")
+            client, self._client, self._client_loop = self._client, None, None
+            try:
+                await client.aclose()
+            except Exception as e:
+                # 이전 루프가 이미 닫혔으면 정상 종료가 불가능
+                logger.warning(f"이전 이벤트 루프의 연결 풀 종료 실패: {e}")
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                follow_redirects=True,
+                transport=self.transport,
+            )
+            self._client_loop = loop
+        return self._client
+
+    # ==================== Stats ====================
+
+    def _make_trace(self, host: str):
+        """연결 생성/TLS 핸드셰이크를 호스트별로 집계하는 trace 콜백"""
+        stats = self._stats.setdefault(host, HostConnectionStats())
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats.connections_opened += 1
+            elif event_name == "connection.start_tls.complete":
+                stats.tls_handshakes += 1
+
+        return trace
+
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """호스트별 동시성/속도 제한 대기열 통계 조회"""
+        return self.limiter.get_stats() if self.limiter else {}
+
+    def get_connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """호스트별 연결 재사용 통계 조회"""
+        return {
+            host: {
+                "requests": stats.requests,
+                "connections_opened": stats.connections_opened,
+                "tls_handshakes": stats.tls_handshakes,
+                "reused_requests": stats.reused_requests,
+            }
+            for host, stats in self._stats.items()
+        }
+
+    # ==================== Cache ====================
+
+    def _lookup_cache(
+        self, url: str, params: Optional[Dict[str, Any]], headers: Dict[str, str]
+    ):
+        """캐시 조회 후 (키, 항목, 신선 여부) 반환, 필요 시 조건부 헤더 추가"""
+        if self.cache is None:
+            return None, None, False
+
+        key = self.cache.make_key(url, params)
+        entry = self.cache.get(key)
+        if entry is None:
+            self.cache.stats["misses"] += 1
+            return key, None, False
+        if entry.is_fresh():
+            self.cache.stats["hits"] += 1
+            return key, entry, True
+
+        headers.update(entry.validation_headers())
+        return key, entry, False
+
+    def _resolve_cached(
+        self,
+        key: Optional[str],
+        entry: Optional[CacheEntry],
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """304면 캐시된 응답으로 대체하고, 200이면 캐시에 저장"""
+        if self.cache is None or key is None:
+            return response
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.stats["revalidated"] += 1
+            entry = self.cache.refresh(key, entry, response)
+            return entry.to_response(response.request)
+
+        if entry is not None:
+            self.cache.stats["misses"] += 1
+        self.cache.store(key, response)
+        return response
+
+    # ==================== Requests ====================
 
     async def get(
         self,
@@ -26,18 +222,178 @@ class HTTPClient:
     ) -> httpx.Response:
         """GET 요청"""
         merged_headers = {**self.headers, **(headers or {})}
+        key, entry, fresh = self._lookup_cache(url, params, merged_headers)
+        if fresh:
+            return entry.to_response(httpx.Request("GET", url, params=params))
+
+        client = await self._get_client()
+        host = httpx.URL(url).host
+        self._stats.setdefault(host, HostConnectionStats()).requests += 1
+
+        try:
+            response = await self._send_with_retry(
+                client, host, url, params, merged_headers
+            )
+            response = self._resolve_cached(key, entry, response)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP 요청 실패: {url} - {e}")
+            raise
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        host: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        slot: Optional[AsyncExitStack] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """
+        호스트 제한을 적용하여 요청 전송
+
+        slot이 주어지면 본문을 읽지 않은 스트리밍 응답을 반환하며, 호스트 슬롯은
+        slot이 닫힐 때(본문을 다 읽거나 재시도로 버릴 때)까지 유지됩니다.
+        timeout이 주어지면 클라이언트 기본 타임아웃 대신 사용합니다.
+        """
+        request = client.build_request(
+            "GET",
+            url,
+            params=params,
+            headers=headers,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+            extensions={"trace": self._make_trace(host)},
+        )
+        if slot is not None:
+            if self.limiter is not None:
+                await slot.enter_async_context(self.limiter.limit(host))
+            return await client.send(request, stream=True)
+        if self.limiter is None:
+            return await client.send(request)
+
+        async with self.limiter.limit(host):
+            return await client.send(request)
+
+    async def _send_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        host: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        slots: Optional[AsyncExitStack] = None,
+    ) -> httpx.Response:
+        """
+        재시도 정책에 따라 전송 (대기 중에는 호스트 슬롯을 반납)
+
+        slots가 주어지면 스트리밍으로 전송하고, 성공한 시도의 호스트 슬롯을
+        slots에 넘겨 호출자가 본문을 다 읽을 때까지 유지합니다.
+        """
+        state = RetryState(self.retry_policy, method="GET")
+
+        while True:
+            state.attempt += 1
+            attempt = AsyncExitStack() if slots is not None else None
+            try:
+                # 진행 중인 시도도 데드라인을 넘지 않도록 타임아웃을 남은 예산으로 제한
+                response = await self._send(
+                    client, host, url, params, headers, attempt,
+                    timeout=state.attempt_timeout(self.timeout),
+                )
+            except httpx.TransportError as e:
+                if attempt is not None:
+                    await attempt.aclose()
+                delay = state.next_delay(error=e)
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"요청 오류, {delay:.2f}초 후 재시도 ({state.attempt}/{self.retry_policy.max_attempts}): {url} - {e}"
+                )
+            except BaseException:
+                # 취소 등 재시도하지 않는 오류에도 이번 시도의 슬롯은 반납
+                if attempt is not None:
+                    await attempt.aclose()
+                raise
+            else:
+                delay = state.next_delay(response=response)
+                if delay is None:
+                    if attempt is not None:
+                        slots.push_async_callback(attempt.aclose)
+                    return response
+                logger.warning(
+                    f"HTTP {response.status_code}, {delay:.2f}초 후 재시도 ({state.attempt}/{self.retry_policy.max_attempts}): {url}"
+                )
+                await response.aclose()
+                if attempt is not None:
+                    await attempt.aclose()
+
+            await asyncio.sleep(delay)
+
+    # ==================== Streaming ====================
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        본문을 버퍼링하지 않는 스트리밍 GET
+
+        응답 헤더를 받은 시점에 상태 코드를 확인하고(재시도 포함) 응답을
+        넘겨줍니다. 블록을 벗어나면 남은 본문을 읽지 않고 연결을 닫습니다.
+        스트리밍 응답은 HTTP 캐시를 사용하지 않습니다.
+        """
+        merged_headers = {**self.headers, **(headers or {})}
+        client = await self._get_client()
+        host = httpx.URL(url).host
+        self._stats.setdefault(host, HostConnectionStats()).requests += 1
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with AsyncExitStack() as slots:
             try:
-                response = await client.get(
-                    url, params=params, headers=merged_headers, follow_redirects=True
+                response = await self._send_with_retry(
+                    client, host, url, params, merged_headers, slots=slots
                 )
-                response.raise_for_status()
-                return response
             except httpx.HTTPError as e:
                 logger.error(f"HTTP 요청 실패: {url} - {e}")
                 raise
 
+            try:
+                response.raise_for_status()
+                yield response
+            except httpx.HTTPStatusError as e:
+                logger.error(f"HTTP 요청 실패: {url} - {e}")
+                raise
+            finally:
+                await response.aclose()
+
+    async def iter_bytes(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """응답 본문을 바이트 청크 단위로 순회"""
+        async with self.stream(url, params, headers) as response:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def iter_text(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """응답 본문을 (charset에 맞춰 점진적으로 디코딩한) 문자열 청크 단위로 순회"""
+        async with self.stream(url, params, headers) as response:
+            async for chunk in response.aiter_text(chunk_size):
+                yield chunk
+
     def get_sync(
         self,
         url: str,
@@ -46,12 +402,16 @@ class HTTPClient:
     ) -> httpx.Response:
         """동기 GET 요청"""
         merged_headers = {**self.headers, **(headers or {})}
+        key, entry, fresh = self._lookup_cache(url, params, merged_headers)
+        if fresh:
+            return entry.to_response(httpx.Request("GET", url, params=params))
 
         with httpx.Client(timeout=self.timeout) as client:
             try:
                 response = client.get(
                     url, params=params, headers=merged_headers, follow_redirects=True
                 )
+                response = self._resolve_cached(key, entry, response)
                 response.raise_for_status()
                 return response
             except httpx.HTTPError as e:
@@ -0,0 +1,123 @@
+"""
+증분 JSON 파서
+스트리밍 응답을 조각 단위로 받아 최상위 객체의 필드가 완성되는 즉시
+(키, 값)으로 돌려줍니다. 코드 블록(```json)이나 앞뒤 설명 문장은
+첫 '{' 이전/마지막 '}' 이후이므로 자연스럽게 무시됩니다.
+"""
+import json
+from typing import Any, Dict, List, Tuple
+
+
+class IncrementalJSONParser:
+    """
+    최상위 JSON 객체 증분 파서
+
+    입력은 한 번만 훑으며, 값의 시작 위치만 기억했다가 값이 끝나면
+    그 구간만 json.loads로 변환합니다.
+
+    사용 예:
+        parser = IncrementalJSONParser()
+        for chunk in chunks:
+            for key, value in parser.feed(chunk):
+                ...
+        parser.fields  # 지금까지 완성된 필드
+    """
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        # 최상위에서 기다리는 토큰: key → colon → value → (comma | end)
+        self._expect = "key"
+        self._key_start = 0
+        self._key = ""
+        self._value_start = 0
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        조각 추가
+
+        Returns:
+            이번 조각으로 새로 완성된 (키, 값) 목록
+        """
+        if self.done:
+            return []
+        self._buffer += chunk
+        completed: List[Tuple[str, Any]] = []
+        buffer = self._buffer
+
+        while self._pos < len(buffer) and not self.done:
+            i = self._pos
+            char = buffer[i]
+            self._pos += 1
+
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        if self._expect == "key":
+                            self._key = json.loads(buffer[self._key_start:i + 1])
+                            self._expect = "colon"
+                        elif self._expect == "value":
+                            self._emit(buffer[self._value_start:i + 1], completed)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    if self._expect == "key":
+                        self._key_start = i
+                    elif self._expect == "value":
+                        self._value_start = i
+            elif char in "{[":
+                if self._depth == 1 and self._expect == "value":
+                    self._value_start = i
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    # 숫자/true/null처럼 구분자로만 끝나는 마지막 값
+                    if self._expect == "value":
+                        self._emit_scalar(buffer[self._value_start:i], completed)
+                    self.done = True
+                elif self._depth == 1 and self._expect == "value":
+                    self._emit(buffer[self._value_start:i + 1], completed)
+            elif self._depth == 1:
+                if char == ":" and self._expect == "colon":
+                    self._expect = "value"
+                    self._value_start = i + 1
+                elif char == ",":
+                    if self._expect == "value":
+                        self._emit_scalar(buffer[self._value_start:i], completed)
+                    self._expect = "key"
+
+        return completed
+
+    def _emit(self, raw: str, completed: List[Tuple[str, Any]]) -> None:
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            value = None
+        if value is not None or raw.strip() == "null":
+            self.fields[self._key] = value
+            completed.append((self._key, value))
+        self._expect = "after_value"
+
+    def _emit_scalar(self, raw: str, completed: List[Tuple[str, Any]]) -> None:
+        if raw.strip():
+            self._emit(raw.strip(), completed)
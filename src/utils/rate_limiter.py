@@ -0,0 +1,164 @@
+"""
+호스트별 동시성/속도 제한
+호스트마다 세마포어와 토큰 버킷을 두어 대량 요청이 업스트림 제한에
+걸리지 않도록 합니다.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기 (초당 rate개, 최대 capacity개 버스트)"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """
+        토큰 amount개를 얻을 때까지 대기 (대기자는 도착 순서대로 처리)
+
+        capacity보다 큰 요청은 버킷이 가득 찰 때까지만 기다립니다.
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            if self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= amount
+
+
+@dataclass
+class HostLimitStats:
+    """호스트별 대기열 통계"""
+    requests: int = 0
+    in_flight: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    total_wait_seconds: float = 0.0
+
+
+@dataclass
+class HostLimit:
+    """호스트별 제한 설정"""
+    concurrency: int = 10
+    rate_per_second: float = 0.0  # 0이면 속도 제한 없음
+    burst: int = 10
+
+
+class HostLimiter:
+    """
+    호스트별 동시성 + 속도 제한기
+
+    asyncio 동기화 객체는 이벤트 루프에 묶이므로 루프가 바뀌면
+    호스트별 상태를 새로 만듭니다.
+    """
+
+    def __init__(
+        self,
+        default: Optional[HostLimit] = None,
+        overrides: Optional[Dict[str, HostLimit]] = None,
+    ):
+        self.default = default or HostLimit()
+        self.overrides = overrides or {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: Dict[str, HostLimitStats] = {}
+
+    @classmethod
+    def from_settings(cls) -> "HostLimiter":
+        """환경 설정 값으로 제한기 생성"""
+        from config.settings import settings
+
+        default = HostLimit(
+            concurrency=settings.http_host_concurrency,
+            rate_per_second=settings.http_host_rate_per_second,
+            burst=settings.http_host_burst,
+        )
+        overrides = {
+            host: HostLimit(
+                concurrency=int(values.get("concurrency", default.concurrency)),
+                rate_per_second=float(values.get("rate_per_second", default.rate_per_second)),
+                burst=int(values.get("burst", default.burst)),
+            )
+            for host, values in settings.http_host_limits.items()
+        }
+        return cls(default=default, overrides=overrides)
+
+    def _ensure_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphores.clear()
+            self._buckets.clear()
+            self._loop = loop
+
+    def _get_primitives(self, host: str):
+        self._ensure_loop()
+        if host not in self._semaphores:
+            limit = self.overrides.get(host, self.default)
+            self._semaphores[host] = asyncio.Semaphore(limit.concurrency)
+            self._buckets[host] = (
+                TokenBucket(limit.rate_per_second, limit.burst)
+                if limit.rate_per_second > 0
+                else None
+            )
+        return self._semaphores[host], self._buckets[host]
+
+    @asynccontextmanager
+    async def limit(self, host: str):
+        """호스트 슬롯과 토큰을 확보한 동안 블록 실행"""
+        semaphore, bucket = self._get_primitives(host)
+        stats = self._stats.setdefault(host, HostLimitStats())
+        stats.requests += 1
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        started = time.monotonic()
+
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.queued -= 1
+
+        try:
+            if bucket is not None:
+                await bucket.acquire()
+            stats.total_wait_seconds += time.monotonic() - started
+            stats.in_flight += 1
+            try:
+                yield
+            finally:
+                stats.in_flight -= 1
+        finally:
+            semaphore.release()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """호스트별 대기열 통계 조회"""
+        return {
+            host: {
+                "requests": stats.requests,
+                "in_flight": stats.in_flight,
+                "queued": stats.queued,
+                "max_queued": stats.max_queued,
+                "avg_wait_seconds": round(stats.total_wait_seconds / stats.requests, 4)
+                if stats.requests
+                else 0.0,
+            }
+            for host, stats in self._stats.items()
+        }
@@ -0,0 +1,139 @@
+"""
+비동기 재시도 정책
+Full jitter 지수 백오프, Retry-After 헤더, 요청별 데드라인을 지원합니다.
+"""
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, FrozenSet
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    재시도 정책
+
+    Args:
+        max_attempts: 최대 시도 횟수 (첫 시도 포함)
+        base_delay: 백오프 기본 대기 시간 (초)
+        max_delay: 1회 최대 대기 시간 (초)
+        deadline: 요청 하나에 허용하는 전체 시간 (초, 재시도 포함)
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    deadline: float = 60.0
+    retry_statuses: FrozenSet[int] = field(
+        default_factory=lambda: frozenset({408, 425, 429, 500, 502, 503, 504})
+    )
+    # 부작용 없이 반복 가능한(멱등) 메서드만 재시도
+    idempotent_methods: FrozenSet[str] = field(
+        default_factory=lambda: frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    )
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        """환경 설정 값으로 정책 생성"""
+        from config.settings import settings
+
+        return cls(
+            max_attempts=settings.http_retry_max_attempts,
+            base_delay=settings.http_retry_base_delay,
+            max_delay=settings.http_retry_max_delay,
+            deadline=settings.http_retry_deadline,
+        )
+
+    def should_retry(
+        self,
+        method: str,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """응답/예외가 재시도 대상인지 판단"""
+        if method.upper() not in self.idempotent_methods:
+            return False
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def compute_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        attempt번째 실패 후 대기 시간 계산
+
+        Retry-After가 있으면 우선 사용하고, 없으면 full jitter
+        (0 ~ min(max_delay, base_delay * 2^(attempt-1)) 사이 난수)를 사용합니다.
+        """
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                return min(retry_after, self.max_delay)
+
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+class RetryState:
+    """요청 하나의 재시도 진행 상태 (시도 횟수와 데드라인 예산 추적)"""
+
+    def __init__(self, policy: RetryPolicy, method: str = "GET"):
+        self.policy = policy
+        self.method = method
+        self.attempt = 0
+        self.started_at = time.monotonic()
+
+    @property
+    def remaining(self) -> float:
+        """남은 데드라인 예산 (초)"""
+        return self.policy.deadline - (time.monotonic() - self.started_at)
+
+    def attempt_timeout(self, timeout: float) -> float:
+        """
+        이번 시도의 타임아웃 (초)
+
+        데드라인은 재시도 대기뿐 아니라 진행 중인 시도에도 적용되어야 하므로
+        클라이언트 타임아웃을 남은 예산 이하로 줄입니다.
+        """
+        return max(min(timeout, self.remaining), 0.0)
+
+    def next_delay(
+        self,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """다음 시도 전 대기 시간, 더 이상 재시도하지 않으면 None"""
+        if self.attempt >= self.policy.max_attempts:
+            return None
+        if not self.policy.should_retry(self.method, response, error):
+            return None
+
+        delay = self.policy.compute_delay(self.attempt, response)
+        if delay >= self.remaining:
+            logger.warning(f"재시도 데드라인 초과로 중단 (남은 시간 {self.remaining:.1f}초)")
+            return None
+        return delay
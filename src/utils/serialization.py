@@ -0,0 +1,52 @@
+"""
+일괄 직렬화
+모델 목록을 pydantic-core TypeAdapter로 한 번에 DB 행(dict) 또는 JSON 바이트로
+변환합니다. datetime 등은 ISO 문자열로 자동 변환됩니다.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_type: type) -> TypeAdapter:
+    """타입별 List[...] 어댑터 (스키마 생성 비용이 커서 재사용)"""
+    return TypeAdapter(List[item_type])
+
+
+def _as_list(items: Iterable[Any]) -> List[Any]:
+    items = list(items)
+    if items and any(type(item) is not type(items[0]) for item in items):
+        raise TypeError("같은 타입의 객체 목록만 일괄 직렬화할 수 있습니다.")
+    return items
+
+
+def to_rows(
+    items: Iterable[Any], exclude: Optional[Set[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    모델(또는 dataclass 레코드) 목록을 DB 저장용 dict 목록으로 변환
+
+    Args:
+        items: 같은 타입의 Pydantic 모델 / dataclass 목록
+        exclude: 제외할 필드 이름
+
+    Returns:
+        JSON 호환 값만 담긴 dict 목록
+    """
+    items = _as_list(items)
+    if not items:
+        return []
+    return _list_adapter(type(items[0])).dump_python(
+        items, mode="json", exclude={"__all__": exclude} if exclude else None
+    )
+
+
+def to_json(items: Iterable[Any], exclude: Optional[Set[str]] = None) -> bytes:
+    """모델(또는 dataclass 레코드) 목록을 JSON 배열 바이트로 변환"""
+    items = _as_list(items)
+    if not items:
+        return b"[]"
+    return _list_adapter(type(items[0])).dump_json(
+        items, exclude={"__all__": exclude} if exclude else None
+    )
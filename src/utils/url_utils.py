@@ -0,0 +1,78 @@
+"""
+URL 유틸리티
+중복 판별을 위해 URL을 정규화합니다.
+"""
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 내용과 무관한 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "source", "igshid", "si", "spm",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+HN_HOST = "news.ycombinator.com"
+HN_ITEM_URL = "https://news.ycombinator.com/item?id={}"
+
+
+def hn_item_url(item_id: int) -> str:
+    """Hacker News 토론 페이지 URL"""
+    return HN_ITEM_URL.format(item_id)
+
+
+def hn_item_id(url: str) -> Optional[int]:
+    """Hacker News 토론 페이지 URL이면 아이템 ID, 아니면 None"""
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host not in (HN_HOST, "www." + HN_HOST) or parts.path.rstrip("/") != "/item":
+        return None
+    item_id = dict(parse_qsl(parts.query)).get("id", "")
+    return int(item_id) if item_id.isdigit() else None
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    URL 정규화
+
+    - 스킴/호스트 소문자화, 'www.' 및 기본 포트 제거
+    - 추적용 쿼리 파라미터 제거 후 나머지 파라미터 정렬
+    - 프래그먼트와 경로 끝 '/' 제거
+    - Hacker News 토론 페이지는 'item?id=N' 형태로 통일 (페이지 번호 등 제거)
+    """
+    if not url:
+        return ""
+
+    item_id = hn_item_id(url)
+    if item_id is not None:
+        return hn_item_url(item_id)
+
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "https").lower()
+    if scheme == "http":
+        scheme = "https"
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{parts.port}"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS
+            and not key.lower().startswith(TRACKING_PREFIXES)
+        )
+    )
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    return urlunsplit((scheme, host, path, query, ""))
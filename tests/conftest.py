@@ -0,0 +1,54 @@
+"""
+공용 테스트 픽스처
+스크래퍼 파싱 테스트용 샘플 HTML을 생성합니다.
+"""
+import pytest
+
+
+def build_trending_html(count: int = 25, noise: int = 200, prefix: str = "owner") -> str:
+    """GitHub Trending 페이지 구조를 흉내낸 HTML"""
+    header = "".join(
+        f'<div class="Header-item"><a href="/nav/{i}">메뉴 {i}</a><span>{"x" * 40}</span></div>'
+        for i in range(noise)
+    )
+    rows = "".join(
+        f"""
+        <article class="Box-row">
+          <h2 class="h3 lh-condensed"><a href="/{prefix}{i}/repo{i}">{prefix}{i} / repo{i}</a></h2>
+          <p class="col-9 color-fg-muted my-1 pr-4">Repository {i} description</p>
+          <div class="f6 color-fg-muted mt-2">
+            <span><span itemprop="programmingLanguage">Python</span></span>
+            <a href="/{prefix}{i}/repo{i}/stargazers"><svg class="octicon octicon-star"></svg>{i},234</a>
+            <a href="/{prefix}{i}/repo{i}/forks"><svg class="octicon octicon-repo-forked"></svg>{i}12</a>
+            <span class="d-inline-block float-sm-right">{i * 10} stars today</span>
+          </div>
+        </article>"""
+        for i in range(1, count + 1)
+    )
+    footer = "".join(f"<footer><p>{'y' * 80}</p></footer>" for _ in range(noise))
+    return f"<html><head><title>Trending</title></head><body>{header}<main>{rows}</main>{footer}</body></html>"
+
+
+def build_geeknews_html(count: int = 20) -> str:
+    """GeekNews 목록 페이지 구조를 흉내낸 HTML"""
+    rows = "".join(
+        f"""
+        <div class="topic_row">
+          <div class="topictitle"><a class="topic_link" href="https://example.com/{i}">뉴스 {i}</a></div>
+          <span class="topicvotecount">{i}</span>
+        </div>"""
+        for i in range(1, count + 1)
+    )
+    return f"<html><body><div class='topics'>{rows}</div></body></html>"
+
+
+@pytest.fixture
+def trending_html():
+    """GitHub Trending 샘플 HTML 생성 함수"""
+    return build_trending_html
+
+
+@pytest.fixture
+def geeknews_html():
+    """GeekNews 샘플 HTML 생성 함수"""
+    return build_geeknews_html
@@ -0,0 +1,117 @@
+"""
+중복 기사 제거 테스트
+"""
+from src.scrapers.dedup import ArticleDeduplicator, NearDuplicateIndex, shingles
+from src.scrapers.models import NewsArticle
+from src.utils.url_utils import canonicalize_url
+
+
+def _article(title, url, source="Hacker News", summary=None):
+    return NewsArticle(title=title, url=url, source=source, summary=summary)
+
+
+class TestCanonicalizeURL:
+    """URL 정규화 테스트"""
+
+    def test_strips_tracking_and_normalizes_host(self):
+        assert canonicalize_url(
+            "http://WWW.Example.com:80/post/1/?utm_source=hn&b=2&a=1#comments"
+        ) == "https://example.com/post/1?a=1&b=2"
+
+    def test_keeps_meaningful_params(self):
+        assert canonicalize_url("https://news.ycombinator.com/item?id=123") == (
+            "https://news.ycombinator.com/item?id=123"
+        )
+
+
+class TestNearDuplicate:
+    """MinHash LSH 유사 중복 테스트"""
+
+    def test_similar_titles_from_different_sources(self):
+        """URL/호스트가 달라도 제목이 같은 이야기면 중복 (HN과 GeekNews)"""
+        dedup = ArticleDeduplicator(NearDuplicateIndex(":memory:"))
+        articles = [
+            _article("Show HN: Rust-based SQLite replacement hits 1.0", "https://a.dev/blog"),
+            _article(
+                "Rust-based SQLite replacement hits 1.0",
+                "https://news.hada.io/topic?id=1",
+                "GeekNews",
+            ),
+            _article("Python 3.14 released with free-threading", "https://python.org/news"),
+            _article("A different story entirely", "https://a.dev/blog/?utm_source=x"),
+        ]
+
+        unique = dedup.deduplicate(articles)
+
+        assert [a.url for a in unique] == ["https://a.dev/blog", "https://python.org/news"]
+        assert dedup.clusters[canonicalize_url(articles[1].url)] == "https://a.dev/blog"
+
+    def test_index_persists_across_runs(self, tmp_path):
+        """다음 날 재등장한 유사 기사도 중복으로 판정, 같은 기사 재실행은 유지"""
+        path = str(tmp_path / "dedup.db")
+        first = ArticleDeduplicator(NearDuplicateIndex(path))
+        first.deduplicate([_article("Kubernetes 1.32 release notes", "https://k8s.io/blog/1.32")])
+        first.index.close()
+
+        second = ArticleDeduplicator(NearDuplicateIndex(path))
+        unique = second.deduplicate([
+            _article("Kubernetes 1.32 release notes", "https://k8s.io/blog/1.32"),
+            _article("Kubernetes 1.32 release notes!", "https://k8s.io/blog/kubernetes-v1-32"),
+        ])
+
+        assert [a.url for a in unique] == ["https://k8s.io/blog/1.32"]
+
+    def test_version_bumps_are_distinct(self):
+        """버전 번호만 다른 제목은 같은 호스트여도 다른 기사"""
+        dedup = ArticleDeduplicator(NearDuplicateIndex(":memory:"))
+        articles = [
+            _article("Python 3.15 released with free-threading", "https://python.org/news/3.15"),
+            _article("Python 3.14 released with free-threading", "https://python.org/news/3.14"),
+            _article("Announcing Rust 1.91", "https://blog.rust-lang.org/2025/10/30/rust-1.91"),
+            _article("Announcing Rust 1.90", "https://blog.rust-lang.org/2025/09/18/rust-1.90"),
+        ]
+
+        assert dedup.deduplicate(articles) == articles
+
+    def test_show_hn_projects_are_distinct(self):
+        """한 단어만 다른 Show HN 프로젝트는 다른 기사"""
+        dedup = ArticleDeduplicator(NearDuplicateIndex(":memory:"))
+        articles = [
+            _article("Show HN: A fast key-value store for SQLite", "https://github.com/a/kv-sqlite"),
+            _article("Show HN: A fast key-value store for Postgres", "https://github.com/b/kv-postgres"),
+        ]
+
+        assert dedup.deduplicate(articles) == articles
+
+    def test_same_title_on_different_hosts_merged(self):
+        """호스트가 달라도 제목이 같으면 소스 간 중복으로 병합"""
+        dedup = ArticleDeduplicator(NearDuplicateIndex(":memory:"))
+        articles = [
+            _article("Why we moved off Kubernetes", "https://a.dev/kubernetes"),
+            _article("Why we moved off Kubernetes", "https://b.dev/kubernetes"),
+        ]
+
+        assert dedup.deduplicate(articles) == articles[:1]
+
+    def test_cross_host_uses_stricter_threshold(self):
+        """같은 호스트면 중복인 유사도(약 0.85)도 호스트가 다르면 유지"""
+        titles = (
+            "How we moved our whole platform off Kubernetes",
+            "How we moved our whole platform off Kubernetes today",
+        )
+        same_host = ArticleDeduplicator(NearDuplicateIndex(":memory:"))
+        cross_host = ArticleDeduplicator(NearDuplicateIndex(":memory:"))
+
+        assert len(same_host.deduplicate([
+            _article(titles[0], "https://a.dev/1"), _article(titles[1], "https://a.dev/2"),
+        ])) == 1
+        assert len(cross_host.deduplicate([
+            _article(titles[0], "https://a.dev/1"), _article(titles[1], "https://b.dev/1"),
+        ])) == 2
+
+    def test_shingles_keep_version_numbers(self):
+        assert "3.14" in shingles("Python 3.14 released")
+        assert shingles("Show HN: Rust SQLite") == shingles("Rust SQLite")
+
+    def test_shingles_handle_korean(self):
+        assert shingles("쿠버네티스 1.32 출시") & shingles("쿠버네티스 1.32 정식 출시")
@@ -1,6 +1,8 @@
 """
 GitHub Trending 스크래퍼 테스트
 """
+import asyncio
+
 import pytest
 from src.scrapers.github_trending import GitHubTrendingScraper
 
@@ -15,7 +17,7 @@ def test_scraper_initialization():
 def test_scrape_daily_trending():
     """일간 트렌딩 저장소 수집 테스트"""
     scraper = GitHubTrendingScraper()
-    repos = scraper.scrape(since="daily", limit=5)
+    repos = scraper.scrape_sync(since="daily", limit=5)
 
     assert isinstance(repos, list)
     if len(repos) > 0:
@@ -28,7 +30,7 @@ def test_scrape_daily_trending():
 def test_scrape_with_language_filter():
     """언어 필터링 테스트"""
     scraper = GitHubTrendingScraper()
-    repos = scraper.scrape(language="python", since="daily", limit=3)
+    repos = scraper.scrape_sync(language="python", since="daily", limit=3)
 
     assert isinstance(repos, list)
 
@@ -42,3 +44,138 @@ def test_parse_number():
     assert scraper._parse_number("5k") == 5000
     assert scraper._parse_number("123") == 123
     assert scraper._parse_number("invalid") == 0
+
+
+def test_scrape_sync_returns_models(trending_html):
+    """scrape_sync는 검증된 TrendingRepository를 반환 (scrape는 레코드)"""
+    import httpx
+    from src.scrapers.models import TrendingRepository
+    from src.utils.http_client import HTTPClient
+
+    def handler(request):
+        return httpx.Response(200, text=trending_html(count=3, noise=0))
+
+    scraper = GitHubTrendingScraper(HTTPClient(transport=httpx.MockTransport(handler)))
+    repos = scraper.scrape_sync(limit=3)
+
+    assert len(repos) == 3
+    assert all(isinstance(repo, TrendingRepository) for repo in repos)
+
+
+def test_crawl_merges_languages_and_periods(trending_html):
+    """여러 언어/기간 페이지를 병합하고 중복 제거"""
+    from concurrent.futures import ThreadPoolExecutor
+    import httpx
+    from src.utils.http_client import HTTPClient
+    from src.utils.retry import RetryPolicy
+
+    def handler(request):
+        # 'python' 페이지는 전체 페이지와 같은 저장소, 'rust'는 다른 저장소
+        prefix = "rustacean" if request.url.path.endswith("/rust") else "owner"
+        count = 3 if request.url.params["since"] == "daily" else 5
+        if request.url.path.endswith("/go"):
+            return httpx.Response(500)
+        return httpx.Response(200, text=trending_html(count=count, noise=0, prefix=prefix))
+
+    client = HTTPClient(
+        transport=httpx.MockTransport(handler), retry_policy=RetryPolicy(max_attempts=1)
+    )
+    scraper = GitHubTrendingScraper(client)
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return await scraper.crawl(
+                languages=[None, "python", "rust", "go"],
+                periods=["daily", "weekly"],
+                executor=executor,
+            )
+
+    result = asyncio.run(run())
+
+    assert len(result.repositories) == 10
+    assert result.ranks["owner1/repo1"] == {
+        "all:daily": 1, "all:weekly": 1, "python:daily": 1, "python:weekly": 1,
+    }
+    assert result.ranks["owner5/repo5"] == {"all:weekly": 5, "python:weekly": 5}
+    assert sorted(result.failed_pages) == ["go:daily", "go:weekly"]
+    assert result.page_counts["rust:weekly"] == 5
+
+
+def test_crawl_reuses_owned_executor(trending_html):
+    """executor 없이 호출하면 스크래퍼가 소유한 풀을 호출 간에 재사용하고 close에서 종료"""
+    import httpx
+    from src.utils.http_client import HTTPClient
+
+    def handler(request):
+        return httpx.Response(200, text=trending_html(count=2, noise=0))
+
+    scraper = GitHubTrendingScraper(HTTPClient(transport=httpx.MockTransport(handler)))
+    try:
+        first = asyncio.run(scraper.crawl(languages=[None], periods=["daily"], max_workers=1))
+        executor = scraper._executor
+        second = asyncio.run(scraper.crawl(languages=[None], periods=["weekly"], max_workers=1))
+
+        assert len(first.repositories) == len(second.repositories) == 2
+        assert executor is not None and scraper._executor is executor
+    finally:
+        scraper.close()
+    assert scraper._executor is None
+
+
+def test_stream_stops_after_limit(trending_html):
+    """스트리밍 파싱은 limit개를 만들면 남은 본문을 읽지 않음"""
+    import httpx
+    from src.utils.http_client import HTTPClient
+
+    html = trending_html(count=25, noise=0)
+    chunks = [html[i:i + 512] for i in range(0, len(html), 512)]
+    sent = []
+
+    async def body():
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk.encode("utf-8")
+
+    def handler(request):
+        return httpx.Response(200, headers={"Content-Type": "text/html; charset=utf-8"}, content=body())
+
+    scraper = GitHubTrendingScraper(HTTPClient(transport=httpx.MockTransport(handler)))
+    repos = asyncio.run(scraper.scrape(limit=3, stream=True))
+
+    assert [r.name for r in repos] == ["owner1/repo1", "owner2/repo2", "owner3/repo3"]
+    assert repos[0].stars == 1234
+    assert len(sent) < len(chunks) / 2
+
+
+def test_stream_closed_when_limit_reached(trending_html):
+    """limit에 도달하면 이벤트 루프 종료를 기다리지 않고 응답 스트림을 바로 닫음"""
+    import httpx
+    from src.utils.http_client import HTTPClient
+
+    html = trending_html(count=25, noise=0)
+
+    def handler(request):
+        return httpx.Response(200, headers={"Content-Type": "text/html; charset=utf-8"}, text=html)
+
+    client = HTTPClient(transport=httpx.MockTransport(handler))
+    iter_text = client.iter_text
+    closed = []
+
+    async def tracked_iter_text(*args, **kwargs):
+        try:
+            async for chunk in iter_text(*args, chunk_size=512, **kwargs):
+                yield chunk
+        finally:
+            closed.append(True)
+
+    client.iter_text = tracked_iter_text
+    scraper = GitHubTrendingScraper(client)
+
+    async def run():
+        repos = [repo async for repo in scraper.iter_repositories(limit=2)]
+        return repos, bool(closed)
+
+    repos, closed_before_loop_end = asyncio.run(run())
+
+    assert len(repos) == 2
+    assert closed_before_loop_end
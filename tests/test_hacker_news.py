@@ -0,0 +1,187 @@
+"""
+Hacker News 스크래퍼 테스트
+"""
+import asyncio
+
+import httpx
+
+from src.scrapers.hacker_news import HackerNewsScraper
+from src.scrapers.hn_item_loader import HNItemLoader
+from src.scrapers.hn_store import HNStoryStore
+from src.utils.http_client import HTTPClient
+
+
+def _make_transport(calls, scores=None):
+    """topstories + item 응답을 흉내내는 MockTransport"""
+    scores = scores if scores is not None else {}
+
+    def handler(request):
+        calls.append(request.url.path)
+        if request.url.path.endswith("/topstories.json"):
+            return httpx.Response(200, json=[1, 2, 3, 4])
+        item_id = int(request.url.path.rsplit("/", 1)[-1].split(".")[0])
+        return httpx.Response(
+            200,
+            json={
+                "id": item_id,
+                "type": "story",
+                "title": f"Story {item_id}",
+                "by": "pg",
+                "score": scores.get(item_id, 100),
+                "time": 1700000000,
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+class TestHNItemLoader:
+    """아이템 배치 로더 테스트"""
+
+    def test_scrape_uses_batch_loader(self):
+        """스크래퍼가 로더를 통해 스토리를 가져옴"""
+        calls = []
+        scraper = HackerNewsScraper(HTTPClient(transport=_make_transport(calls)))
+
+        articles = scraper.scrape_sync(limit=3)
+
+        assert [a.title for a in articles] == ["Story 1", "Story 2", "Story 3"]
+        assert articles[0].summary == "Posted by pg"
+
+    def test_rerun_hits_item_cache(self):
+        """재실행 시 캐시된 아이템은 다시 요청하지 않음"""
+        calls = []
+        scraper = HackerNewsScraper(HTTPClient(transport=_make_transport(calls)))
+
+        scraper.scrape_sync(limit=3)
+        scraper.scrape_sync(limit=4)
+
+        item_calls = [c for c in calls if "/item/" in c]
+        assert len(item_calls) == 4
+        assert scraper.loader.get_stats()["hits"] == 3
+
+    def test_inflight_requests_deduplicated(self):
+        """동시에 같은 id를 요청하면 한 번만 가져옴"""
+        calls = []
+        loader = HNItemLoader(HTTPClient(transport=_make_transport(calls)), concurrency=2)
+
+        async def run():
+            return await asyncio.gather(
+                loader.load_many([1, 2, 2, 3]),
+                loader.load_many([2, 3]),
+            )
+
+        first, second = asyncio.run(run())
+
+        assert set(first) == {1, 2, 3}
+        assert set(second) == {2, 3}
+        assert len(calls) == 3
+
+    def test_concurrency_shared_across_calls(self):
+        """동시에 호출된 load_many들이 하나의 동시성 제한을 공유"""
+        active = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return httpx.Response(200, json={"type": "story", "title": "t", "score": 1})
+
+        loader = HNItemLoader(HTTPClient(transport=httpx.MockTransport(handler)), concurrency=2)
+
+        async def run():
+            await asyncio.gather(loader.load_many([1, 2, 3]), loader.load_many([4, 5, 6]))
+
+        asyncio.run(run())
+        assert active["peak"] == 2
+
+    def test_score_delta_shortens_ttl(self):
+        """점수가 크게 변한 아이템은 짧은 TTL로 캐시"""
+        calls = []
+        scores = {1: 10}
+        loader = HNItemLoader(
+            HTTPClient(transport=_make_transport(calls, scores)),
+            ttl=600,
+            hot_ttl=0,
+            score_delta=5,
+        )
+
+        asyncio.run(loader.load_many([1]))
+        loader.invalidate([1])
+
+        scores[1] = 50
+        asyncio.run(loader.load_many([1]))
+        asyncio.run(loader.load_many([1]))
+        asyncio.run(loader.load_many([1]))
+
+        # 무효화 후 재조회(점수 급변 → hot_ttl=0), 한 번 더 재조회 후 캐시 사용
+        assert len(calls) == 3
+
+
+class TestIncrementalMode:
+    """증분 수집 모드 테스트"""
+
+    @staticmethod
+    def _transport(calls, changed):
+        base = _make_transport(calls)
+
+        def handler(request):
+            if request.url.path.endswith("/updates.json"):
+                calls.append(request.url.path)
+                return httpx.Response(200, json={"items": changed, "profiles": []})
+            if request.url.path.endswith("/maxitem.json"):
+                calls.append(request.url.path)
+                return httpx.Response(200, json=1000)
+            return base.handler(request)
+
+        return httpx.MockTransport(handler)
+
+    def test_only_changed_items_refetched(self):
+        """두 번째 실행에서는 변경된 아이템만 다시 가져옴"""
+        store = HNStoryStore(":memory:")
+        calls = []
+        first = HackerNewsScraper(HTTPClient(transport=self._transport(calls, [])), store=store)
+        assert len(first.scrape_sync(limit=4)) == 4
+        assert first.last_run_stats["requested_items"] == 4
+
+        # 새 프로세스(메모리 캐시 없음)에서 재실행
+        calls.clear()
+        second = HackerNewsScraper(HTTPClient(transport=self._transport(calls, [2])), store=store)
+        articles = second.scrape_sync(limit=4)
+
+        assert [a.title for a in articles] == ["Story 1", "Story 2", "Story 3", "Story 4"]
+        assert [c for c in calls if "/item/" in c] == ["/v0/item/2.json"]
+        assert second.last_run_stats == {"requested_items": 1, "reused_items": 3, "changed_items": 1}
+        assert store.get_checkpoint()["max_item"] == 1000
+
+    def test_pending_changes_carried_to_next_run(self):
+        """이번 실행 목록 밖의 변경 알림은 체크포인트에 남아 다음 실행에서 반영"""
+        store = HNStoryStore(":memory:")
+        calls = []
+        HackerNewsScraper(HTTPClient(transport=self._transport(calls, [])), store=store).scrape_sync(limit=4)
+
+        # 4번 변경 알림을 받았지만 이번 실행은 상위 2개만 수집
+        second = HackerNewsScraper(HTTPClient(transport=self._transport(calls, [4])), store=store)
+        second.scrape_sync(limit=2)
+        assert store.get_checkpoint()["changed_ids"] == [4]
+
+        # updates.json에서 사라져도 저장된 변경 목록으로 다시 가져옴
+        calls.clear()
+        third = HackerNewsScraper(HTTPClient(transport=self._transport(calls, [])), store=store)
+        third.scrape_sync(limit=4)
+        assert [c for c in calls if "/item/" in c] == ["/v0/item/4.json"]
+        assert store.get_checkpoint()["changed_ids"] == []
+
+    def test_items_above_checkpoint_refetched(self):
+        """지난 체크포인트의 maxitem 이후 아이템은 새 아이템으로 다시 가져옴"""
+        store = HNStoryStore(":memory:")
+        calls = []
+        HackerNewsScraper(HTTPClient(transport=self._transport(calls, [])), store=store).scrape_sync(limit=4)
+        store.save_checkpoint(2, [])
+
+        calls.clear()
+        scraper = HackerNewsScraper(HTTPClient(transport=self._transport(calls, [])), store=store)
+        scraper.scrape_sync(limit=4)
+
+        assert sorted(c for c in calls if "/item/" in c) == ["/v0/item/3.json", "/v0/item/4.json"]
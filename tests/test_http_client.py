@@ -0,0 +1,341 @@
+"""
+HTTP 클라이언트 테스트
+"""
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.utils.http_client import HTTPClient
+from src.utils.http_cache import HTTPCache
+from src.utils.rate_limiter import HostLimiter, HostLimit, TokenBucket
+from src.utils.retry import RetryPolicy, RetryState, parse_retry_after
+
+
+class _OKHandler(BaseHTTPRequestHandler):
+    """keep-alive를 지원하는 테스트용 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """로컬 HTTP 서버"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OKHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestConnectionPool:
+    """공유 연결 풀 테스트"""
+
+    def test_connections_reused_per_host(self, local_server):
+        """동일 호스트 요청은 하나의 연결을 재사용"""
+
+        async def run():
+            async with HTTPClient() as client:
+                for i in range(5):
+                    response = await client.get(f"{local_server}/item/{i}")
+                    assert response.json() == {"ok": True}
+                return client.get_connection_stats()
+
+        stats = asyncio.run(run())["127.0.0.1"]
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["reused_requests"] == 4
+
+    def test_client_closed_on_exit(self):
+        """컨텍스트 종료 시 연결 풀 정리"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+        async def run():
+            client = HTTPClient(transport=transport)
+            async with client:
+                await client.get("https://example.com")
+                assert client._client is not None
+            return client
+
+        client = asyncio.run(run())
+        assert client._client is None
+
+    def test_reusable_across_event_loops(self):
+        """asyncio.run을 여러 번 호출해도 동작"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        client = HTTPClient(transport=transport)
+
+        pools = []
+        for _ in range(2):
+            response = asyncio.run(client.get("https://example.com"))
+            assert response.status_code == 200
+            pools.append(client._client)
+
+        # 이전 루프의 연결 풀은 닫힌 뒤 교체됨
+        assert pools[0] is not pools[1]
+        assert pools[0].is_closed
+
+
+class TestHTTPCache:
+    """조건부 GET 캐시 테스트"""
+
+    @staticmethod
+    def _etag_transport(calls):
+        def handler(request):
+            calls.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, headers={"ETag": '"v1"'}, content=b"page")
+
+        return httpx.MockTransport(handler)
+
+    def test_revalidates_with_etag(self, tmp_path):
+        """ETag로 재검증하고 304면 캐시 본문 반환"""
+        calls = []
+        cache = HTTPCache(cache_dir=str(tmp_path))
+        client = HTTPClient(transport=self._etag_transport(calls), cache=cache)
+
+        first = asyncio.run(client.get("https://example.com/trending", params={"since": "daily"}))
+        second = asyncio.run(client.get("https://example.com/trending", params={"since": "daily"}))
+
+        assert first.text == second.text == "page"
+        assert calls[1].headers["if-none-match"] == '"v1"'
+        assert cache.stats["revalidated"] == 1
+
+    def test_fresh_entry_skips_network(self, tmp_path):
+        """max-age 이내면 요청 없이 캐시 사용"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, headers={"Cache-Control": "max-age=60"}, content=b"{}")
+
+        cache = HTTPCache(cache_dir=str(tmp_path))
+        client = HTTPClient(transport=httpx.MockTransport(handler), cache=cache)
+
+        for _ in range(3):
+            assert asyncio.run(client.get("https://example.com/item/1.json")).json() == {}
+
+        assert len(calls) == 1
+        assert cache.stats["hits"] == 2
+
+    def test_lru_eviction(self, tmp_path):
+        """크기 제한 초과 시 오래된 항목 제거"""
+        cache = HTTPCache(cache_dir=str(tmp_path), max_bytes=10)
+        request = httpx.Request("GET", "https://example.com")
+        for i in range(3):
+            response = httpx.Response(200, content=b"x" * 6, request=request)
+            cache.store(cache.make_key(f"https://example.com/{i}"), response)
+
+        assert cache.get(cache.make_key("https://example.com/0")) is None
+        assert cache.get(cache.make_key("https://example.com/2")) is not None
+        assert cache.stats["evictions"] == 2
+
+    def test_store_scans_only_when_over_limit(self, tmp_path, monkeypatch):
+        """저장마다 디렉터리를 훑지 않고 누적 크기로 판단"""
+        cache = HTTPCache(cache_dir=str(tmp_path), max_bytes=100)
+        scans = []
+        original = cache._scan
+        monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or original())
+        request = httpx.Request("GET", "https://example.com")
+
+        for i in range(10):
+            response = httpx.Response(200, content=b"x" * 6, request=request)
+            cache.store(cache.make_key(f"https://example.com/{i}"), response)
+        # 같은 키를 다시 저장하면 이전 크기를 빼고 누적
+        cache.store(cache.make_key("https://example.com/0"), httpx.Response(200, content=b"y", request=request))
+
+        assert len(scans) == 1
+        assert cache._total_bytes == 9 * 6 + 1
+
+
+class TestHostLimiter:
+    """호스트별 동시성/속도 제한 테스트"""
+
+    def test_concurrency_bounded_per_host(self):
+        """동시 요청 수가 호스트 제한을 넘지 않음"""
+        active = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return httpx.Response(200, json={})
+
+        limiter = HostLimiter(default=HostLimit(concurrency=3))
+        client = HTTPClient(transport=httpx.MockTransport(handler), limiter=limiter)
+
+        async def run():
+            await asyncio.gather(
+                *[client.get(f"https://example.com/item/{i}") for i in range(20)]
+            )
+
+        asyncio.run(run())
+
+        stats = client.get_queue_stats()["example.com"]
+        assert active["peak"] == 3
+        assert stats["requests"] == 20
+        assert stats["max_queued"] > 0
+        assert stats["queued"] == 0
+
+    def test_token_bucket_rate(self):
+        """버스트 이후에는 초당 rate개로 제한"""
+
+        async def run():
+            bucket = TokenBucket(rate=100, capacity=2)
+            started = time.monotonic()
+            for _ in range(6):
+                await bucket.acquire()
+            return time.monotonic() - started
+
+        # 버스트 2개 + 4개 * 10ms
+        assert asyncio.run(run()) >= 0.035
+
+
+class TestRetryPolicy:
+    """재시도 정책 테스트"""
+
+    def test_retries_transient_5xx(self):
+        """일시적 5xx는 재시도 후 성공"""
+        responses = [httpx.Response(503), httpx.Response(502), httpx.Response(200, json={"id": 1})]
+
+        client = HTTPClient(
+            transport=httpx.MockTransport(lambda request: responses.pop(0)),
+            retry_policy=RetryPolicy(base_delay=0.001),
+        )
+        response = asyncio.run(client.get("https://example.com/item/1.json"))
+
+        assert response.json() == {"id": 1}
+        assert responses == []
+
+    def test_gives_up_after_max_attempts(self):
+        """최대 시도 후에는 예외 발생"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500)
+
+        client = HTTPClient(
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0.001),
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(client.get("https://example.com"))
+        assert len(calls) == 2
+
+    def test_client_errors_not_retried(self):
+        """4xx(429 제외)는 재시도하지 않음"""
+        policy = RetryPolicy()
+        assert not policy.should_retry("GET", response=httpx.Response(404))
+        assert policy.should_retry("GET", response=httpx.Response(429))
+        assert not policy.should_retry("POST", response=httpx.Response(503))
+
+    def test_retry_after_header(self):
+        """Retry-After 헤더를 백오프보다 우선 사용"""
+        policy = RetryPolicy(max_delay=10)
+        response = httpx.Response(429, headers={"Retry-After": "3"})
+        assert policy.compute_delay(1, response) == 3
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert 0 <= policy.compute_delay(3) <= policy.base_delay * 4
+
+    def test_deadline_budget(self):
+        """데드라인을 넘기는 대기는 하지 않음"""
+        state = RetryState(RetryPolicy(deadline=1.0), method="GET")
+        state.attempt = 1
+        response = httpx.Response(503, headers={"Retry-After": "5"})
+        assert state.next_delay(response=response) is None
+
+
+    def test_attempt_timeout_capped_by_deadline(self):
+        """시도마다 타임아웃을 남은 데드라인 예산 이하로 제한"""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"]["read"])
+            return httpx.Response(503 if len(timeouts) == 1 else 200)
+
+        client = HTTPClient(
+            transport=httpx.MockTransport(handler),
+            timeout=30,
+            retry_policy=RetryPolicy(base_delay=0.05, max_delay=0.05, deadline=0.5),
+        )
+        asyncio.run(client.get("https://example.com"))
+
+        assert len(timeouts) == 2
+        assert all(timeout <= 0.5 for timeout in timeouts)
+        assert timeouts[1] < timeouts[0]
+
+        state = RetryState(RetryPolicy(deadline=60.0))
+        assert state.attempt_timeout(10) == 10
+
+class TestStreaming:
+    """스트리밍 GET 테스트"""
+
+    def test_iter_bytes(self):
+        """본문을 청크 단위로 순회"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"a" * 100))
+        client = HTTPClient(transport=transport)
+
+        async def run():
+            return [chunk async for chunk in client.iter_bytes("https://example.com", chunk_size=30)]
+
+        chunks = asyncio.run(run())
+        assert b"".join(chunks) == b"a" * 100
+        assert len(chunks) == 4
+
+    def test_stream_raises_on_error_status(self):
+        """오류 상태 코드는 본문을 읽기 전에 예외 발생"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+        client = HTTPClient(transport=transport)
+
+        async def run():
+            async for _ in client.iter_bytes("https://example.com"):
+                pass
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+    def test_stream_releases_slot_during_retry_backoff(self, monkeypatch):
+        """재시도 대기 중에는 호스트 슬롯을 반납하고, 본문을 읽는 동안에는 유지"""
+        responses = [httpx.Response(503), httpx.Response(200, content=b"ok")]
+        limiter = HostLimiter(default=HostLimit(concurrency=1))
+        client = HTTPClient(
+            transport=httpx.MockTransport(lambda request: responses.pop(0)),
+            limiter=limiter,
+            retry_policy=RetryPolicy(base_delay=0.001),
+        )
+        free_during_backoff = []
+        real_sleep = asyncio.sleep
+
+        async def sleep(delay):
+            free_during_backoff.append(limiter._semaphores["example.com"]._value == 1)
+            await real_sleep(0)
+
+        monkeypatch.setattr("src.utils.http_client.asyncio.sleep", sleep)
+
+        async def run():
+            async with client.stream("https://example.com") as response:
+                held = limiter._semaphores["example.com"]._value == 0
+                return held, await response.aread()
+
+        held, body = asyncio.run(run())
+        assert free_during_backoff == [True]
+        assert held and body == b"ok"
+        assert limiter._semaphores["example.com"]._value == 1
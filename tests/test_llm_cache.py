@@ -0,0 +1,179 @@
+"""
+LLM 응답 캐시 테스트
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.analyzers.llm_cache import LLMResponseCache
+from src.analyzers.llm_client import LLMClient, TokenMonitor
+
+
+@pytest.fixture
+def cache():
+    cache = LLMResponseCache(":memory:")
+    yield cache
+    cache.close()
+
+
+class TestLLMResponseCache:
+    """캐시 저장소 테스트"""
+
+    def test_key_covers_request(self):
+        key = LLMResponseCache.make_key("openai", "gpt-4o-mini", "sys", "질문", {"a": 1, "b": 2})
+
+        assert key == LLMResponseCache.make_key("openai", "gpt-4o-mini", "sys", "질문", {"b": 2, "a": 1})
+        assert key != LLMResponseCache.make_key("openai", "gpt-4o", "sys", "질문", {"a": 1, "b": 2})
+        assert key != LLMResponseCache.make_key("openai", "gpt-4o-mini", None, "질문", {"a": 1, "b": 2})
+        assert key != LLMResponseCache.make_key("openai", "gpt-4o-mini", "sys", "질문", {"a": 1, "b": 3})
+
+    def test_hit_and_miss(self, cache):
+        assert cache.get("k") is None
+        cache.set("k", "openai", "gpt-4o-mini", "응답")
+
+        assert cache.get("k") == "응답"
+        assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+    def test_empty_response_not_stored(self, cache):
+        cache.set("k", "openai", "gpt-4o-mini", "")
+        assert len(cache) == 0
+
+    def test_ttl_expiry(self):
+        cache = LLMResponseCache(":memory:", ttl_seconds=0)
+        cache.set("k", "openai", "gpt-4o-mini", "응답")
+
+        assert cache.get("k") is None
+
+    def test_lru_eviction_by_size(self):
+        cache = LLMResponseCache(":memory:", max_bytes=10)
+        cache.set("a", "openai", "m", "12345")
+        cache.set("b", "openai", "m", "12345")
+        cache.get("a")  # b가 가장 오래 사용하지 않은 항목
+        cache.set("c", "openai", "m", "12345")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "12345" and cache.get("c") == "12345"
+        assert cache.stats["evictions"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "llm.db")
+        first = LLMResponseCache(path)
+        first.set("k", "openai", "m", "응답")
+        first.close()
+
+        assert LLMResponseCache(path).get("k") == "응답"
+
+
+class TestClientCache:
+    """LLMClient 캐시 연동 테스트"""
+
+    @pytest.fixture
+    def client(self, cache):
+        with patch("src.analyzers.llm_client.settings") as settings:
+            settings.openai_api_key = "test"
+            client = LLMClient("openai", response_cache=cache)
+        monitor = TokenMonitor()
+        with patch.object(LLMClient, "token_monitor", monitor):
+            yield client
+
+    def test_sync_generate_reuses_response(self, client):
+        with patch.object(client, "_generate_openai", return_value="응답") as generate:
+            assert client.generate("질문", "시스템") == "응답"
+            assert client.generate("질문", "시스템") == "응답"
+            assert client.generate("질문", "시스템", max_tokens=10) == "응답"
+
+        assert generate.call_count == 2
+        assert client.token_monitor.get_summary()["cache"] == {
+            "hits": 1, "misses": 2, "hit_rate": 0.333,
+        }
+
+    def test_async_generate_reuses_response(self, client):
+        with patch.object(client, "_agenerate", AsyncMock(return_value="응답")) as agenerate:
+
+            async def run():
+                await client.agenerate("질문")
+                return await client.agenerate("질문")
+
+            assert asyncio.run(run()) == "응답"
+
+        assert agenerate.await_count == 1
+
+
+class TestPromptCaching:
+    """제공자 프롬프트 캐시 테스트"""
+
+    @staticmethod
+    def _client(provider, prompt_caching=True):
+        with patch("src.analyzers.llm_client.settings") as settings:
+            settings.openai_api_key = settings.anthropic_api_key = "test"
+            return LLMClient(provider, prompt_caching=prompt_caching)
+
+    # 제공자 최소 캐시 길이(Haiku 2048토큰)를 넘는 시스템 프롬프트
+    LONG_SYSTEM = "시스템 프롬프트 " * 1000
+
+    def test_anthropic_marks_system_prompt(self):
+        request = self._client("anthropic")._anthropic_request("질문", self.LONG_SYSTEM, {})
+
+        assert request["system"] == [
+            {"type": "text", "text": self.LONG_SYSTEM, "cache_control": {"type": "ephemeral"}}
+        ]
+        plain = self._client("anthropic", prompt_caching=False)._anthropic_request(
+            "질문", self.LONG_SYSTEM, {}
+        )
+        assert plain["system"] == self.LONG_SYSTEM
+
+    def test_openai_cache_key_follows_system_prompt(self):
+        client = self._client("openai")
+        first = client._openai_request("질문 1", self.LONG_SYSTEM, {})
+        second = client._openai_request("질문 2", self.LONG_SYSTEM, {})
+
+        assert first["prompt_cache_key"] == second["prompt_cache_key"]
+        assert "prompt_cache_key" not in client._openai_request("질문", None, {})
+
+    def test_short_system_prompt_skips_cache_markers(self):
+        """최소 캐시 길이보다 짧은 시스템 프롬프트에는 캐시 표시를 붙이지 않음"""
+        assert "prompt_cache_key" not in self._client("openai")._openai_request(
+            "질문", "시스템", {}
+        )
+        assert self._client("anthropic")._anthropic_request("질문", "시스템", {})["system"] == "시스템"
+
+        # Haiku는 최소 길이가 2048토큰이라 1024토큰 이상이어도 생략
+        medium = "시스템 프롬프트 " * 300
+        client = self._client("anthropic")
+        assert client._anthropic_request("질문", medium, {})["system"] == medium
+        assert isinstance(
+            client._anthropic_request("질문", medium, {"model": "claude-sonnet-4-5"})["system"],
+            list,
+        )
+
+    def test_cached_tokens_reduce_cost(self):
+        monitor = TokenMonitor()
+        # Anthropic: 캐시 읽기 0.1배, 쓰기 1.25배
+        usage = monitor.record_usage(
+            prompt_tokens=3000, completion_tokens=0, model="claude-3-haiku-20240307",
+            provider="anthropic", cached_tokens=2000, cache_write_tokens=0,
+        )
+
+        assert usage.cached_tokens == 2000
+        assert usage.estimated_cost == pytest.approx((1000 + 2000 * 0.1) / 1000 * 0.00025)
+        assert usage.cache_savings == pytest.approx(2000 * 0.9 / 1000 * 0.00025)
+        assert monitor.get_summary()["total_cached_tokens"] == 2000
+
+    def test_anthropic_usage_includes_cache_tokens(self):
+        client = self._client("anthropic")
+        monitor = TokenMonitor()
+        response = SimpleNamespace(
+            usage=SimpleNamespace(
+                input_tokens=10, output_tokens=5,
+                cache_read_input_tokens=1500, cache_creation_input_tokens=0,
+            ),
+            content=[SimpleNamespace(text="응답")],
+        )
+
+        with patch.object(LLMClient, "token_monitor", monitor):
+            assert client._anthropic_result(response, "claude-3-haiku-20240307") == "응답"
+
+        usage = monitor.usage_history[-1]
+        assert usage.prompt_tokens == 1510 and usage.cached_tokens == 1500
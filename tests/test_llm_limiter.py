@@ -0,0 +1,110 @@
+"""
+LLM 제공자별 동시성/속도 제한 테스트
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from src.analyzers.llm_client import LLMClient, TokenMonitor
+from src.analyzers.llm_limiter import ProviderLimit, ProviderLimiter, estimate_tokens
+from src.utils.rate_limiter import TokenBucket
+
+
+class TestProviderLimiter:
+    """제공자별 제한기 테스트"""
+
+    def test_concurrency_bounded_per_provider(self):
+        limiter = ProviderLimiter({"openai": ProviderLimit(concurrency=2)})
+        active = {"now": 0, "peak": 0}
+
+        async def call():
+            async with limiter.limit("openai", tokens=10):
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+                await asyncio.sleep(0.01)
+                active["now"] -= 1
+
+        async def run():
+            await asyncio.gather(*[call() for _ in range(6)])
+
+        asyncio.run(run())
+
+        assert active["peak"] == 2
+        stats = limiter.get_stats()["openai"]
+        assert stats["requests"] == 6
+        assert stats["reserved_tokens"] == 60
+
+    def test_token_budget_limits_rate(self):
+        """분당 토큰 한도를 넘는 요청은 예산이 찰 때까지 대기"""
+        # 초당 100토큰, 버스트 6000토큰 → 6000 + 2 * 2초 분량은 즉시 불가
+        limiter = ProviderLimiter(
+            {"openai": ProviderLimit(concurrency=5, tokens_per_minute=6000)}
+        )
+
+        async def run():
+            started = time.monotonic()
+            async with limiter.limit("openai", tokens=6000):
+                pass
+            async with limiter.limit("openai", tokens=5):
+                pass
+            return time.monotonic() - started
+
+        assert asyncio.run(run()) >= 0.04
+
+    def test_token_bucket_multi_acquire(self):
+        """여러 토큰을 한 번에 요청하면 부족분만큼 대기"""
+
+        async def run():
+            bucket = TokenBucket(rate=100, capacity=10)
+            started = time.monotonic()
+            await bucket.acquire(10)
+            await bucket.acquire(5)
+            return time.monotonic() - started
+
+        assert asyncio.run(run()) >= 0.045
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("a" * 100, None) == 51
+
+
+class TestAsyncGenerate:
+    """비동기 생성 테스트"""
+
+    def test_agenerate_records_usage(self):
+        with patch("src.analyzers.llm_client.settings") as settings:
+            settings.openai_api_key = "test"
+            client = LLMClient("openai")
+
+        response = SimpleNamespace(
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+            choices=[SimpleNamespace(message=SimpleNamespace(content="안녕"))],
+        )
+        async_client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=AsyncMock(return_value=response)))
+        )
+        before = LLMClient.token_monitor.total_prompt_tokens
+
+        with patch.object(LLMClient, "_get_async_client", return_value=async_client):
+            text = asyncio.run(client.agenerate("질문", "시스템", max_tokens=50))
+
+        assert text == "안녕"
+        assert LLMClient.token_monitor.total_prompt_tokens == before + 10
+        kwargs = async_client.chat.completions.create.call_args.kwargs
+        assert kwargs["messages"][0] == {"role": "system", "content": "시스템"}
+        assert kwargs["max_tokens"] == 50
+
+
+class TestBatchStats:
+    """배치 절감 효과 집계 테스트"""
+
+    def test_summary_reports_savings(self):
+        monitor = TokenMonitor()
+        monitor.record_usage(100, 50, "gpt-4o-mini", "openai", latency_seconds=2.0)
+        monitor.record_batch(items=10, fallback_items=1, prompt_tokens_saved=900, latency_seconds=2.0)
+
+        batching = monitor.get_summary()["batching"]
+
+        assert batching["requests_saved"] == 8
+        assert batching["prompt_tokens_saved"] == 900
+        assert batching["latency_saved_seconds"] == 16.0
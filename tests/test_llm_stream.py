@@ -0,0 +1,127 @@
+"""
+스트리밍 생성 / 증분 JSON 파서 테스트
+"""
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.analyzers.llm_cache import LLMResponseCache
+from src.analyzers.llm_client import LLMClient, TokenMonitor
+from src.analyzers.tech_analyzer import TechAnalyzer
+from src.scrapers.models import TrendingRepository
+from src.utils.json_stream import IncrementalJSONParser
+
+RESPONSE = (
+    '```json\n{"what_is_it": "도구 \\"x\\" {a}", "use_cases": ["a", "b,}"], '
+    '"difficulty": "고급", "meta": {"n": [1, {"z": null}]}, "score": 12}\n```'
+)
+
+
+def chunks(text, size=3):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestIncrementalJSONParser:
+    """증분 JSON 파서 테스트"""
+
+    def test_fields_complete_in_order(self):
+        parser = IncrementalJSONParser()
+        emitted = []
+        for chunk in chunks(RESPONSE):
+            emitted.extend(key for key, _ in parser.feed(chunk))
+
+        assert emitted == ["what_is_it", "use_cases", "difficulty", "meta", "score"]
+        assert parser.done
+        assert parser.fields == json.loads(RESPONSE[8:-4])
+
+    def test_field_available_before_object_closes(self):
+        parser = IncrementalJSONParser()
+        prefix = RESPONSE[:RESPONSE.index("use_cases")]
+
+        assert parser.feed(prefix) == [("what_is_it", '도구 "x" {a}')]
+        assert not parser.done
+
+    def test_trailing_scalar_and_surrounding_text(self):
+        parser = IncrementalJSONParser()
+        parser.feed('결과: {"a": true, "b": null, "c": -1.5} 끝 {"d": 1}')
+
+        assert parser.fields == {"a": True, "b": None, "c": -1.5}
+
+
+def make_client(cache=None):
+    with patch("src.analyzers.llm_client.settings") as settings:
+        settings.openai_api_key = "test"
+        return LLMClient("openai", response_cache=cache, prompt_caching=False)
+
+
+async def collect(agen):
+    return [chunk async for chunk in agen]
+
+
+class TestStreamingGenerate:
+    """스트리밍 생성 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def monitor(self):
+        monitor = TokenMonitor()
+        with patch.object(LLMClient, "token_monitor", monitor):
+            yield monitor
+
+    @staticmethod
+    def _fake_stream(parts, closed):
+        async def stream_chunks(prompt, system_prompt, kwargs, usage):
+            try:
+                for part in parts:
+                    yield part
+            finally:
+                closed.append(True)
+
+        return stream_chunks
+
+    def test_token_budget_aborts_generation(self, monitor):
+        client = make_client()
+        closed = []
+        client._stream_chunks = self._fake_stream(["x" * 100] * 50, closed)
+
+        received = asyncio.run(collect(client.stream("질문", token_budget=120)))
+
+        # 2글자당 1토큰 추정: 300글자(150토큰)에서 중단
+        assert len(received) == 3
+        assert closed == [True]
+        assert monitor.usage_history[-1].completion_tokens == 151
+
+    def test_complete_stream_is_cached(self):
+        cache = LLMResponseCache(":memory:")
+        client = make_client(cache)
+        client._stream_chunks = self._fake_stream(chunks(RESPONSE), [])
+
+        assert "".join(asyncio.run(collect(client.stream("질문")))) == RESPONSE
+        client._stream_chunks = MagicMock(side_effect=AssertionError("cache miss"))
+        assert asyncio.run(collect(client.stream("질문"))) == [RESPONSE]
+
+
+class TestStreamingAnalysis:
+    """스트리밍 분석 테스트"""
+
+    def test_fields_forwarded_as_they_complete(self):
+        with patch("src.analyzers.tech_analyzer.LLMClient"):
+            analyzer = TechAnalyzer(use_cache=False)
+
+        async def stream(prompt, system_prompt=None, token_budget=None, **kwargs):
+            for chunk in chunks(RESPONSE):
+                yield chunk
+
+        analyzer.llm.stream = stream
+        fields = []
+        repo = TrendingRepository(name="a/b", url="https://github.com/a/b")
+
+        analysis = asyncio.run(
+            analyzer.analyze_repository_stream(repo, on_field=lambda k, v: fields.append((k, v)))
+        )
+
+        assert [k for k, _ in fields] == ["ai_summary", "ai_use_cases", "ai_difficulty"]
+        assert analysis["ai_summary"] == '도구 "x" {a}'
+        assert analysis["ai_related_tech"] == []
+        assert analyzer._analysis_cache["a/b"] == analysis
@@ -0,0 +1,78 @@
+"""
+뉴스 통합 수집기 테스트
+"""
+import asyncio
+import time
+
+from src.scrapers.models import NewsArticle
+from src.scrapers.news_aggregator import NewsAggregator
+from src.scrapers.registry import NewsSource, register_source, available_sources
+
+
+class FakeScraper:
+    """지연 시간을 흉내내는 테스트용 스크래퍼"""
+
+    def __init__(self, name, delay, urls, fail=False):
+        self.name = name
+        self.delay = delay
+        self.urls = urls
+        self.fail = fail
+
+    async def scrape(self, limit):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return [
+            NewsArticle(title=f"{self.name} {url}", url=url, source=self.name)
+            for url in self.urls[:limit]
+        ]
+
+
+def _register(name, delay, urls, fail=False, timeout=None):
+    register_source(
+        NewsSource(
+            name=name,
+            factory=lambda client, **_: FakeScraper(name, delay, urls, fail),
+            timeout=timeout,
+        )
+    )
+
+
+class TestSourceRegistry:
+    """소스 레지스트리 테스트"""
+
+    def test_builtin_sources_registered(self):
+        """기본 소스가 등록되어 있음"""
+        assert {"hacker_news", "geeknews", "yozm_it"} <= set(available_sources())
+
+    def test_streams_in_completion_order(self):
+        """먼저 끝난 소스의 기사부터 반환하고 URL 중복은 건너뜀"""
+        _register("fake_fast", 0.0, ["https://a", "https://b"])
+        _register("fake_slow", 0.05, ["https://b", "https://c"])
+        aggregator = NewsAggregator(sources=["fake_slow", "fake_fast"])
+
+        async def run():
+            return [a async for a in aggregator.iter_articles()]
+
+        articles = asyncio.run(run())
+
+        assert [a.url for a in articles] == ["https://a", "https://b", "https://c"]
+        assert articles[1].source == "fake_fast"
+
+    def test_timeout_and_failure_yield_partial_results(self):
+        """제한 시간 초과/실패 소스가 있어도 나머지 결과는 반환"""
+        _register("fake_ok", 0.0, ["https://ok"])
+        _register("fake_hang", 5.0, ["https://hang"], timeout=0.05)
+        _register("fake_error", 0.0, [], fail=True)
+        aggregator = NewsAggregator(sources=["fake_ok", "fake_hang", "fake_error"])
+
+        started = time.monotonic()
+        articles = asyncio.run(aggregator.collect_all())
+
+        assert time.monotonic() - started < 1.0
+        assert [a.url for a in articles] == ["https://ok"]
+        assert aggregator.last_report["fake_hang"]["status"] == "timeout"
+        assert aggregator.last_report["fake_error"]["status"] == "error"
+        assert aggregator.last_report["fake_ok"] == {
+            "status": "ok", "count": 1, "elapsed": aggregator.last_report["fake_ok"]["elapsed"]
+        }
@@ -71,6 +71,111 @@ class TestScraperPerformance:
             assert elapsed_time < 2.0, f"수집 시간이 너무 깁니다: {elapsed_time:.2f}초"
 
 
+class TestHTMLParserPerformance:
+    """HTML 파서 백엔드 성능 테스트"""
+
+    def test_parse_time_per_backend(self, trending_html):
+        """백엔드별 페이지 파싱 시간 측정 (결과는 모든 백엔드에서 동일해야 함)"""
+        from bs4 import BeautifulSoup
+        from src.scrapers.github_trending import GitHubTrendingScraper
+        from src.utils.html_parser import HTMLParser, available_backends
+
+        html = trending_html(count=25, noise=2000)
+        iterations = 5
+        timings = {}
+        results = {}
+
+        # 기준: 전체 트리를 html.parser로 생성
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            soup = BeautifulSoup(html, "html.parser")
+            soup.find_all("article", class_="Box-row")
+        timings["full-tree html.parser"] = (time.perf_counter() - start_time) / iterations
+
+        for backend in available_backends():
+            scraper = GitHubTrendingScraper(parser=HTMLParser(backend))
+            start_time = time.perf_counter()
+            for _ in range(iterations):
+                repos = scraper._parse_repositories(html, 25)
+            timings[backend] = (time.perf_counter() - start_time) / iterations
+            results[backend] = [(r.name, r.stars, r.forks, r.stars_today) for r in repos]
+
+        for name, seconds in timings.items():
+            print(f"{name:>24}: {seconds * 1000:.2f}ms/page")
+
+        expected = results["html.parser"]
+        assert len(expected) == 25
+        assert expected[0][:3] == ("owner1/repo1", 1234, 112)
+        for backend, parsed in results.items():
+            assert parsed == expected, f"{backend} 파싱 결과가 다릅니다"
+
+
+class TestRecordPerformance:
+    """내부 레코드 vs Pydantic 모델 성능 테스트"""
+
+    def test_construction_and_serialization_per_10k(self):
+        """10,000개 생성/직렬화 비용 비교"""
+        from src.scrapers.models import RepositoryRecord, TrendingRepository, to_repositories
+        from src.utils.serialization import to_rows
+
+        count = 10_000
+        fields = [
+            dict(
+                name=f"owner/repo{i}",
+                url=f"https://github.com/owner/repo{i}",
+                description="A fast library",
+                language="Python",
+                stars=i,
+                stars_today=i % 100,
+                forks=i // 10,
+            )
+            for i in range(count)
+        ]
+        timings = {}
+
+        # 생성 비용은 GC 등의 영향을 줄이기 위해 3회 중 최솟값 사용
+        for label, cls in (("model 생성", TrendingRepository), ("record 생성", RepositoryRecord)):
+            best = None
+            for _ in range(3):
+                start_time = time.perf_counter()
+                built = [cls(**f) for f in fields]
+                elapsed = time.perf_counter() - start_time
+                best = elapsed if best is None else min(best, elapsed)
+            timings[label] = best
+            if cls is TrendingRepository:
+                models = built
+            else:
+                records = built
+
+        start_time = time.perf_counter()
+        model_rows = []
+        for repo in models:
+            row = repo.model_dump()
+            row["collected_at"] = row["collected_at"].isoformat()
+            model_rows.append(row)
+        timings["model_dump + isoformat"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        record_rows = to_rows(records)
+        timings["record to_rows"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        bulk_rows = to_rows(models)
+        timings["to_rows 일괄"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        validated = to_repositories(records)
+        timings["경계 일괄 검증"] = time.perf_counter() - start_time
+
+        for name, seconds in timings.items():
+            print(f"{name:>24}: {seconds * 1000:.1f}ms / 10k")
+
+        assert len(validated) == count and validated[0].name == "owner/repo0"
+        assert record_rows[1]["stars"] == model_rows[1]["stars"] == 1
+        assert bulk_rows == model_rows
+        assert not hasattr(records[0], "__dict__")
+
+
 class TestFormatterPerformance:
     """포맷터 성능 테스트"""
 
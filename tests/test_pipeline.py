@@ -0,0 +1,95 @@
+"""
+파이프라인 테스트
+외부 서비스 없이 모의 스크래퍼와 로컬 SQLite로 main.py 파이프라인을 실행합니다.
+"""
+import asyncio
+
+import pytest
+
+from config.settings import settings
+from src.scrapers.models import ArticleRecord, RepositoryRecord
+
+
+class FakeNewsScraper:
+    """후보 기사를 limit개 반환하는 테스트용 스크래퍼"""
+
+    def __init__(self, source):
+        self.source = source
+
+    async def scrape(self, limit):
+        return [
+            ArticleRecord(
+                title=f"{self.source} 기사 {i}",
+                url=f"https://{self.source}.example/{i}",
+                source=self.source,
+                score=i,
+            )
+            for i in range(limit)
+        ]
+
+
+class FakeRepoScraper:
+    async def scrape(self, limit):
+        return [RepositoryRecord(name="a/b", url="https://github.com/a/b", stars=10)]
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """API 키/알림 없이 tmp 경로의 SQLite와 수집 이력을 쓰는 파이프라인"""
+    monkeypatch.chdir(tmp_path)
+    for name, value in {
+        "storage_backend": "sqlite",
+        "sqlite_path": str(tmp_path / "news.db"),
+        "seen_index_path": str(tmp_path / "seen.db"),
+        "dedup_enabled": False,
+        "hn_incremental": False,
+        "news_sources": ["hacker_news", "geeknews"],
+        "news_candidates_per_source": 30,
+        "news_top_k": 10,
+        "snapshot_export_enabled": False,
+        "openai_api_key": None,
+        "anthropic_api_key": None,
+        "google_api_key": None,
+        "slack_webhook_url": None,
+        "discord_webhook_url": None,
+        "resend_api_key": None,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+
+    from main import DailyDigestPipeline
+
+    pipeline = DailyDigestPipeline()
+    pipeline.github_scraper = FakeRepoScraper()
+    pipeline.news_aggregator.scrapers = {
+        "hacker_news": FakeNewsScraper("hn"),
+        "geeknews": FakeNewsScraper("gn"),
+    }
+    return pipeline
+
+
+class TestPipeline:
+    """파이프라인 랭킹/저장 범위 테스트"""
+
+    def test_only_top_k_persisted(self, pipeline):
+        """후보 30+30개 중 랭킹 상위 news_top_k개만 다이제스트에 넣고 저장"""
+        digest = asyncio.run(pipeline.run())
+
+        assert len(digest.news_articles) == 10
+        assert len(pipeline.db.get_news_articles(limit=100)) == 10
+
+    def test_only_digest_articles_marked_seen(self, pipeline):
+        """수집 이력에는 다이제스트에 들어간 기사만 기록"""
+        asyncio.run(pipeline.run())
+
+        assert pipeline.news_aggregator.seen_index._count() == 10
+
+    def test_failed_upsert_skips_mark_seen(self, pipeline, monkeypatch):
+        """뉴스 저장이 일부라도 실패하면 수집 이력을 기록하지 않음"""
+        monkeypatch.setattr(
+            pipeline.db,
+            "upsert_news_articles",
+            lambda rows: {"inserted": 0, "updated": 0, "failed": len(rows)},
+        )
+        asyncio.run(pipeline.run())
+
+        assert pipeline.news_aggregator.seen_index._count() == 0
@@ -0,0 +1,110 @@
+"""
+기사 랭킹 테스트
+"""
+import time
+from datetime import datetime, timedelta
+
+from src.scrapers.models import NewsArticle
+from src.scrapers.ranking import ArticleRanker, SourceCalibration
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def _article(title, source, score=None, hours_ago=0.0):
+    return NewsArticle(
+        title=title,
+        url=f"https://example.com/{title}",
+        source=source,
+        score=score,
+        published_at=NOW - timedelta(hours=hours_ago),
+        collected_at=NOW,
+    )
+
+
+class TestArticleRanker:
+    """ArticleRanker 테스트"""
+
+    def test_calibrates_scores_across_sources(self):
+        """HN 포인트와 GeekNews 투표 수를 소스 기준 점수로 비교"""
+        ranker = ArticleRanker()
+        articles = [
+            _article("hn-mid", "Hacker News", score=30),
+            _article("gn-top", "GeekNews", score=15),
+            _article("hn-top", "Hacker News", score=500),
+        ]
+
+        ranked = ranker.rank(articles, now=NOW)
+
+        assert [a.title for a in ranked] == ["hn-top", "gn-top", "hn-mid"]
+
+    def test_time_decay(self):
+        """같은 인기도면 최근 기사가 먼저"""
+        ranker = ArticleRanker(half_life_hours=12)
+        articles = [
+            _article("old", "Hacker News", score=300, hours_ago=48),
+            _article("new", "Hacker News", score=100, hours_ago=1),
+        ]
+
+        assert [a.title for a in ranker.rank(articles, now=NOW)] == ["new", "old"]
+
+    def test_undated_sources_not_treated_as_fresh(self):
+        """발행 시각이 없는 기사는 수집 시각으로 감쇠하지 않고 후보들의 중앙값을 사용"""
+        ranker = ArticleRanker(half_life_hours=12)
+        articles = [
+            _article("hn-fresh", "Hacker News", score=200, hours_ago=1),
+            _article("hn-old", "Hacker News", score=200, hours_ago=36),
+            _article("hn-mid", "Hacker News", score=200, hours_ago=12),
+            NewsArticle(title="gn", url="https://news.hada.io/1", source="GeekNews", score=20, collected_at=NOW),
+        ]
+
+        scores = ranker.score(articles, now=NOW)
+
+        assert scores[3] == scores[2]
+        assert [a.title for a in ranker.rank(articles, now=NOW)][0] == "hn-fresh"
+
+    def test_missing_score_uses_source_default(self):
+        ranker = ArticleRanker({"요즘IT": SourceCalibration(default_popularity=0.9)})
+        articles = [
+            _article("hn", "Hacker News", score=50),
+            _article("yozm", "요즘IT"),
+        ]
+
+        assert ranker.rank(articles, now=NOW)[0].title == "yozm"
+
+    def test_top_k(self):
+        ranker = ArticleRanker()
+        articles = [_article(f"a{i}", "Hacker News", score=i) for i in range(50)]
+
+        ranked = ranker.rank(articles, top_k=5, now=NOW)
+
+        assert [a.title for a in ranked] == ["a49", "a48", "a47", "a46", "a45"]
+        assert ranker.rank([], top_k=5) == []
+
+    def test_ranks_thousands_quickly(self):
+        """후보 5000개 랭킹 성능"""
+        ranker = ArticleRanker()
+        sources = ["Hacker News", "GeekNews", "요즘IT"]
+        articles = [
+            _article(f"a{i}", sources[i % 3], score=None if i % 3 == 2 else i % 700, hours_ago=i % 72)
+            for i in range(5000)
+        ]
+
+        started = time.perf_counter()
+        ranked = ranker.rank(articles, top_k=10, now=NOW)
+        elapsed = time.perf_counter() - started
+
+        print(f"\n기사 5000개 랭킹: {elapsed * 1000:.1f}ms")
+        assert len(ranked) == 10
+        assert elapsed < 1.0
+
+    def test_accepts_records(self):
+        """검증 전 ArticleRecord도 그대로 랭킹"""
+        from src.scrapers.models import ArticleRecord
+
+        ranker = ArticleRanker()
+        records = [
+            ArticleRecord(title="low", url="https://a", source="GeekNews", score=1, collected_at=NOW),
+            ArticleRecord(title="high", url="https://b", source="GeekNews", score=30, collected_at=NOW),
+        ]
+
+        assert [r.title for r in ranker.rank(records, now=NOW)] == ["high", "low"]
@@ -0,0 +1,145 @@
+"""
+수집 이력 인덱스 테스트
+"""
+import asyncio
+from datetime import date, timedelta
+
+from src.scrapers.hacker_news import HackerNewsScraper
+from src.scrapers.news_aggregator import NewsAggregator
+from src.scrapers.registry import NewsSource, register_source
+from src.scrapers.seen_index import SeenArticleIndex
+from src.scrapers.models import NewsArticle
+from src.utils.bloom import BloomFilter
+from src.utils.url_utils import canonicalize_url, hn_item_id
+
+YESTERDAY = date.today() - timedelta(days=1)
+
+
+class TestHNURL:
+    """Hacker News URL 정규화 테스트"""
+
+    def test_item_url_normalized(self):
+        assert canonicalize_url("http://news.ycombinator.com/item?p=2&id=42#c1") == (
+            "https://news.ycombinator.com/item?id=42"
+        )
+        assert hn_item_id("https://news.ycombinator.com/item?id=42") == 42
+        assert hn_item_id("https://example.com/item?id=42") is None
+
+    def test_scraper_maps_target_to_item(self):
+        """외부 링크 기사는 토론 페이지를 별칭으로 가짐"""
+        scraper = HackerNewsScraper()
+        article = scraper._to_article(7, {"type": "story", "title": "t", "url": "https://a.dev/x/"})
+        scraper._remember_item(7, article)
+
+        assert scraper.aliases(article) == ["https://news.ycombinator.com/item?id=7"]
+
+
+class TestBloomFilter:
+    """블룸 필터 테스트"""
+
+    def test_no_false_negatives_and_low_false_positives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"https://a.dev/{i}")
+
+        assert all(f"https://a.dev/{i}" in bloom for i in range(1000))
+        false_positives = sum(f"https://b.dev/{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+
+class TestSeenArticleIndex:
+    """수집 이력 인덱스 테스트"""
+
+    def test_only_previous_days_count_as_seen(self):
+        """같은 날 재실행은 걸러내지 않음"""
+        index = SeenArticleIndex(":memory:")
+        index.mark_seen(["https://a.dev/old?utm_source=x"], today=YESTERDAY)
+        index.mark_seen(["https://a.dev/new"])
+
+        assert index.seen_before(["https://a.dev/old"])
+        assert not index.seen_before(["https://a.dev/new"])
+        assert not index.seen_before(["https://a.dev/unknown"])
+        assert index.stats["bloom_negative"] >= 1
+
+    def test_bloom_persisted_and_rebuilt(self, tmp_path):
+        """저장된 블룸 필터가 저장소와 어긋나면 다시 생성"""
+        path = str(tmp_path / "seen.db")
+        index = SeenArticleIndex(path)
+        index.mark_seen(["https://a.dev/1"], today=YESTERDAY)
+        index.close()
+
+        index = SeenArticleIndex(path)
+        assert index.seen_before(["https://a.dev/1"])
+        # save() 없이 추가된 행이 있어도 다음 로드에서 누락되지 않음
+        index.mark_seen(["https://a.dev/2"], today=YESTERDAY)
+        index._conn.close()
+
+        index = SeenArticleIndex(path)
+        assert index.seen_before(["https://a.dev/2"])
+
+    def test_prune_old_entries(self):
+        index = SeenArticleIndex(":memory:", retention_days=7)
+        index.mark_seen(["https://a.dev/old"], today=date.today() - timedelta(days=30))
+
+        assert index.prune() == 1
+        assert index.first_seen("https://a.dev/old") is None
+
+
+class FakeHNScraper:
+    """토론 페이지 별칭을 가진 테스트용 스크래퍼"""
+
+    async def scrape(self, limit):
+        return [NewsArticle(title="HN story", url="https://a.dev/post", source="Hacker News")]
+
+    def aliases(self, article):
+        return ["https://news.ycombinator.com/item?id=1"]
+
+
+class FakeLinkScraper:
+    async def scrape(self, limit):
+        await asyncio.sleep(0.01)
+        return [
+            NewsArticle(title="Discussion", url="https://news.ycombinator.com/item?id=1", source="GN"),
+            NewsArticle(title="Old", url="https://b.dev/old", source="GN"),
+            NewsArticle(title="Fresh", url="https://b.dev/fresh", source="GN"),
+        ]
+
+
+class TestAggregatorSeenIndex:
+    """NewsAggregator 수집 이력 연동 테스트"""
+
+    def test_skips_previously_seen_and_aliases(self):
+        register_source(NewsSource(name="fake_hn", factory=lambda client, **_: FakeHNScraper()))
+        register_source(NewsSource(name="fake_link", factory=lambda client, **_: FakeLinkScraper()))
+        index = SeenArticleIndex(":memory:")
+        index.mark_seen(["https://b.dev/old"], today=YESTERDAY)
+        aggregator = NewsAggregator(sources=["fake_hn", "fake_link"], seen_index=index)
+
+        async def run():
+            return [a async for a in aggregator.iter_articles()]
+
+        articles = asyncio.run(run())
+
+        assert [a.url for a in articles] == ["https://a.dev/post", "https://b.dev/fresh"]
+        assert aggregator.last_report["fake_link"]["seen_before"] == 1
+        # 오늘 수집한 기사는 같은 날 재실행에서 그대로 반환
+        assert [a.url for a in asyncio.run(run())] == ["https://a.dev/post", "https://b.dev/fresh"]
+
+    def test_only_persisted_articles_marked_seen(self):
+        """수집만 하고 저장하지 않은 기사는 이력에 남지 않고, 저장한 기사는 별칭까지 기록"""
+        register_source(NewsSource(name="fake_hn", factory=lambda client, **_: FakeHNScraper()))
+        register_source(NewsSource(name="fake_link", factory=lambda client, **_: FakeLinkScraper()))
+        index = SeenArticleIndex(":memory:")
+        aggregator = NewsAggregator(sources=["fake_hn", "fake_link"], seen_index=index)
+
+        async def run():
+            return [a async for a in aggregator.iter_articles()]
+
+        articles = asyncio.run(run())
+        assert index.first_seen("https://b.dev/fresh") is None
+
+        aggregator.mark_seen(articles[:1])
+
+        assert index.first_seen("https://a.dev/post") == date.today()
+        assert index.first_seen("https://news.ycombinator.com/item?id=1") == date.today()
+        assert index.first_seen("https://b.dev/fresh") is None
@@ -0,0 +1,90 @@
+"""
+일괄 직렬화 테스트
+"""
+import json
+from datetime import datetime
+
+import pytest
+
+from src.scrapers.models import (
+    ArticleRecord,
+    NewsArticle,
+    RepositoryRecord,
+    TrendingRepository,
+    to_articles,
+    to_repositories,
+)
+from src.utils.serialization import to_json, to_rows
+
+COLLECTED = datetime(2026, 1, 2, 3, 4, 5)
+
+
+class TestSerialization:
+    """to_rows / to_json 테스트"""
+
+    def test_rows_match_manual_conversion(self):
+        """model_dump + isoformat 수동 변환과 같은 결과"""
+        articles = [
+            NewsArticle(
+                title="t", url="https://a", source="GeekNews", score=3,
+                published_at=COLLECTED, collected_at=COLLECTED,
+            ),
+            NewsArticle(title="u", url="https://b", source="GeekNews", collected_at=COLLECTED),
+        ]
+
+        rows = to_rows(articles)
+
+        expected = []
+        for article in articles:
+            row = article.model_dump()
+            row["collected_at"] = row["collected_at"].isoformat()
+            if row["published_at"]:
+                row["published_at"] = row["published_at"].isoformat()
+            expected.append(row)
+        assert rows == expected
+
+    def test_json_bytes_and_exclude(self):
+        repos = [TrendingRepository(name="a/b", url="https://github.com/a/b", collected_at=COLLECTED)]
+
+        data = json.loads(to_json(repos, exclude={"ai_summary"}))
+
+        assert data[0]["collected_at"] == "2026-01-02T03:04:05"
+        assert "ai_summary" not in data[0]
+        assert to_json([]) == b"[]" and to_rows([]) == []
+
+    def test_records_and_mixed_types(self):
+        """dataclass 레코드도 직렬화, 타입이 섞이면 오류"""
+        record = ArticleRecord(title="t", url="https://a", source="HN", collected_at=COLLECTED)
+
+        assert to_rows([record])[0] == {
+            "title": "t", "url": "https://a", "source": "HN", "summary": None,
+            "category": None, "score": None, "published_at": None,
+            "collected_at": "2026-01-02T03:04:05",
+        }
+        with pytest.raises(TypeError):
+            to_rows([record, NewsArticle(title="t", url="https://a", source="HN")])
+
+
+class TestBoundaryValidation:
+    """저장/출력 직전 레코드 검증 테스트"""
+
+    def test_invalid_row_skipped_not_whole_batch(self):
+        """잘못된 행 하나 때문에 나머지 행이 버려지지 않음"""
+        records = [
+            ArticleRecord(title="ok", url="https://a", source="GeekNews", collected_at=COLLECTED),
+            ArticleRecord(title=None, url="https://b", source="GeekNews", collected_at=COLLECTED),
+            ArticleRecord(title="ok2", url="https://c", source="GeekNews", score="n/a"),
+        ]
+
+        articles = to_articles(records)
+
+        assert [a.url for a in articles] == ["https://a"]
+        assert isinstance(articles[0], NewsArticle)
+
+    def test_valid_rows_converted_in_bulk(self):
+        records = [RepositoryRecord(name=f"a/{i}", url=f"https://github.com/a/{i}", stars=i) for i in range(3)]
+
+        repos = to_repositories(records)
+
+        assert [r.stars for r in repos] == [0, 1, 2]
+        assert all(isinstance(r, TrendingRepository) for r in repos)
@@ -0,0 +1,65 @@
+"""
+컬럼형 스냅샷 내보내기 테스트
+"""
+from datetime import datetime
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.dataset as ds  # noqa: E402
+
+from src.database.snapshot_exporter import SnapshotExporter, arrow_schema  # noqa: E402
+from src.scrapers.models import (  # noqa: E402
+    DailyDigest, NewsArticle, TrendingRepository,
+)
+
+
+@pytest.fixture
+def digest():
+    return DailyDigest(
+        date=datetime(2026, 1, 2, 9, 0),
+        trending_repos=[
+            TrendingRepository(name="a/b", url="https://github.com/a/b", language="Python",
+                               stars=10, ai_use_cases=["cli"]),
+            TrendingRepository(name="c/d", url="https://github.com/c/d", language="Rust"),
+            TrendingRepository(name="e/f", url="https://github.com/e/f"),
+        ],
+        news_articles=[
+            NewsArticle(title="t1", url="https://a", source="GeekNews", score=5),
+            NewsArticle(title="t2", url="https://b", source="Hacker News", score=100),
+        ],
+        ai_hot_technologies=[{"name": "Rust", "reason": "fast"}],
+    )
+
+
+class TestSnapshotExporter:
+    """SnapshotExporter 테스트"""
+
+    def test_schema_from_model(self):
+        schema = arrow_schema(TrendingRepository)
+
+        assert schema.field("stars").type == pa.int64()
+        assert schema.field("collected_at").type == pa.timestamp("us")
+        assert schema.field("ai_use_cases").type == pa.list_(pa.string())
+        assert not schema.field("name").nullable
+
+    def test_partitioned_export(self, tmp_path, digest):
+        """날짜/언어/소스 파티션으로 저장되고 컬럼 단위로 읽힘"""
+        exporter = SnapshotExporter(str(tmp_path))
+
+        counts = exporter.export(digest, run_id="r1")
+        exporter.export(digest, run_id="r2")
+
+        assert counts == {"trending_repos": 3, "news_articles": 2, "daily_digests": 1}
+        assert (tmp_path / "trending_repos" / "date=2026-01-02" / "language=Python").is_dir()
+
+        repos = ds.dataset(tmp_path / "trending_repos", partitioning="hive")
+        table = repos.to_table(columns=["name", "stars"], filter=ds.field("language") == "Python")
+        assert table.num_columns == 2
+        assert table.to_pylist() == [{"name": "a/b", "stars": 10}] * 2
+
+        articles = ds.dataset(tmp_path / "news_articles", partitioning="hive").to_table()
+        assert sorted(set(articles.column("source").to_pylist())) == ["GeekNews", "Hacker News"]
+
+        digests = ds.dataset(tmp_path / "daily_digests", partitioning="hive").to_table()
+        assert digests.column("ai_hot_technologies").to_pylist()[0].startswith('[{"name": "Rust"')
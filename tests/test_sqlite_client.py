@@ -0,0 +1,285 @@
+"""
+SQLite 저장소 테스트
+"""
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.database.sqlite_client import SQLiteClient
+from src.database.storage import create_storage
+from src.database.supabase_client import SupabaseClient
+
+
+@pytest.fixture
+def db(tmp_path):
+    client = SQLiteClient(str(tmp_path / "daily_news.db"))
+    yield client
+    client.close()
+
+
+def _repo(name, collected_at, **extra):
+    return {
+        "name": name,
+        "url": f"https://github.com/{name}",
+        "language": "Python",
+        "stars": 1,
+        "collected_at": collected_at,
+        **extra,
+    }
+
+
+class TestSQLiteClient:
+    """SQLiteClient 테스트"""
+
+    def test_same_interface_as_supabase(self):
+        """SupabaseClient의 공개 메서드를 모두 제공"""
+        public = {name for name in vars(SupabaseClient) if not name.startswith("_")}
+        assert public <= set(dir(SQLiteClient))
+
+    def test_wal_mode(self, db):
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_trending_repos_and_ai_cache(self, db):
+        assert db.insert_trending_repos([
+            _repo("a/b", "2026-01-01T00:00:00", ai_summary="old", ai_use_cases=["x"]),
+            _repo("a/b", "2026-01-02T00:00:00", ai_summary="new", ai_use_cases=["y", "z"]),
+            _repo("c/d", "2026-01-03T00:00:00", language="Rust"),
+        ])
+
+        repos = db.get_trending_repos(limit=2)
+        assert [r["name"] for r in repos] == ["c/d", "a/b"]
+        assert [r["name"] for r in db.get_trending_repos(language="Rust")] == ["c/d"]
+
+        cached = db.get_cached_ai_analysis("a/b")
+        assert cached == {
+            "ai_summary": "new", "ai_use_cases": ["y", "z"],
+            "ai_difficulty": None, "ai_related_tech": None,
+        }
+        assert db.get_cached_ai_analysis("c/d") is None
+
+        repo_id = db.get_trending_repos(language="Rust")[0]["id"]
+        assert db.update_repo_ai_analysis(repo_id, {"ai_summary": "s", "ai_related_tech": ["go"]})
+        assert db.get_cached_ai_analysis("c/d")["ai_related_tech"] == ["go"]
+
+    def test_news_articles(self, db):
+        db.insert_news_articles([
+            {"title": "t1", "url": "https://a", "source": "GeekNews", "collected_at": "2026-01-01T00:00:00"},
+            {"title": "t2", "url": "https://b", "source": "Hacker News", "score": 3,
+             "published_at": None, "collected_at": "2026-01-02T00:00:00"},
+        ])
+
+        assert [a["title"] for a in db.get_news_articles()] == ["t2", "t1"]
+        assert [a["title"] for a in db.get_news_articles(source="GeekNews")] == ["t1"]
+
+    def test_daily_digest_upsert_and_ranges(self, db):
+        db.insert_or_update_daily_digest({"digest_date": "2026-01-01", "ai_daily_summary": "a"})
+        db.insert_or_update_daily_digest({
+            "digest_date": "2026-01-02", "ai_daily_summary": "b",
+            "ai_hot_technologies": [{"name": "Rust"}],
+        })
+        db.insert_or_update_daily_digest({"digest_date": "2026-01-01", "ai_daily_summary": "a2"})
+
+        assert db.get_daily_digest("2026-01-01")["ai_daily_summary"] == "a2"
+        assert db.get_latest_digest()["ai_hot_technologies"] == [{"name": "Rust"}]
+        assert db.get_all_digest_dates() == ["2026-01-02", "2026-01-01"]
+        assert len(db.get_digests_by_date_range("2026-01-01", "2026-01-01")) == 1
+        assert db.get_daily_digest("2025-12-31") is None
+
+    def test_failed_insert_returns_false(self, db):
+        assert db.insert_news_articles([{"title": "no url", "source": "x"}]) is False
+
+    def test_bulk_insert_performance(self, db):
+        """1000개 저장/조회 비용"""
+        repos = [_repo(f"owner/repo{i}", f"2026-01-01T00:{i % 60:02d}:00") for i in range(1000)]
+
+        started = time.perf_counter()
+        db.insert_trending_repos(repos)
+        inserted = time.perf_counter() - started
+        started = time.perf_counter()
+        rows = db.get_trending_repos(limit=100)
+        queried = time.perf_counter() - started
+
+        print(f"\nSQLite 1000개 삽입: {inserted * 1000:.1f}ms, 100개 조회: {queried * 1000:.1f}ms")
+        assert len(rows) == 100
+        assert inserted < 2.0
+
+
+class TestCreateStorage:
+    """저장소 선택 테스트"""
+
+    def test_auto_uses_sqlite_without_supabase(self, tmp_path):
+        with patch("config.settings.settings.supabase_url", None), \
+             patch("config.settings.settings.sqlite_path", str(tmp_path / "x.db")):
+            assert isinstance(create_storage(), SQLiteClient)
+
+    def test_auto_fallback_logs_warning(self, tmp_path, caplog):
+        with patch("config.settings.settings.supabase_url", None), \
+             patch("config.settings.settings.sqlite_path", str(tmp_path / "x.db")), \
+             caplog.at_level("WARNING", logger="src.database.storage"):
+            create_storage("auto")
+
+        assert "SQLite" in caplog.text
+
+    def test_auto_fallback_rejected_in_production(self, tmp_path):
+        """운영 환경에서는 Supabase 설정 누락을 조용히 넘기지 않음"""
+        with patch("config.settings.settings.supabase_url", None), \
+             patch("config.settings.settings.environment", "production"), \
+             patch("config.settings.settings.sqlite_path", str(tmp_path / "x.db")):
+            with pytest.raises(ValueError):
+                create_storage("auto")
+            assert isinstance(create_storage("sqlite"), SQLiteClient)
+
+    def test_explicit_supabase(self):
+        with patch("src.database.supabase_client.create_client"):
+            assert isinstance(create_storage("supabase"), SupabaseClient)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_storage("mysql")
+
+
+class TestBulkAICache:
+    """AI 분석 캐시 일괄 조회 테스트"""
+
+    def test_sqlite_bulk_lookup(self, db):
+        db.insert_trending_repos([
+            _repo("a/b", "2026-01-01T00:00:00", ai_summary="old"),
+            _repo("a/b", "2026-01-02T00:00:00", ai_summary="new"),
+            _repo("c/d", "2026-01-02T00:00:00"),
+        ])
+
+        cached = db.get_cached_ai_analyses(["a/b", "c/d", "x/y", "a/b"])
+
+        assert list(cached) == ["a/b"]
+        assert cached["a/b"]["ai_summary"] == "new"
+
+    def test_supabase_uses_single_in_query(self):
+        with patch("src.database.supabase_client.create_client") as mock_create:
+            table = mock_create.return_value.table.return_value
+            query = table.select.return_value.in_.return_value.not_.is_.return_value.order.return_value
+            query.execute.return_value.data = [
+                {"name": "a/b", "ai_summary": "new", "ai_use_cases": [], "ai_difficulty": None, "ai_related_tech": []},
+                {"name": "a/b", "ai_summary": "old", "ai_use_cases": [], "ai_difficulty": None, "ai_related_tech": []},
+            ]
+
+            cached = SupabaseClient().get_cached_ai_analyses([f"r/{i}" for i in range(30)] + ["a/b"])
+
+        assert query.execute.call_count == 1
+        assert table.select.return_value.in_.call_args[0][0] == "name"
+        assert cached == {"a/b": {"ai_summary": "new", "ai_use_cases": [], "ai_difficulty": None, "ai_related_tech": []}}
+
+
+class TestUpsert:
+    """자연 키 upsert 테스트"""
+
+    def test_repos_upsert_by_name_and_date(self, db):
+        first = db.upsert_trending_repos([
+            _repo("a/b", "2026-01-01T09:00:00", ai_summary="분석"),
+            _repo("c/d", "2026-01-01T09:00:00"),
+        ])
+        rerun = db.upsert_trending_repos([
+            _repo("a/b", "2026-01-01T10:00:00", stars=5),
+            _repo("c/d", "2026-01-01T10:00:00"),
+            _repo("c/d", "2026-01-01T10:00:00"),
+        ])
+        next_day = db.upsert_trending_repos([_repo("a/b", "2026-01-02T09:00:00")])
+
+        assert first == {"inserted": 2, "updated": 0, "failed": 0}
+        assert rerun == {"inserted": 0, "updated": 2, "failed": 0}
+        assert next_day == {"inserted": 1, "updated": 0, "failed": 0}
+
+        rows = db.get_trending_repos(limit=10)
+        assert len(rows) == 3
+        same_day = [r for r in rows if r["name"] == "a/b" and r["collected_date"] == "2026-01-01"][0]
+        # 값이 없는 AI 필드는 기존 분석 결과 유지
+        assert same_day["stars"] == 5 and same_day["ai_summary"] == "분석"
+
+    def test_articles_upsert_by_canonical_url(self, db):
+        db.upsert_news_articles([
+            {"title": "t", "url": "https://a.dev/post?utm_source=x", "source": "GeekNews", "score": 1},
+        ])
+        counts = db.upsert_news_articles([
+            {"title": "t", "url": "http://www.a.dev/post/", "source": "GeekNews", "score": 9},
+        ])
+
+        assert counts == {"inserted": 0, "updated": 1, "failed": 0}
+        rows = db.get_news_articles()
+        assert len(rows) == 1 and rows[0]["score"] == 9
+
+    def test_chunked(self, db):
+        repos = [_repo(f"o/r{i}", "2026-01-01T00:00:00") for i in range(25)]
+
+        assert db.upsert_trending_repos(repos, chunk_size=10)["inserted"] == 25
+        assert db.upsert_trending_repos(repos, chunk_size=10)["updated"] == 25
+
+    def test_migrates_old_schema(self, tmp_path):
+        """자연 키 컬럼이 없는 이전 DB 파일도 열림"""
+        import sqlite3
+        from src.database.sqlite_client import SCHEMA
+
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            SCHEMA.replace("collected_date TEXT,", "").replace("canonical_url TEXT,", "")
+        )
+        conn.close()
+
+        client = SQLiteClient(path)
+        columns = {row[1] for row in client._conn.execute("PRAGMA table_info(trending_repos)")}
+        assert "collected_date" in columns
+        assert client.upsert_news_articles([{"title": "t", "url": "https://a", "source": "s"}])["inserted"] == 1
+        client.close()
+
+    def test_backfill_uses_same_canonicalization(self, tmp_path):
+        """기존 행의 canonical_url을 canonicalize_url로 채우고, 정확히 같은 키만 중복 정리"""
+        import sqlite3
+        from src.database.sqlite_client import SCHEMA
+
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA.replace("canonical_url TEXT,", ""))
+        conn.executemany(
+            "INSERT INTO news_articles (title, url, source, collected_at, created_at) "
+            "VALUES (?, ?, ?, '2026-01-01', '2026-01-01')",
+            [
+                ("hn 1", "https://news.ycombinator.com/item?id=1", "HN"),
+                ("hn 2", "https://news.ycombinator.com/item?id=2", "HN"),
+                ("old", "http://www.a.dev/post/?utm_source=x", "GN"),
+                ("new", "https://a.dev/post", "GN"),
+                ("video", "https://youtube.com/watch?v=abc", "GN"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        client = SQLiteClient(path)
+        assert client.backfill_canonical_urls(dry_run=True) == {"updated": 4, "deleted": 1}
+        assert client.backfill_canonical_urls() == {"updated": 4, "deleted": 1}
+
+        rows = client._query("SELECT title, canonical_url FROM news_articles ORDER BY id")
+        assert [(r["title"], r["canonical_url"]) for r in rows] == [
+            ("hn 1", "https://news.ycombinator.com/item?id=1"),
+            ("hn 2", "https://news.ycombinator.com/item?id=2"),
+            ("new", "https://a.dev/post"),
+            ("video", "https://youtube.com/watch?v=abc"),
+        ]
+        assert client.backfill_canonical_urls() == {"updated": 0, "deleted": 0}
+        client.close()
+
+    def test_supabase_upsert_counts(self):
+        with patch("src.database.supabase_client.create_client") as mock_create:
+            table = mock_create.return_value.table.return_value
+            table.select.return_value.in_.return_value.eq.return_value.execute.return_value.data = [
+                {"name": "a/b", "collected_date": "2026-01-01"},
+            ]
+
+            counts = SupabaseClient().upsert_trending_repos([
+                _repo("a/b", "2026-01-01T09:00:00"),
+                _repo("c/d", "2026-01-01T09:00:00"),
+            ])
+
+        assert counts == {"inserted": 1, "updated": 1, "failed": 0}
+        args, kwargs = table.upsert.call_args
+        assert kwargs["on_conflict"] == "name,collected_date"
+        assert {row["name"] for row in args[0]} == {"a/b", "c/d"}
@@ -0,0 +1,178 @@
+"""
+기술 분석기 캐시 테스트
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.analyzers.tech_analyzer import TechAnalyzer
+from src.scrapers.models import NewsArticle, TrendingRepository
+
+
+@pytest.fixture
+def analyzer():
+    with patch("src.analyzers.tech_analyzer.LLMClient"):
+        analyzer = TechAnalyzer()
+    analyzer._db = MagicMock()
+    return analyzer
+
+
+class TestAnalysisCache:
+    """분석 결과 캐시 테스트"""
+
+    def test_prefetch_collapses_lookups(self, analyzer):
+        """일괄 조회 후에는 저장소별 DB 조회 없음 (캐시 없는 저장소 포함)"""
+        analyzer.db.get_cached_ai_analyses.return_value = {"a/b": {"ai_summary": "cached"}}
+
+        assert analyzer.prefetch_cached_analyses(["a/b", "c/d"]) == 1
+        assert analyzer._get_cached_analysis("a/b") == {"ai_summary": "cached"}
+        assert analyzer._get_cached_analysis("c/d") is None
+        analyzer.db.get_cached_ai_analysis.assert_not_called()
+
+        # 이미 캐시에 있는 저장소는 다시 조회하지 않음
+        assert analyzer.prefetch_cached_analyses(["a/b"]) == 0
+        assert analyzer.db.get_cached_ai_analyses.call_count == 1
+
+    def test_single_lookup_is_cached(self, analyzer):
+        analyzer.db.get_cached_ai_analysis.return_value = {"ai_summary": "x"}
+
+        analyzer._get_cached_analysis("a/b")
+        analyzer._get_cached_analysis("a/b")
+
+        assert analyzer.db.get_cached_ai_analysis.call_count == 1
+
+    def test_fresh_analysis_reused_in_process(self, analyzer):
+        """새로 분석한 결과는 같은 프로세스에서 LLM 재호출 없이 재사용"""
+        analyzer.db.get_cached_ai_analysis.return_value = None
+        analyzer.llm.generate.return_value = '{"what_is_it": "도구", "use_cases": ["a"]}'
+        repo = TrendingRepository(name="a/b", url="https://github.com/a/b")
+
+        first = analyzer.analyze_repository(repo)
+        second = analyzer.analyze_repository(repo)
+
+        assert first == second and first["ai_summary"] == "도구"
+        assert analyzer.llm.generate.call_count == 1
+
+    def test_ttl_expiry(self):
+        with patch("src.analyzers.tech_analyzer.LLMClient"):
+            analyzer = TechAnalyzer(cache_ttl=0.0)
+        analyzer._db = MagicMock()
+        analyzer.db.get_cached_ai_analysis.return_value = {"ai_summary": "x"}
+
+        analyzer._get_cached_analysis("a/b")
+        analyzer._get_cached_analysis("a/b")
+
+        assert analyzer.db.get_cached_ai_analysis.call_count == 2
+
+
+class TestConcurrentAnalysis:
+    """비동기 분석/요약 테스트"""
+
+    def test_repositories_run_concurrently(self, analyzer):
+        """저장소 분석이 동시에 실행되고 결과 순서는 입력 순서와 같음"""
+        active = {"now": 0, "peak": 0}
+
+        async def agenerate(prompt, system_prompt=None, **kwargs):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            name = "a/0" if "a/0" in prompt else "a/1"
+            return f'{{"what_is_it": "{name}"}}'
+
+        analyzer.db.get_cached_ai_analyses.return_value = {}
+        analyzer.llm.agenerate = AsyncMock(side_effect=agenerate)
+        repos = [
+            TrendingRepository(name=f"a/{i}", url=f"https://github.com/a/{i}") for i in range(2)
+        ]
+
+        results = asyncio.run(analyzer.analyze_repositories(repos))
+
+        assert [r["ai_summary"] for r in results] == ["a/0", "a/1"]
+        assert active["peak"] == 2
+        analyzer.db.get_cached_ai_analyses.assert_called_once()
+
+    def test_failed_item_does_not_cancel_others(self, analyzer):
+        """한 기사 요약이 실패해도 나머지 기사는 요약됨"""
+
+        async def agenerate(prompt, system_prompt=None, **kwargs):
+            if "실패" in prompt:
+                raise RuntimeError("rate limited")
+            return " 요약 "
+
+        analyzer.llm.agenerate = AsyncMock(side_effect=agenerate)
+        articles = [
+            NewsArticle(title=title, url=f"https://example.com/{i}", source="Hacker News")
+            for i, title in enumerate(["성공", "실패"])
+        ]
+
+        asyncio.run(analyzer.summarize_articles_async(articles))
+
+        assert articles[0].summary == "요약"
+        assert not articles[1].summary
+
+
+class TestBatchSummarization:
+    """기사 일괄 요약 테스트"""
+
+    @staticmethod
+    def _articles(count):
+        return [
+            NewsArticle(title=f"기사 {i}", url=f"https://example.com/{i}", source="GeekNews")
+            for i in range(count)
+        ]
+
+    def test_single_request_per_batch(self, analyzer):
+        analyzer.llm.agenerate = AsyncMock(
+            return_value='```json\n{"summaries": [{"id": 2, "summary": "둘"}, {"id": 1, "summary": "하나"}]}\n```'
+        )
+        articles = self._articles(2)
+
+        asyncio.run(analyzer.summarize_articles_async(articles, batch_size=10))
+
+        assert [a.summary for a in articles] == ["하나", "둘"]
+        assert analyzer.llm.agenerate.await_count == 1
+        batch = analyzer.llm.token_monitor.record_batch.call_args.kwargs
+        assert batch["items"] == 2 and batch["fallback_items"] == 0
+
+    def test_missing_items_fall_back_to_single_calls(self, analyzer):
+        """응답에서 빠진 항목만 개별 요청"""
+        batch_response = '결과입니다: {"summaries": [{"id": 1, "summary": "하나"}, {"id": "x"}]}'
+        analyzer.llm.agenerate = AsyncMock(side_effect=[batch_response, "개별"])
+        articles = self._articles(2)
+
+        asyncio.run(analyzer.summarize_articles_async(articles, batch_size=10))
+
+        assert [a.summary for a in articles] == ["하나", "개별"]
+        assert analyzer.llm.agenerate.await_count == 2
+        assert analyzer.llm.token_monitor.record_batch.call_args.kwargs["fallback_items"] == 1
+
+    @pytest.mark.parametrize(
+        "response",
+        ['["하나", "둘"]', '{"1": "하나", "2": "둘"}', '[{"id": 1, "summary": "하나"}, {"summary": "둘"}]'],
+    )
+    def test_parse_accepts_alternate_shapes(self, analyzer, response):
+        assert analyzer._parse_article_batch(response, 2) == {1: "하나", 2: "둘"}
+
+    def test_parse_ignores_out_of_range(self, analyzer):
+        assert analyzer._parse_article_batch('{"summaries": [{"id": 5, "summary": "x"}]}', 2) == {}
+        assert analyzer._parse_article_batch("요약할 수 없습니다", 2) == {}
+
+
+class TestPromptLayout:
+    """프롬프트 캐시용 프롬프트 구성 테스트"""
+
+    def test_static_instructions_live_in_system_prompt(self, analyzer):
+        """응답 형식/지시는 시스템 프롬프트에만 있고 사용자 프롬프트는 데이터만 포함"""
+        from src.analyzers.tech_analyzer import ARTICLE_BATCH_SYSTEM_PROMPT, REPO_SYSTEM_PROMPT
+
+        repo = TrendingRepository(name="a/b", url="https://github.com/a/b", description="도구")
+        articles = [NewsArticle(title="Show HN: x", url="https://a", source="Hacker News")]
+
+        repo_prompt = analyzer._create_analysis_prompt(repo)
+        batch_prompt = analyzer._create_article_batch_prompt(articles)
+
+        assert "what_is_it" in REPO_SYSTEM_PROMPT and "what_is_it" not in repo_prompt
+        assert "summaries" in ARTICLE_BATCH_SYSTEM_PROMPT and "summaries" not in batch_prompt
+        assert "JSON" not in repo_prompt and "a/b" in repo_prompt